@@ -0,0 +1,81 @@
+"""
+Insert and query benchmark for the persistent violation history.
+
+Usage:
+    python -m benchmarks.bench_history_db [--rows 1000000] [--path /tmp/history.db]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+from pysentinel.utils.history_db import HistoryDB
+
+SEVERITIES = (Severity.INFO, Severity.WARNING, Severity.CRITICAL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--alerts", type=int, default=500)
+    parser.add_argument("--path", default=None)
+    args = parser.parse_args()
+
+    path = args.path or os.path.join(tempfile.mkdtemp(), "history.db")
+    db = HistoryDB(db_path=path, batch_size=5000, max_queue_size=args.rows + 1)
+    origin = datetime(2024, 1, 1)
+
+    start = time.perf_counter()
+    for i in range(args.rows):
+        db.record(
+            Violation(
+                alert_name=f"alert_{i % args.alerts}",
+                metric_name="value",
+                current_value=float(i),
+                threshold_value=1.0,
+                operator="<=",
+                severity=SEVERITIES[i % 3],
+                message="synthetic violation",
+                timestamp=origin + timedelta(seconds=i),
+                datasource_name="synthetic",
+            )
+        )
+    enqueue = time.perf_counter() - start
+    db.flush()
+    total = time.perf_counter() - start
+    print(f"rows:            {args.rows}")
+    print(f"enqueue:         {enqueue:.2f}s ({args.rows / enqueue:,.0f} rows/s)")
+    print(f"enqueue+commit:  {total:.2f}s ({args.rows / total:,.0f} rows/s)")
+    print(f"database size:   {os.path.getsize(path) / 1e6:.1f} MB")
+
+    window_start = origin + timedelta(seconds=args.rows // 2)
+    window_end = window_start + timedelta(days=1)
+    for label, kwargs in (
+        ("latest page", {}),
+        ("1-day range", {"start": window_start, "end": window_end}),
+        ("single alert", {"alert_name": "alert_7"}),
+        ("critical only", {"severity": "critical"}),
+    ):
+        start = time.perf_counter()
+        items, cursor = db.query(limit=100, **kwargs)
+        first = time.perf_counter() - start
+        pages = 1
+        start = time.perf_counter()
+        while cursor and pages < 50:
+            items, cursor = db.query(limit=100, cursor=cursor, **kwargs)
+            pages += 1
+        deep = (time.perf_counter() - start) / max(pages - 1, 1)
+        print(
+            f"{label:<15}  first page {first * 1000:7.2f} ms, "
+            f"next pages {deep * 1000:7.2f} ms/page"
+        )
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+End-to-end load harness: the real Scanner against local stub servers.
+
+Starts stub Prometheus, JSON health API, Slack and webhook endpoints (see
+benchmarks.stub_servers) in a child process, generates a config with N
+alerts split between the Prometheus and HTTP datasources, each routed to
+Slack and the webhook, and runs the scanner for a fixed time. Reports
+queries/s, violations/s, notification latency percentiles (violation
+created -> webhook received) and the scanner process's CPU and RSS.
+
+Usage:
+    python -m benchmarks.bench_load [--alerts 1000] [--duration 30]
+        [--violation-rate 0.05] [--server-latency-ms 0] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.stub_servers import StubServerProcess
+from pysentinel.core.scanner import Scanner
+
+
+def make_config(
+    url: str, alerts: int, violation_rate: float, workers: int, queue_size: int
+) -> Dict:
+    threshold = {"max": 100 * (1 - violation_rate)}
+    definitions = []
+    for i in range(alerts):
+        prometheus = i % 2 == 0
+        definitions.append(
+            {
+                "name": f"alert_{i}",
+                "metrics": f"metric_{i}" if prometheus else "value",
+                "query": f"metric_{i}" if prometheus else f"/health/{i}",
+                "datasource": "prometheus" if prometheus else "health_api",
+                "threshold": threshold,
+                "severity": "warning",
+                "interval": 60,
+                "alert_channels": ["slack", "webhook"],
+                "description": "load test",
+            }
+        )
+    return {
+        "global": {
+            # Every violation notifies, so delivery is exercised at full rate
+            "alert_cooldown_minutes": 0,
+            "notifications": {"workers": workers, "queue_size": queue_size},
+        },
+        "datasources": {
+            "prometheus": {
+                "type": "prometheus",
+                "url": url,
+                "enabled": True,
+                "max_retries": 10**9,
+            },
+            "health_api": {
+                "type": "http",
+                "base_url": url,
+                "enabled": True,
+                "max_retries": 10**9,
+            },
+        },
+        "alert_channels": {
+            "slack": {
+                "type": "slack",
+                "webhook_url": f"{url}/slack",
+                "channel": "#load",
+                "username": "pysentinel",
+                "icon_emoji": ":rotating_light:",
+            },
+            "webhook": {"type": "webhook", "url": f"{url}/webhook"},
+        },
+        "alert_groups": {"load": {"alerts": definitions}},
+    }
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def current_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def cpu_seconds() -> float:
+    times = os.times()
+    return times.user + times.system
+
+
+async def run_scanner(config: Dict, duration: float) -> Scanner:
+    scanner = Scanner(config)
+    await scanner.start_async()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        await scanner.stop_async()
+    return scanner
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--alerts", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--violation-rate", type=float, default=0.05)
+    parser.add_argument("--server-latency-ms", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    logging.getLogger("pysentinel").setLevel(logging.CRITICAL)
+    # The scanner's last-run database is created in the working directory
+    os.chdir(tempfile.mkdtemp())
+
+    servers = StubServerProcess(latency_ms=args.server_latency_ms)
+    config = make_config(
+        servers.url,
+        args.alerts,
+        args.violation_rate,
+        args.workers,
+        args.queue_size,
+    )
+
+    cpu_start = cpu_seconds()
+    wall_start = time.perf_counter()
+    scanner = asyncio.run(run_scanner(config, args.duration))
+    wall = time.perf_counter() - wall_start
+    cpu = cpu_seconds() - cpu_start
+    rss = current_rss_mb()
+    stats = servers.stop()
+
+    violations = scanner.metrics.get("pysentinel_violations").labels("warning").value
+    dispatcher = scanner.get_notification_stats()
+    queries = stats["queries"] + stats["health_requests"]
+    latencies = [latency * 1000 for latency in stats["latencies"]]
+
+    print(f"alerts:              {args.alerts}")
+    print(f"duration:            {wall:.1f}s")
+    print(f"queries/s:           {queries / wall:,.0f}")
+    print(f"violations/s:        {violations / wall:,.0f}")
+    print(
+        f"notifications:       {stats['slack_messages']} slack, "
+        f"{stats['webhook_messages']} webhook, "
+        f"{dispatcher.get('dropped', 0)} dropped"
+    )
+    print(
+        "notify latency ms:   "
+        f"p50 {percentile(latencies, 0.5):.1f}  "
+        f"p90 {percentile(latencies, 0.9):.1f}  "
+        f"p99 {percentile(latencies, 0.99):.1f}  "
+        f"max {max(latencies, default=float('nan')):.1f}"
+    )
+    print(f"scanner cpu:         {cpu:.1f}s ({cpu / wall:.0%} of one core)")
+    if rss is not None:
+        print(f"scanner rss:         {rss:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
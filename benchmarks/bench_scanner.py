@@ -0,0 +1,194 @@
+"""
+Scan-tick benchmark suite built on the synthetic datasource and channel.
+
+Measures tick latency, alert throughput and peak traced memory while
+scaling the alert count (100 to 100k), the datasource count (1 to 100)
+and the violation rate. Results can be saved as a baseline and later runs
+compared against it; a metric that is worse than the baseline by more
+than --tolerance is reported as a regression and the exit status is 1.
+benchmarks/baselines/scanner.json is the tracked --quick baseline;
+regenerate it with --save when a change is meant to move the numbers.
+
+Usage:
+    python -m benchmarks.bench_scanner [--quick] [--ticks 3]
+        [--save benchmarks/baselines/scanner.json]
+        [--compare benchmarks/baselines/scanner.json] [--tolerance 0.2]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, NamedTuple
+
+from pysentinel.cli.bench import bench_scanner
+from pysentinel.core.scanner import Scanner
+
+
+class Scenario(NamedTuple):
+    alerts: int
+    datasources: int
+    violation_rate: float
+
+    @property
+    def key(self) -> str:
+        return (
+            f"alerts={self.alerts},datasources={self.datasources},"
+            f"violation_rate={self.violation_rate}"
+        )
+
+
+# Metric name -> True when a larger value is better
+METRICS = {"tick_ms": False, "alerts_per_s": True, "peak_mb": False}
+
+
+def scenarios(quick: bool) -> List[Scenario]:
+    sizes = (100, 1000, 10_000) if quick else (100, 1000, 10_000, 100_000)
+    base = 1000 if quick else 10_000
+    grid = [Scenario(size, 10, 0.01) for size in sizes]
+    grid += [Scenario(base, count, 0.01) for count in (1, 100)]
+    grid += [Scenario(base, 10, rate) for rate in (0.0, 0.1, 0.5)]
+    return grid
+
+
+def make_config(scenario: Scenario, latency_ms: float, error_rate: float) -> Dict:
+    datasources = {
+        f"ds_{d}": {
+            "type": "synthetic",
+            "enabled": True,
+            "latency_ms": latency_ms,
+            "error_rate": error_rate,
+            "max_retries": 10**9,
+            "seed": d,
+        }
+        for d in range(scenario.datasources)
+    }
+    alerts = [
+        {
+            "name": f"alert_{i}",
+            "metrics": "value",
+            "query": f"query_{i}",
+            "datasource": f"ds_{i % scenario.datasources}",
+            "threshold": {"max": 100 * (1 - scenario.violation_rate)},
+            "severity": "warning",
+            "interval": 60,
+            "alert_channels": ["sink"],
+            "description": "synthetic",
+        }
+        for i in range(scenario.alerts)
+    ]
+    return {
+        "global": {"notifications": {"queue_size": 1_000_000}},
+        "datasources": datasources,
+        "alert_channels": {"sink": {"type": "synthetic"}},
+        "alert_groups": {"bench": {"alerts": alerts}},
+    }
+
+
+async def run_ticks(scanner: Scanner, ticks: int) -> List[float]:
+    await scanner._dispatcher.start()
+    durations = []
+    try:
+        for _ in range(ticks):
+            start = time.perf_counter()
+            await scanner.scan_once_async()
+            durations.append(time.perf_counter() - start)
+        await scanner._dispatcher._queue.join()
+    finally:
+        await scanner._dispatcher.stop()
+    return durations
+
+
+def run_scenario(scenario: Scenario, args) -> Dict[str, float]:
+    config = make_config(scenario, args.latency_ms, args.error_rate)
+
+    scanner = bench_scanner(config)
+    durations = asyncio.run(run_ticks(scanner, args.ticks))
+    scanner._executor.shutdown()
+
+    tracemalloc.start()
+    scanner = bench_scanner(config)
+    asyncio.run(run_ticks(scanner, 1))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    scanner._executor.shutdown()
+
+    median = statistics.median(durations)
+    return {
+        "tick_ms": median * 1000,
+        "alerts_per_s": scenario.alerts / median,
+        "peak_mb": peak / 1e6,
+    }
+
+
+def find_regressions(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float
+) -> List[str]:
+    regressions = []
+    for key, metrics in results.items():
+        reference = baseline.get(key)
+        if not reference:
+            continue
+        for name, higher_is_better in METRICS.items():
+            old, new = reference.get(name), metrics[name]
+            if not old:
+                continue
+            change = (old - new) / old if higher_is_better else (new - old) / old
+            if change > tolerance:
+                regressions.append(
+                    f"{key}: {name} {old:.2f} -> {new:.2f} ({change:+.0%})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="cap at 10k alerts")
+    parser.add_argument("--ticks", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--save", help="write results to this baseline file")
+    parser.add_argument("--compare", help="baseline file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.getLogger("pysentinel").setLevel(logging.CRITICAL)
+    save = os.path.abspath(args.save) if args.save else None
+    compare = os.path.abspath(args.compare) if args.compare else None
+    # The scanner's last-run database is created in the working directory
+    os.chdir(tempfile.mkdtemp())
+
+    results = {}
+    print(f"{'scenario':<52} {'tick ms':>10} {'alerts/s':>12} {'peak MB':>9}")
+    for scenario in scenarios(args.quick):
+        metrics = results[scenario.key] = run_scenario(scenario, args)
+        print(
+            f"{scenario.key:<52} {metrics['tick_ms']:>10.1f} "
+            f"{metrics['alerts_per_s']:>12,.0f} {metrics['peak_mb']:>9.1f}"
+        )
+
+    if save:
+        os.makedirs(os.path.dirname(save), exist_ok=True)
+        with open(save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.save}")
+
+    if compare:
+        with open(compare) as f:
+            regressions = find_regressions(results, json.load(f), args.tolerance)
+        if regressions:
+            print("Regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Startup-time benchmark for large alert rule sets.
+
+Generates a YAML config per size and times each load path (pure-Python
+YAML, libyaml, cold load with snapshot write, warm snapshot load) plus
+scanner construction from the loaded config.
+
+Usage:
+    python -m benchmarks.bench_startup [--sizes 1000,10000,100000] [--skip-pure]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import yaml
+
+from pysentinel.config.loader import load_config
+from pysentinel.core.scanner import Scanner
+
+SEVERITIES = ("info", "warning", "critical")
+
+
+def make_config(alerts: int, groups: int = 50) -> dict:
+    alert_groups = {
+        f"group_{g}": {"enabled": True, "alerts": []} for g in range(groups)
+    }
+    for i in range(alerts):
+        alert_groups[f"group_{i % groups}"]["alerts"].append(
+            {
+                "name": f"alert_{i}",
+                "metrics": "value",
+                "query": f"SELECT value FROM metrics WHERE id = {i}",
+                "datasource": "primary",
+                "threshold": {"max": 90},
+                "severity": SEVERITIES[i % 3],
+                "interval": 60,
+                "alert_channels": ["ops"],
+                "description": f"Synthetic alert {i}",
+            }
+        )
+    return {
+        "global": {"history_db": {"enabled": False}},
+        "datasources": {"primary": {"type": "postgresql", "enabled": False}},
+        "alert_channels": {},
+        "alert_groups": alert_groups,
+    }
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument(
+        "--skip-pure", action="store_true", help="skip the pure-Python YAML loader"
+    )
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    cache_dir = os.path.join(workdir, "cache")
+    print(
+        f"{'alerts':>8}  {'pure yaml':>10}  {'libyaml':>10}  {'cold':>10}  "
+        f"{'snapshot':>10}  {'scanner':>10}"
+    )
+    for size in (int(s) for s in args.sizes.split(",")):
+        path = os.path.join(workdir, f"config_{size}.yml")
+        with open(path, "w") as f:
+            yaml.dump(
+                make_config(size),
+                f,
+                Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            )
+
+        pure = float("nan")
+        if not args.skip_pure:
+            with open(path) as f:
+                pure, _ = timed(lambda: yaml.load(f, Loader=yaml.SafeLoader))
+        with open(path) as f:
+            fast, _ = timed(
+                lambda: yaml.load(
+                    f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                )
+            )
+        cold, _ = timed(lambda: load_config(path, cache_dir=cache_dir))
+        warm, config = timed(lambda: load_config(path, cache_dir=cache_dir))
+        build, scanner = timed(lambda: Scanner(config))
+        assert len(scanner.alert_definitions) == size
+
+        print(
+            f"{size:>8}  {pure:>9.3f}s  {fast:>9.3f}s  {cold:>9.3f}s  "
+            f"{warm:>9.3f}s  {build:>9.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Render throughput benchmark for precompiled notification templates.
+
+Measures renders per second on the storm path (one message per violation)
+and the digest path (one line per violation in a batch) for the default
+Slack and Telegram templates, against the previous f-string builders
+(reproduced below).
+
+Usage:
+    python -m benchmarks.bench_templates [--count 50000] [--batch 50]
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from pysentinel.channels.slack import Slack
+from pysentinel.channels.telegram import Telegram
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+
+SLACK_CONFIG = {"channel": "#a", "username": "b", "icon_emoji": ":x:"}
+TELEGRAM_CONFIG = {"chat_id": "1", "webhook_url": "http://localhost"}
+
+
+def legacy_slack_message(v: Violation) -> Dict:
+    return {
+        "text": f"🚨 *{v.severity.value.upper()}* Alert: {v.alert_name}",
+        "attachments": [
+            {
+                "color": "danger" if v.severity == Severity.CRITICAL else "warning",
+                "fields": [
+                    {"title": "Message", "value": v.message, "short": False},
+                    {
+                        "title": "Current Value",
+                        "value": str(v.current_value),
+                        "short": True,
+                    },
+                    {
+                        "title": "Threshold",
+                        "value": f"{v.operator} {v.threshold_value}",
+                        "short": True,
+                    },
+                    {"title": "Datasource", "value": v.datasource_name, "short": True},
+                    {
+                        "title": "Time",
+                        "value": v.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC"),
+                        "short": True,
+                    },
+                ],
+            }
+        ],
+    }
+
+
+def legacy_telegram_message(v: Violation) -> str:
+    return (
+        f"🚨 *{v.severity.value.upper()}* Alert: {v.alert_name}\n"
+        f"Message: {v.message}\n"
+        f"Current Value: {v.current_value}\n"
+        f"Threshold: {v.operator} {v.threshold_value}\n"
+        f"Datasource: {v.datasource_name}\n"
+        f"Time: {v.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+    )
+
+
+def legacy_slack_item(v: Violation) -> str:
+    return (
+        f"• *{v.alert_name}*: {v.message} "
+        f"(value {v.current_value}, threshold {v.operator} "
+        f"{v.threshold_value}, {v.datasource_name}, "
+        f"{v.timestamp.strftime('%H:%M:%S')})"
+    )
+
+
+def legacy_telegram_item(v: Violation) -> str:
+    return (
+        f"• {v.alert_name}: {v.current_value} "
+        f"(threshold {v.operator} {v.threshold_value}, {v.datasource_name})"
+    )
+
+
+def make_violations(count: int) -> List[Violation]:
+    now = datetime.now()
+    return [
+        Violation(
+            alert_name=f"alert_{i % 200}",
+            metric_name="cpu",
+            current_value=90.0 + i % 10,
+            threshold_value=85.0,
+            operator="<=",
+            severity=Severity.CRITICAL if i % 3 == 0 else Severity.WARNING,
+            message="CPU usage is too high",
+            timestamp=now,
+            datasource_name=f"db_{i % 20}",
+            alert_group="system",
+        )
+        for i in range(count)
+    ]
+
+
+def storm_rate(render: Callable, violations: List[Violation]) -> float:
+    start = time.perf_counter()
+    for violation in violations:
+        render(violation)
+    return len(violations) / (time.perf_counter() - start)
+
+
+def digest_rate(render: Callable, violations: List[Violation], batch: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(violations), batch):
+        "\n".join(render(v) for v in violations[i : i + batch])
+    return len(violations) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+
+    violations = make_violations(args.count)
+    slack = Slack("slack", SLACK_CONFIG)
+    telegram = Telegram("telegram", TELEGRAM_CONFIG)
+
+    cases = [
+        (
+            "slack",
+            "storm",
+            legacy_slack_message,
+            slack.templates["message"].render,
+            storm_rate,
+        ),
+        (
+            "telegram",
+            "storm",
+            legacy_telegram_message,
+            telegram.templates["message"].render,
+            storm_rate,
+        ),
+        (
+            "slack",
+            "digest",
+            legacy_slack_item,
+            slack.templates["digest_item"].render,
+            digest_rate,
+        ),
+        (
+            "telegram",
+            "digest",
+            legacy_telegram_item,
+            telegram.templates["digest_item"].render,
+            digest_rate,
+        ),
+    ]
+
+    print(f"{'channel':<10}{'path':<8}{'f-string/s':>14}{'template/s':>14}")
+    for channel, path, legacy, compiled, measure in cases:
+        extra = (args.batch,) if path == "digest" else ()
+        legacy_rate = measure(legacy, violations, *extra)
+        compiled_rate = measure(compiled, violations, *extra)
+        print(f"{channel:<10}{path:<8}{legacy_rate:>14,.0f}{compiled_rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Memory and serialization benchmark for Violation records.
+
+Compares the slotted ``Violation`` against the previous dataclass
+representation (reproduced below as ``LegacyViolation``).
+
+Usage:
+    python -m benchmarks.bench_violation_memory [--count 10000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Dict
+
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+
+
+@dataclass
+class LegacyViolation:
+    """The pre-slots dataclass Violation, kept for comparison"""
+
+    alert_name: str
+    metric_name: str
+    current_value: Any
+    threshold_value: Any
+    operator: str
+    severity: Severity
+    message: str
+    timestamp: datetime
+    datasource_name: str
+    alert_group: str = None
+    violation_id: str = None
+    acknowledged: bool = False
+
+    def __post_init__(self):
+        if not self.violation_id:
+            self.violation_id = f"{self.datasource_name}_{self.alert_name}_{int(self.timestamp.timestamp())}"
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["severity"] = self.severity.value
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+
+def _build(cls, count: int):
+    now = datetime.now()
+    records = []
+    for i in range(count):
+        # Names arrive as fresh strings from config/query results, as in production
+        records.append(
+            cls(
+                alert_name="".join(("high_cpu_usage_", str(i % 50))),
+                metric_name="".join(("cpu_", "utilization")),
+                current_value=90.0 + i % 10,
+                threshold_value=85.0,
+                operator="<=",
+                severity=Severity.WARNING,
+                message="".join(("Database CPU usage", " is too high")),
+                timestamp=now,
+                datasource_name="".join(("primary_", "db")),
+                alert_group="".join(("database_", "performance")),
+            )
+        )
+    return records
+
+
+def measure(cls, count: int) -> Dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    records = _build(cls, count)
+    # Touch the id so lazily built fields are included in the footprint
+    for record in records:
+        record.violation_id
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for record in records:
+        record.to_dict()
+    first_pass = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for record in records:
+        record.to_dict()
+    second_pass = time.perf_counter() - start
+
+    return {
+        "bytes_per_violation": (after - before) / count,
+        "serialize_first_ms": first_pass * 1000,
+        "serialize_repeat_ms": second_pass * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'representation':<16}{'bytes/violation':>18}{'to_dict #1 (ms)':>18}"
+        f"{'to_dict #2 (ms)':>18}"
+    )
+    for label, cls in (("dataclass", LegacyViolation), ("slots", Violation)):
+        result = measure(cls, args.count)
+        print(
+            f"{label:<16}{result['bytes_per_violation']:>18.1f}"
+            f"{result['serialize_first_ms']:>18.2f}"
+            f"{result['serialize_repeat_ms']:>18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Local aiohttp stand-ins for the services a scanner talks to, used by the
+load harness (benchmarks.bench_load).
+
+One app serves all endpoints:
+    GET  /api/v1/query   Prometheus instant query, one random sample
+    GET  /health/{id}    JSON health API returning {"value": ..., "status": ...}
+    POST /slack          Slack incoming-webhook receiver
+    POST /webhook        Generic webhook receiver; records delivery latency
+                         from the violation timestamp in the payload
+
+Metric values are uniform in [0, 100), so a threshold of ``max: 100 * (1 - r)``
+fires with probability ``r``. The servers run in a child process so their
+CPU time is not charged to the scanner being measured.
+"""
+
+import asyncio
+import multiprocessing
+import random
+import time
+from datetime import datetime
+from typing import Dict, List
+
+
+class StubStats:
+    def __init__(self):
+        self.queries = 0
+        self.health_requests = 0
+        self.slack_messages = 0
+        self.webhook_messages = 0
+        self.latencies: List[float] = []
+
+    def to_dict(self) -> Dict:
+        return {
+            "queries": self.queries,
+            "health_requests": self.health_requests,
+            "slack_messages": self.slack_messages,
+            "webhook_messages": self.webhook_messages,
+            "latencies": self.latencies,
+        }
+
+
+def create_app(stats: StubStats, latency_ms: float = 0.0, seed: int = 0):
+    from aiohttp import web
+
+    rng = random.Random(seed)
+    delay = latency_ms / 1000
+
+    async def prometheus_query(request):
+        stats.queries += 1
+        if delay:
+            await asyncio.sleep(delay)
+        sample = [time.time(), str(rng.uniform(0, 100))]
+        return web.json_response(
+            {
+                "status": "success",
+                "data": {
+                    "resultType": "vector",
+                    "result": [
+                        {
+                            "metric": {"__name__": request.query["query"]},
+                            "value": sample,
+                        }
+                    ],
+                },
+            }
+        )
+
+    async def health(request):
+        stats.health_requests += 1
+        if delay:
+            await asyncio.sleep(delay)
+        return web.json_response(
+            {
+                "value": rng.uniform(0, 100),
+                "status": "ok",
+                "id": request.match_info["id"],
+            }
+        )
+
+    async def slack(request):
+        await request.read()
+        stats.slack_messages += 1
+        return web.Response(text="ok")
+
+    async def webhook(request):
+        payload = await request.json()
+        received = datetime.now()
+        items = payload if isinstance(payload, list) else [payload]
+        for item in items:
+            stats.webhook_messages += 1
+            sent = datetime.fromisoformat(item["timestamp"])
+            stats.latencies.append((received - sent).total_seconds())
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/api/v1/query", prometheus_query)
+    app.router.add_get("/health/{id}", health)
+    app.router.add_post("/slack", slack)
+    app.router.add_post("/webhook", webhook)
+    return app
+
+
+async def _serve(conn, latency_ms: float, seed: int):
+    from aiohttp import web
+
+    stats = StubStats()
+    runner = web.AppRunner(create_app(stats, latency_ms, seed), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0, backlog=1024)
+    await site.start()
+    conn.send(runner.addresses[0][1])
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, conn.recv)
+    await runner.cleanup()
+    conn.send(stats.to_dict())
+
+
+def _run(conn, latency_ms: float, seed: int):
+    asyncio.run(_serve(conn, latency_ms, seed))
+
+
+class StubServerProcess:
+    """Runs the stub app in a child process; ``stop`` returns its stats"""
+
+    def __init__(self, latency_ms: float = 0.0, seed: int = 0):
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_run, args=(child_conn, latency_ms, seed), daemon=True
+        )
+        self._process.start()
+        self.port = self._conn.recv()
+        self.url = f"http://127.0.0.1:{self.port}"
+
+    def stop(self) -> Dict:
+        self._conn.send("stop")
+        stats = self._conn.recv()
+        self._process.join(timeout=5)
+        return stats
@@ -0,0 +1,382 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pysentinel.core.events import Backpressure, EventBus
+from pysentinel.utils.constants import Severity
+from pysentinel.utils.exception import ScannerException
+from pysentinel.utils.metrics import CONTENT_TYPE as OPENMETRICS_CONTENT_TYPE
+
+logger = logging.getLogger(__name__)
+
+TOPICS = ("alerts", "metrics")
+
+# Idle SSE connections get a comment line this often to keep proxies open
+HEARTBEAT_SECONDS = 15.0
+
+
+def _dumps(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), default=str).encode()
+
+
+class Frame:
+    """
+    One event serialized once, shared by every SSE and WebSocket client.
+    """
+
+    __slots__ = ("topic", "data", "sse")
+
+    def __init__(self, topic: str, payload: Any):
+        self.topic = topic
+        self.data = _dumps({"topic": topic, "data": payload})
+        self.sse = b"event: " + topic.encode() + b"\ndata: " + self.data + b"\n\n"
+
+
+class APIServer:
+    """
+    Optional embedded aiohttp server exposing scanner state.
+
+    REST (JSON, paginated, with ETags so unchanged polls get a 304):
+        GET  /api/status
+        GET  /api/alerts?limit=&offset=
+        GET  /api/alerts/history?limit=&cursor=&alert_name=&severity=&start=&end=
+        POST /api/alerts/{violation_id}/ack
+        GET  /api/metrics, /api/metrics/{datasource}
+        GET  /metrics (OpenMetrics self-instrumentation)
+    Live updates for dashboards:
+        GET  /api/events?topics=alerts,metrics   Server-Sent Events
+        GET  /api/ws?topics=alerts,metrics       WebSocket
+
+    Live events are read from the scanner's event bus by one task per
+    topic, serialized once into a ``Frame`` and fanned out to a bounded
+    queue per client; a slow client loses its oldest frames rather than
+    holding up the others. With ``token`` set every request must send
+    ``Authorization: Bearer <token>`` (or ``?token=`` for EventSource).
+    """
+
+    def __init__(
+        self,
+        scanner,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        token: Optional[str] = None,
+        max_page_size: int = 1000,
+        client_queue_size: int = 1000,
+    ):
+        self.scanner = scanner
+        self.host = host
+        self.port = port
+        self.token = token
+        self.max_page_size = max_page_size
+        self.client_queue_size = client_queue_size
+        self.frames = EventBus(client_queue_size, Backpressure.DROP_OLDEST)
+        self._runner = None
+        self._pumps: List[asyncio.Task] = []
+        self._websockets = set()
+
+    @classmethod
+    def from_config(cls, scanner, config: Dict) -> "APIServer":
+        return cls(
+            scanner,
+            host=config.get("host", "127.0.0.1"),
+            port=config.get("port", 8080),
+            token=config.get("token"),
+            max_page_size=config.get("max_page_size", 1000),
+            client_queue_size=config.get("client_queue_size", 1000),
+        )
+
+    def create_app(self):
+        from aiohttp import web
+
+        app = web.Application(middlewares=[self._auth_middleware()])
+        app.router.add_get("/api/status", self.status)
+        app.router.add_get("/api/alerts", self.active_alerts)
+        app.router.add_get("/api/alerts/history", self.alert_history)
+        app.router.add_post("/api/alerts/{violation_id}/ack", self.acknowledge)
+        app.router.add_get("/api/metrics", self.latest_metrics)
+        app.router.add_get("/api/metrics/{datasource}", self.datasource_metrics)
+        app.router.add_get("/api/events", self.sse)
+        app.router.add_get("/api/ws", self.websocket)
+        app.router.add_get("/metrics", self.openmetrics)
+        return app
+
+    async def start(self):
+        from aiohttp import web
+
+        self._pumps = [
+            asyncio.create_task(self._pump("alerts", self._alert_frame)),
+            asyncio.create_task(self._pump("metrics", self._metric_frame)),
+        ]
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = self._runner.addresses[0][1]
+        logger.info(f"API listening on http://{self.host}:{self.port}")
+
+    async def stop(self):
+        # Ends every SSE/WebSocket loop before the server waits on handlers
+        self.frames.close()
+        for ws in list(self._websockets):
+            await ws.close()
+        for task in self._pumps:
+            task.cancel()
+        await asyncio.gather(*self._pumps, return_exceptions=True)
+        self._pumps = []
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # Live event fan-out
+
+    @staticmethod
+    def _alert_frame(violation) -> Frame:
+        return Frame("alerts", violation.to_dict())
+
+    @staticmethod
+    def _metric_frame(metric_data) -> Frame:
+        return Frame("metrics", metric_data.to_dict())
+
+    async def _pump(self, topic: str, make_frame):
+        policy = Backpressure.COALESCE if topic == "metrics" else None
+        key = (lambda metric_data: metric_data.datasource_name) if policy else None
+        with self.scanner.events.subscribe(topic, policy=policy, key=key) as source:
+            async for event in source:
+                if self.frames.has_subscribers("frames"):
+                    self.frames.publish_nowait("frames", make_frame(event))
+
+    def _topics(self, request) -> Tuple[str, ...]:
+        requested = request.query.get("topics")
+        if not requested:
+            return TOPICS
+        return tuple(topic for topic in requested.split(",") if topic in TOPICS)
+
+    async def sse(self, request):
+        from aiohttp import web
+
+        topics = self._topics(request)
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": "text/event-stream",
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+            }
+        )
+        await response.prepare(request)
+        await response.write(b"retry: 3000\n\n")
+        with self.frames.subscribe("frames") as subscription:
+            try:
+                while True:
+                    try:
+                        frame = await asyncio.wait_for(
+                            subscription.get(), HEARTBEAT_SECONDS
+                        )
+                    except asyncio.TimeoutError:
+                        await response.write(b": keepalive\n\n")
+                        continue
+                    except StopAsyncIteration:
+                        break
+                    if frame.topic in topics:
+                        await response.write(frame.sse)
+            except ConnectionError:
+                pass  # Client went away
+        return response
+
+    async def websocket(self, request):
+        from aiohttp import WSMsgType, web
+
+        topics = self._topics(request)
+        # Uncompressed so the shared frame bytes go out as they are
+        ws = web.WebSocketResponse(heartbeat=30.0, compress=False)
+        await ws.prepare(request)
+        self._websockets.add(ws)
+        try:
+            with self.frames.subscribe("frames") as subscription:
+                reader = asyncio.ensure_future(self._drain(ws, subscription))
+                try:
+                    async for frame in subscription:
+                        if frame.topic in topics:
+                            await ws.send_frame(frame.data, WSMsgType.TEXT)
+                except ConnectionError:
+                    pass
+                finally:
+                    reader.cancel()
+        finally:
+            self._websockets.discard(ws)
+            await ws.close()
+        return ws
+
+    @staticmethod
+    async def _drain(ws, subscription):
+        # Incoming messages are ignored; a close from the client ends the feed
+        async for _ in ws:
+            pass
+        subscription.close()
+
+    # REST
+
+    def _json(self, request, payload: Any, etag: bool = True):
+        from aiohttp import web
+
+        body = _dumps(payload)
+        headers = {"Content-Type": "application/json"}
+        if etag:
+            tag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            headers["ETag"] = tag
+            if tag in request.headers.get("If-None-Match", ""):
+                return web.Response(status=304, headers={"ETag": tag})
+        return web.Response(body=body, headers=headers)
+
+    def _error(self, status: int, message: str):
+        from aiohttp import web
+
+        return web.Response(
+            status=status,
+            body=_dumps({"error": message}),
+            headers={"Content-Type": "application/json"},
+        )
+
+    def _limit(self, request, default: int = 100) -> int:
+        try:
+            limit = int(request.query.get("limit", default))
+        except ValueError:
+            raise ValueError("limit must be an integer")
+        return max(1, min(limit, self.max_page_size))
+
+    @staticmethod
+    def _offset(request) -> int:
+        try:
+            return max(0, int(request.query.get("offset", 0)))
+        except ValueError:
+            raise ValueError("offset must be an integer")
+
+    async def status(self, request):
+        scanner = self.scanner
+        last_scan = scanner.get_last_scan_time()
+        return self._json(
+            request,
+            {
+                "status": scanner.get_status().value,
+                "uptime_seconds": scanner.get_uptime_seconds(),
+                "last_scan_time": last_scan.isoformat() if last_scan else None,
+                "datasources": scanner.get_datasources(),
+                "alerts": len(scanner.alert_definitions),
+                "notifications": scanner.get_notification_stats(),
+            },
+            etag=False,
+        )
+
+    async def active_alerts(self, request):
+        try:
+            limit = self._limit(request)
+            offset = self._offset(request)
+        except ValueError as e:
+            return self._error(400, str(e))
+        alerts = await self.scanner.get_active_alerts_async()
+        page = alerts[offset : offset + limit]
+        next_offset = offset + limit if offset + limit < len(alerts) else None
+        return self._json(
+            request,
+            {"items": page, "total": len(alerts), "next_offset": next_offset},
+        )
+
+    async def alert_history(self, request):
+        query = request.query
+        # Validated up front so either history backend sees clean values
+        try:
+            limit = self._limit(request)
+            start = self._datetime(query.get("start"))
+            end = self._datetime(query.get("end"))
+            severity = self._severity(query.get("severity"))
+        except ValueError as e:
+            return self._error(400, str(e))
+        try:
+            page = await self.scanner.get_alert_history_page_async(
+                start=start,
+                end=end,
+                alert_name=query.get("alert_name"),
+                severity=severity,
+                limit=limit,
+                cursor=query.get("cursor"),
+                datasource_name=query.get("datasource_name"),
+            )
+        except ScannerException:
+            # Without the persistent history only the newest page exists
+            items = await self.scanner.get_alert_history_async(
+                limit=limit,
+                alert_name=query.get("alert_name"),
+                datasource_name=query.get("datasource_name"),
+                severity=severity,
+            )
+            page = {"items": items, "next_cursor": None}
+        except ValueError as e:
+            # e.g. a malformed cursor
+            return self._error(400, str(e))
+        return self._json(request, page)
+
+    @staticmethod
+    def _datetime(value: Optional[str]) -> Optional[datetime]:
+        return datetime.fromisoformat(value) if value else None
+
+    @staticmethod
+    def _severity(value: Optional[str]) -> Optional[Severity]:
+        if not value:
+            return None
+        try:
+            return Severity(value)
+        except ValueError:
+            choices = ", ".join(severity.value for severity in Severity)
+            raise ValueError(f"severity must be one of {choices}")
+
+    async def acknowledge(self, request):
+        violation_id = request.match_info["violation_id"]
+        if not await self.scanner.acknowledge_alert_async(violation_id):
+            return self._error(404, f"No active alert {violation_id}")
+        return self._json(
+            request, {"violation_id": violation_id, "acknowledged": True}, etag=False
+        )
+
+    async def latest_metrics(self, request):
+        return self._json(request, await self.scanner.get_latest_metrics_async())
+
+    async def datasource_metrics(self, request):
+        name = request.match_info["datasource"]
+        metrics = await self.scanner.get_metrics_by_source_async(name)
+        if metrics is None:
+            return self._error(404, f"No metrics for datasource {name}")
+        return self._json(request, metrics)
+
+    async def openmetrics(self, request):
+        from aiohttp import web
+
+        return web.Response(
+            body=self.scanner.metrics.render().encode(),
+            headers={"Content-Type": OPENMETRICS_CONTENT_TYPE},
+        )
+
+    # Auth
+
+    def _authorized(self, request) -> bool:
+        if not self.token:
+            return True
+        supplied = request.query.get("token", "")
+        header = request.headers.get("Authorization", "")
+        if header.startswith("Bearer "):
+            supplied = header[len("Bearer ") :]
+        return hmac.compare_digest(supplied.encode(), self.token.encode())
+
+    def _auth_middleware(self):
+        from aiohttp import web
+
+        @web.middleware
+        async def middleware(request, handler):
+            if not self._authorized(request):
+                return self._error(401, "Unauthorized")
+            return await handler(request)
+
+        return middleware
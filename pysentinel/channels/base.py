@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Any, Dict, List
 import logging
 
 from pysentinel.core.threshold import Violation
+from pysentinel.channels.templates import compile_templates
+from pysentinel.utils.http_client import HTTPResponse, TokenBucket, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -10,11 +12,55 @@ logger = logging.getLogger(__name__)
 class AlertChannel(ABC):
     """Abstract base class for channels"""
 
+    # Total attempts per HTTP request unless the channel config sets retry_count
+    default_retry_count = 3
+
+    # Named message templates; config may override them under "templates"
+    default_templates: Dict[str, Any] = {}
+
     def __init__(self, name: str, config: Dict):
         self.name = name
         self.config = config
+        self.rate_limiter = TokenBucket.from_config(config.get("rate_limit"))
+        # Compiled once here so sending an alert only substitutes its fields
+        defaults = self._default_templates()
+        self.templates = (
+            compile_templates(config.get("templates"), defaults) if defaults else {}
+        )
+
+    def _default_templates(self) -> Dict[str, Any]:
+        return self.default_templates
 
     @abstractmethod
     async def send_alert(self, violation: Violation) -> bool:
         """Send alert for violation"""
         pass
+
+    async def send_batch(self, violations: List[Violation]) -> bool:
+        """Send several violations; channels override this to send one message"""
+        results = [await self.send_alert(violation) for violation in violations]
+        return all(results)
+
+    async def send_each(self, violations: List[Violation]) -> List[bool]:
+        """
+        Send several violations and report, per violation, whether it went
+        out. Channels that send one message per violation override this so
+        one rejected message does not fail the rest of the batch.
+        """
+        ok = await self.send_batch(violations) is not False
+        return [ok] * len(violations)
+
+    async def close(self):
+        """Release connections held by the channel"""
+        pass
+
+    async def _http_request(self, method: str, url: str, **kwargs) -> HTTPResponse:
+        """Send a request through the shared pooled client with this channel's
+        retry count and rate limit"""
+        return await get_http_client().request(
+            method,
+            url,
+            attempts=self.config.get("retry_count", self.default_retry_count),
+            rate_limiter=self.rate_limiter,
+            **kwargs,
+        )
@@ -0,0 +1,106 @@
+import asyncio
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from pysentinel.core.threshold import Violation
+from pysentinel.channels.base import AlertChannel, logger
+from pysentinel.utils.constants import Severity
+
+_SEVERITY_ORDER = {Severity.CRITICAL: 0, Severity.WARNING: 1, Severity.INFO: 2}
+
+
+def group_violations(
+    violations: List[Violation],
+) -> List[Tuple[Tuple[str, Severity], List[Violation]]]:
+    """Group violations by (alert_group, severity), most severe groups first"""
+    groups: Dict[Tuple[str, Severity], List[Violation]] = defaultdict(list)
+    for violation in violations:
+        groups[(violation.alert_group or "", violation.severity)].append(violation)
+    return sorted(
+        groups.items(),
+        key=lambda item: (_SEVERITY_ORDER.get(item[0][1], 3), item[0][0]),
+    )
+
+
+class DigestChannel(AlertChannel):
+    """
+    Coalesces violations for a wrapped channel.
+
+    Violations are buffered and handed to the wrapped channel's
+    ``send_batch`` once ``window_seconds`` have passed since the first
+    buffered violation, or as soon as ``max_batch`` violations are waiting.
+    ``send_alert`` only buffers, so whoever needs to know when a violation
+    actually went out sets ``on_delivered``; it is called with each batch
+    and, per violation, whether the wrapped channel accepted it.
+    """
+
+    def __init__(self, channel: AlertChannel, window_seconds=10.0, max_batch=50):
+        super().__init__(channel.name, channel.config)
+        self.channel = channel
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self.received = 0
+        self.batches_sent = 0
+        self._buffer: List[Violation] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+        self.on_delivered: Optional[Callable[[List[Violation], List[bool]], None]] = (
+            None
+        )
+
+    async def send_alert(self, violation: Violation) -> bool:
+        self._buffer.append(violation)
+        self.received += 1
+        if len(self._buffer) >= self.max_batch:
+            self._schedule_flush()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.window_seconds, self._schedule_flush)
+        return True
+
+    async def send_batch(self, violations: List[Violation]) -> bool:
+        for violation in violations:
+            await self.send_alert(violation)
+        return True
+
+    def _schedule_flush(self):
+        # The batch is cut now, but sent from its own task so a slow provider
+        # never holds up (or gets cancelled by the timeout of) the caller
+        batch = self._take_batch()
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def flush(self) -> bool:
+        """Send everything buffered so far as one batch"""
+        batch = self._take_batch()
+        return await self._send(batch) if batch else True
+
+    def _take_batch(self) -> List[Violation]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._buffer = self._buffer, []
+        return batch
+
+    async def _send(self, batch: List[Violation]) -> bool:
+        self.batches_sent += 1
+        try:
+            results = await self.channel.send_each(batch)
+        except Exception as e:
+            logger.error(f"Failed to send digest via {self.name}: {e}")
+            results = [False] * len(batch)
+        if self.on_delivered is not None:
+            try:
+                self.on_delivered(batch, results)
+            except Exception as e:
+                logger.error(f"Error reporting digest delivery via {self.name}: {e}")
+        return all(results)
+
+    async def close(self):
+        await self.flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.channel.close()
@@ -1,51 +1,169 @@
+import asyncio
 import os
 import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import Any, Dict, List, Optional
 
 from pysentinel.core.threshold import Violation
 from pysentinel.channels.base import AlertChannel, logger
 
 
 class Email(AlertChannel):
-    """Email alert notifier implementation"""
+    """
+    Email alert notifier implementation.
+
+    smtplib is blocking, so all SMTP work runs on a dedicated single-thread
+    executor and never on the event loop. The authenticated session is kept
+    open between alerts and re-established after ``idle_timeout`` seconds or
+    when the server drops it.
+    """
+
+    default_templates = {
+        "subject": "PySentinel Alert: {alert_title}",
+        "body": """
+            Alert: {alert_name}
+            Severity: {severity_upper}
+            Message: {message}
+            Current Value: {current_value}
+            Threshold: {threshold}
+            Datasource: {datasource_name}
+            Time: {timestamp}
+            """,
+    }
+
+    def __init__(self, name: str, config: dict):
+        super().__init__(name, config)
+        self.idle_timeout = config.get("idle_timeout", 60)
+        self.use_tls = config.get("use_tls", True)
+        self.use_ssl = config.get("use_ssl", False)
+        self.smtp_timeout = config.get("timeout", 30)
+
+        password = config.get("password")
+        if password and password.startswith("${") and password.endswith("}"):
+            password = os.getenv(password[2:-1], password)
+        self._password = password
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"pysentinel-smtp-{name}"
+        )
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+
+    def _default_templates(self) -> Dict[str, Any]:
+        # subject_template predates the templates section and is still honoured
+        return {
+            **self.default_templates,
+            "subject": self.config.get(
+                "subject_template", self.default_templates["subject"]
+            ),
+        }
 
     async def send_alert(self, violation: Violation) -> bool:
+        return await self.send_batch([violation])
+
+    async def send_batch(self, violations: List[Violation]) -> bool:
+        return all(await self.send_each(violations))
+
+    async def send_each(self, violations: List[Violation]) -> List[bool]:
+        """Send one email per violation over a single SMTP session"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._send_messages, violations
+        )
+
+    async def close(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._disconnect)
+        self._executor.shutdown(wait=False)
+
+    def _build_message(self, violation: Violation) -> str:
+        msg = MIMEMultipart()
+        msg["From"] = self.config["from_address"]
+        msg["To"] = ", ".join(self.config["recipients"])
+        msg["Subject"] = self.templates["subject"].render(violation)
+        msg.attach(MIMEText(self.templates["body"].render(violation), "plain"))
+        return msg.as_string()
+
+    # The methods below only run on the SMTP executor thread
+
+    def _send_messages(self, violations: List[Violation]) -> List[bool]:
+        sent = []
+        for violation in violations:
+            try:
+                self._send_message(self._build_message(violation))
+                sent.append(True)
+            except (
+                smtplib.SMTPRecipientsRefused,
+                smtplib.SMTPSenderRefused,
+                smtplib.SMTPDataError,
+            ) as e:
+                # Only this message was rejected; the session is still usable
+                logger.error(f"Email alert {violation.alert_name} was rejected: {e}")
+                sent.append(False)
+            except OSError as e:
+                # smtplib errors are OSErrors too: the session is gone, so the
+                # rest of the batch cannot go out either
+                logger.error(f"Failed to send email alert: {e}")
+                sent.extend([False] * (len(violations) - len(sent)))
+                break
+            except Exception as e:
+                logger.error(f"Failed to send email alert {violation.alert_name}: {e}")
+                sent.append(False)
+        return sent
+
+    def _send_message(self, text: str):
         try:
-            msg = MIMEMultipart()
-            msg["From"] = self.config["from_address"]
-            msg["To"] = ", ".join(self.config["recipients"])
-            msg["Subject"] = self.config["subject_template"].format(
-                alert_title=violation.alert_name
+            refused = self._session().sendmail(
+                self.config["from_address"], self.config["recipients"], text
             )
-
-            body = f"""
-            Alert: {violation.alert_name}
-            Severity: {violation.severity.value.upper()}
-            Message: {violation.message}
-            Current Value: {violation.current_value}
-            Threshold: {violation.operator} {violation.threshold_value}
-            Datasource: {violation.datasource_name}
-            Time: {violation.timestamp}
-            """
-
-            msg.attach(MIMEText(body, "plain"))
-
-            password = self.config["password"]
-            if password.startswith("${") and password.endswith("}"):
-                env_var = password[2:-1]
-                password = os.getenv(env_var, password)
-
-            server = smtplib.SMTP(self.config["smtp_server"], self.config["smtp_port"])
-            server.starttls()
-            server.login(self.config["username"], password)
-            text = msg.as_string()
-            server.sendmail(
+        except smtplib.SMTPServerDisconnected:
+            # The server closed an idle session; retry once on a fresh one
+            self._disconnect()
+            refused = self._session().sendmail(
                 self.config["from_address"], self.config["recipients"], text
             )
-            server.quit()
+        self._last_used = time.monotonic()
+        if refused:
+            # Accepted for the other recipients, so it is not resent
+            logger.warning(f"Email alert not delivered to {', '.join(refused)}")
 
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send email alert: {e}")
-            return False
+    def _session(self) -> smtplib.SMTP:
+        if self._smtp is not None:
+            if time.monotonic() - self._last_used < self.idle_timeout:
+                return self._smtp
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._disconnect()
+
+        smtp_class = smtplib.SMTP_SSL if self.use_ssl else smtplib.SMTP
+        smtp = smtp_class(
+            self.config["smtp_server"],
+            self.config.get("smtp_port", 465 if self.use_ssl else 587),
+            timeout=self.smtp_timeout,
+        )
+        try:
+            if self.use_tls and not self.use_ssl:
+                smtp.starttls()
+            if self.config.get("username"):
+                smtp.login(self.config["username"], self._password)
+        except Exception:
+            smtp.close()
+            raise
+        self._smtp = smtp
+        self._last_used = time.monotonic()
+        return smtp
+
+    def _disconnect(self):
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
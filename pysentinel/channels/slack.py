@@ -1,71 +1,101 @@
+from typing import Dict, List
+
 from pysentinel.core.threshold import Violation
 from pysentinel.channels.base import AlertChannel, logger
+from pysentinel.channels.digest import group_violations
 from pysentinel.utils.constants import Severity
 
 
 class Slack(AlertChannel):
     """Slack alert channel implementation"""
 
-    async def send_alert(self, violation: Violation) -> bool:
-        import aiohttp
+    default_templates = {
+        "message": {
+            "text": "🚨 *{severity_upper}* Alert: {alert_name}",
+            "attachments": [
+                {
+                    "color": "{color}",
+                    "fields": [
+                        {"title": "Message", "value": "{message}", "short": False},
+                        {
+                            "title": "Current Value",
+                            "value": "{current_value!s}",
+                            "short": True,
+                        },
+                        {"title": "Threshold", "value": "{threshold}", "short": True},
+                        {
+                            "title": "Datasource",
+                            "value": "{datasource_name}",
+                            "short": True,
+                        },
+                        {
+                            "title": "Time",
+                            "value": "{timestamp:%Y-%m-%d %H:%M:%S UTC}",
+                            "short": True,
+                        },
+                    ],
+                }
+            ],
+        },
+        "digest_item": (
+            "• *{alert_name}*: {message} (value {current_value}, threshold "
+            "{threshold}, {datasource_name}, {timestamp:%H:%M:%S})"
+        ),
+    }
 
+    async def send_alert(self, violation: Violation) -> bool:
         try:
+            message = self.templates["message"].render(violation)
+            if isinstance(message, str):
+                message = {"text": message}
             payload = {
                 "channel": self.config["channel"],
                 "username": self.config["username"],
                 "icon_emoji": self.config["icon_emoji"],
-                "text": f"🚨 *{violation.severity.value.upper()}* Alert: {violation.alert_name}",
-                "attachments": [
+                **message,
+            }
+            return await self._post(payload)
+        except Exception as e:
+            logger.error(f"Failed to send Slack alert: {e}")
+            return False
+
+    async def send_batch(self, violations: List[Violation]) -> bool:
+        """Send a digest: one message with an attachment per group and severity"""
+        if len(violations) == 1:
+            return await self.send_alert(violations[0])
+        try:
+            render_item = self.templates["digest_item"].render
+            attachments = []
+            for (group, severity), items in group_violations(violations):
+                attachments.append(
                     {
                         "color": (
-                            "danger"
-                            if violation.severity == Severity.CRITICAL
-                            else "warning"
+                            "danger" if severity == Severity.CRITICAL else "warning"
                         ),
-                        "fields": [
-                            {
-                                "title": "Message",
-                                "value": violation.message,
-                                "short": False,
-                            },
-                            {
-                                "title": "Current Value",
-                                "value": str(violation.current_value),
-                                "short": True,
-                            },
-                            {
-                                "title": "Threshold",
-                                "value": f"{violation.operator} {violation.threshold_value}",
-                                "short": True,
-                            },
-                            {
-                                "title": "Datasource",
-                                "value": violation.datasource_name,
-                                "short": True,
-                            },
-                            {
-                                "title": "Time",
-                                "value": violation.timestamp.strftime(
-                                    "%Y-%m-%d %H:%M:%S UTC"
-                                ),
-                                "short": True,
-                            },
-                        ],
+                        "title": f"{severity.value.upper()} · {group or 'ungrouped'} ({len(items)})",
+                        "text": "\n".join(render_item(v) for v in items),
                     }
-                ],
-            }
-
-            # Add mentions if configured
-            if "mention_users" in self.config:
-                payload["text"] = (
-                    f"{' '.join(self.config['mention_users'])} {payload['text']}"
                 )
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.config["webhook_url"], json=payload
-                ) as response:
-                    return response.status == 200
+            payload = {
+                "channel": self.config["channel"],
+                "username": self.config["username"],
+                "icon_emoji": self.config["icon_emoji"],
+                "text": f"🚨 *{len(violations)}* alerts triggered",
+                "attachments": attachments,
+            }
+            return await self._post(payload)
         except Exception as e:
-            logger.error(f"Failed to send Slack alert: {e}")
+            logger.error(f"Failed to send Slack digest: {e}")
             return False
+
+    async def _post(self, payload: Dict) -> bool:
+        # Add mentions if configured
+        if "mention_users" in self.config:
+            payload["text"] = (
+                f"{' '.join(self.config['mention_users'])} {payload['text']}"
+            )
+
+        response = await self._http_request(
+            "POST", self.config["webhook_url"], json=payload
+        )
+        return response.status == 200
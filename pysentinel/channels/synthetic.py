@@ -0,0 +1,43 @@
+import asyncio
+import random
+from typing import Dict, List
+
+from pysentinel.core.threshold import Violation
+from pysentinel.channels.base import AlertChannel
+
+
+class SyntheticChannel(AlertChannel):
+    """
+    In-process alert channel that only counts deliveries, for benchmarks
+    and load tests.
+
+    Config:
+        latency_ms / jitter_ms: simulated delivery latency
+        error_rate: probability that a send reports failure
+        seed: makes simulated failures reproducible
+    """
+
+    def __init__(self, name: str, config: Dict):
+        super().__init__(name, config)
+        self.latency = config.get("latency_ms", 0) / 1000
+        self.jitter = config.get("jitter_ms", 0) / 1000
+        self.error_rate = config.get("error_rate", 0.0)
+        self._random = random.Random(config.get("seed"))
+        self.sent = 0
+        self.failed = 0
+
+    async def send_alert(self, violation: Violation) -> bool:
+        return await self._deliver(1)
+
+    async def send_batch(self, violations: List[Violation]) -> bool:
+        return await self._deliver(len(violations))
+
+    async def _deliver(self, count: int) -> bool:
+        rng = self._random
+        delay = self.latency + (rng.uniform(0, self.jitter) if self.jitter else 0)
+        await asyncio.sleep(delay)
+        if self.error_rate and rng.random() < self.error_rate:
+            self.failed += count
+            return False
+        self.sent += count
+        return True
@@ -1,30 +1,60 @@
+from typing import List
+
 from pysentinel.core.threshold import Violation
 from pysentinel.channels.base import AlertChannel, logger
+from pysentinel.channels.digest import group_violations
 
 
 class Telegram(AlertChannel):
     """Telegram alert channel implementation"""
 
-    async def send_alert(self, violation: Violation) -> bool:
-        import aiohttp
+    default_templates = {
+        "message": (
+            "🚨 *{severity_upper}* Alert: {alert_name}\n"
+            "Message: {message}\n"
+            "Current Value: {current_value}\n"
+            "Threshold: {threshold}\n"
+            "Datasource: {datasource_name}\n"
+            "Time: {timestamp:%Y-%m-%d %H:%M:%S UTC}"
+        ),
+        "digest_item": (
+            "• {alert_name}: {current_value} "
+            "(threshold {threshold}, {datasource_name})"
+        ),
+    }
 
+    async def send_alert(self, violation: Violation) -> bool:
         try:
-            payload = {
-                "chat_id": self.config["chat_id"],
-                "text": f"🚨 *{violation.severity.value.upper()}* Alert: {violation.alert_name}\n"
-                f"Message: {violation.message}\n"
-                f"Current Value: {violation.current_value}\n"
-                f"Threshold: {violation.operator} {violation.threshold_value}\n"
-                f"Datasource: {violation.datasource_name}\n"
-                f"Time: {violation.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}",
-                "parse_mode": "Markdown",
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.config["webhook_url"], json=payload
-                ) as response:
-                    return response.status == 200
+            return await self._post(self.templates["message"].render(violation))
         except Exception as e:
             logger.error(f"Failed to send Telegram alert: {e}")
             return False
+
+    async def send_batch(self, violations: List[Violation]) -> bool:
+        """Send a digest: one message with a section per group and severity"""
+        if len(violations) == 1:
+            return await self.send_alert(violations[0])
+        try:
+            render_item = self.templates["digest_item"].render
+            sections = [f"🚨 *{len(violations)}* alerts triggered"]
+            for (group, severity), items in group_violations(violations):
+                lines = [
+                    f"*{severity.value.upper()}* · {group or 'ungrouped'} ({len(items)})"
+                ]
+                lines.extend(render_item(v) for v in items)
+                sections.append("\n".join(lines))
+            return await self._post("\n\n".join(sections))
+        except Exception as e:
+            logger.error(f"Failed to send Telegram digest: {e}")
+            return False
+
+    async def _post(self, text: str) -> bool:
+        payload = {
+            "chat_id": self.config["chat_id"],
+            "text": text,
+            "parse_mode": "Markdown",
+        }
+        response = await self._http_request(
+            "POST", self.config["webhook_url"], json=payload
+        )
+        return response.status == 200
@@ -0,0 +1,209 @@
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+from pysentinel.utils.exception import TemplateException
+
+
+def _threshold(v: Violation) -> str:
+    return f"{v.operator} {v.threshold_value}"
+
+
+def _color(v: Violation) -> str:
+    return "danger" if v.severity == Severity.CRITICAL else "warning"
+
+
+# Placeholders available to templates, e.g. "{alert_name}" or
+# "{timestamp:%Y-%m-%d %H:%M:%S}", and the expression each compiles to
+FIELDS: Dict[str, str] = {
+    "alert_name": "v.alert_name",
+    "alert_title": "v.alert_name",
+    "metric_name": "v.metric_name",
+    "current_value": "v.current_value",
+    "threshold_value": "v.threshold_value",
+    "operator": "v.operator",
+    "message": "v.message",
+    "timestamp": "v.timestamp",
+    "datasource_name": "v.datasource_name",
+    "alert_group": "v.alert_group",
+    "violation_id": "v.violation_id",
+    "severity": "v.severity.value",
+    "severity_upper": "v.severity.value.upper()",
+    "threshold": "_threshold(v)",
+    "color": "_color(v)",
+}
+
+# f-string fragments used instead of the FIELDS expression in text
+# templates, saving a function call per render
+_INLINE: Dict[str, str] = {"threshold": "{v.operator} {v.threshold_value}"}
+
+_formatter = Formatter()
+
+
+class _Compiler:
+    """
+    Turns template sources into a single Python expression over ``v``.
+
+    Text templates become f-strings and structured templates become
+    dict/list displays, so a render runs as one compiled function with no
+    per-field dispatch. Only expressions from ``FIELDS`` are spliced into
+    the generated code; literal text, format specs and static subtrees are
+    bound as constants in the function's namespace.
+    """
+
+    def __init__(self):
+        self.namespace: Dict[str, Any] = {"_threshold": _threshold, "_color": _color}
+
+    def const(self, value: Any) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def function(self, expression: str) -> Callable[[Violation], Any]:
+        return eval(f"lambda v: {expression}", self.namespace)
+
+    @staticmethod
+    def parse(source: str) -> List[Tuple]:
+        try:
+            return list(_formatter.parse(source))
+        except ValueError as e:
+            raise TemplateException(f"Invalid template {source!r}: {e}")
+
+    @staticmethod
+    def field(name: str) -> str:
+        try:
+            return FIELDS[name]
+        except KeyError:
+            raise TemplateException(f"Unknown template field '{name}'")
+
+    def text(self, source: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return ``(expression, None)``, or ``(None, text)`` if static"""
+        parsed = self.parse(source)
+        if all(field is None for _, field, _, _ in parsed):
+            return None, "".join(literal for literal, _, _, _ in parsed)
+
+        pieces = []
+        for literal, field, spec, conversion in parsed:
+            if literal:
+                pieces.append(f"{{{self.const(literal)}}}")
+            if field is None:
+                continue
+            if conversion not in (None, "s", "r"):
+                raise TemplateException(f"Invalid conversion '!{conversion}'")
+            if spec and "{" in spec:
+                raise TemplateException("Nested format specs are not supported")
+            if field in _INLINE and not spec and not conversion:
+                pieces.append(_INLINE[field])
+                continue
+            pieces.append(
+                f"{{({self.field(field)})"
+                f"{'!' + conversion if conversion else ''}"
+                f"{':{' + self.const(spec) + '}' if spec else ''}}}"
+            )
+        return 'f"' + "".join(pieces) + '"', None
+
+    def node(self, node: Any) -> Tuple[Optional[str], Any]:
+        """Return ``(expression, None)``, or ``(None, value)`` if static"""
+        if isinstance(node, dict):
+            items = [(key, self.node(value)) for key, value in node.items()]
+            if all(expression is None for _, (expression, _) in items):
+                return None, {key: value for key, (_, value) in items}
+            entries = ", ".join(
+                f"{self.const(key)}: {self.expression(compiled)}"
+                for key, compiled in items
+            )
+            return f"{{{entries}}}", None
+        if isinstance(node, list):
+            items = [self.node(item) for item in node]
+            if all(expression is None for expression, _ in items):
+                return None, [value for _, value in items]
+            return f"[{', '.join(self.expression(item) for item in items)}]", None
+        if isinstance(node, str):
+            parsed = self.parse(node)
+            if len(parsed) == 1:
+                literal, field, spec, conversion = parsed[0]
+                if not literal and field is not None and not spec and not conversion:
+                    # A lone placeholder keeps its raw value, e.g. numbers in JSON
+                    return f"({self.field(field)})", None
+            return self.text(node)
+        return None, node
+
+    def expression(self, compiled: Tuple[Optional[str], Any]) -> str:
+        expression, value = compiled
+        # Static subtrees are built once and shared between renders
+        return expression if expression is not None else self.const(value)
+
+
+class Template:
+    """
+    A text template in ``str.format`` syntax over the names in ``FIELDS``.
+
+    The source is parsed, validated and compiled to an f-string once at
+    construction, so rendering only substitutes the violation's values. A
+    template without placeholders renders to the same cached string.
+    """
+
+    __slots__ = ("source", "_render", "_static")
+
+    def __init__(self, source: str):
+        self.source = source
+        compiler = _Compiler()
+        expression, self._static = compiler.text(source)
+        self._render = compiler.function(expression) if expression else None
+
+    def render(self, violation: Violation) -> str:
+        if self._render is None:
+            return self._static
+        return self._render(violation)
+
+    def __repr__(self):
+        return f"Template({self.source!r})"
+
+
+class StructuredTemplate:
+    """
+    A JSON-like template (dicts, lists and strings) compiled once.
+
+    Every string leaf is a text template; a leaf that is exactly one
+    placeholder (e.g. ``"{current_value}"``) keeps the raw value so numbers
+    stay numbers in JSON. Subtrees without placeholders are built once and
+    shared between renders, so callers must not mutate them.
+    """
+
+    __slots__ = ("source", "_render")
+
+    def __init__(self, source: Any):
+        self.source = source
+        compiler = _Compiler()
+        self._render = compiler.function(compiler.expression(compiler.node(source)))
+
+    def render(self, violation: Violation) -> Any:
+        return self._render(violation)
+
+    def __repr__(self):
+        return f"StructuredTemplate({self.source!r})"
+
+
+def compile_template(source: Any) -> Union[Template, StructuredTemplate]:
+    """Compile a text template, or a structured one for dicts and lists"""
+    if isinstance(source, (Template, StructuredTemplate)):
+        return source
+    if isinstance(source, str):
+        return Template(source)
+    return StructuredTemplate(source)
+
+
+def compile_templates(
+    overrides: Optional[Dict[str, Any]], defaults: Dict[str, Any]
+) -> Dict[str, Union[Template, StructuredTemplate]]:
+    """Compile a channel's templates, letting config override the defaults"""
+    overrides = overrides or {}
+    unknown = set(overrides) - set(defaults)
+    if unknown:
+        raise TemplateException(f"Unknown templates: {', '.join(sorted(unknown))}")
+    compiled = {}
+    for name, default in defaults.items():
+        source = overrides.get(name, default)
+        compiled[name] = compile_template(source) if source is not None else None
+    return compiled
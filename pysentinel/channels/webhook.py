@@ -1,47 +1,102 @@
 import asyncio
+import gzip
+import hashlib
+import json
 import os
+from typing import Any, Dict, List
 
 from pysentinel.core.threshold import Violation
 from pysentinel.channels.base import AlertChannel, logger
 
+# Bodies larger than this are compressed off the event loop
+_INLINE_COMPRESS_BYTES = 64 * 1024
+
 
 class Webhook(AlertChannel):
-    """Webhook alert notifier implementation"""
+    """
+    Webhook alert notifier implementation.
 
-    async def send_alert(self, violation: Violation) -> bool:
-        import aiohttp
+    With ``batch: {enabled: true, window_seconds, max_batch}`` violations
+    are buffered (see ``DigestChannel``) and POSTed as one JSON array,
+    gzip-compressed unless ``compress: false`` is set.
+    """
 
-        try:
-            headers = self.config.get("headers", {})
-            # Replace environment variables in headers
-            for key, value in headers.items():
-                if (
-                    isinstance(value, str)
-                    and value.startswith("${")
-                    and value.endswith("}")
-                ):
-                    env_var = value[2:-1]
-                    headers[key] = os.getenv(env_var, value)
-
-            payload = violation.to_dict()
-
-            async with aiohttp.ClientSession() as session:
-                for attempt in range(self.config.get("retry_count", 1)):
-                    try:
-                        async with session.request(
-                            self.config.get("method", "POST"),
-                            self.config["url"],
-                            json=payload,
-                            headers=headers,
-                        ) as response:
-                            if response.status < 400:
-                                return True
-                    except Exception as e:
-                        if attempt == self.config.get("retry_count", 1) - 1:
-                            raise e
-                        await asyncio.sleep(1)
+    default_retry_count = 1
 
-            return False
+    # None sends Violation.to_dict(); a dict/list template reshapes the JSON
+    default_templates = {"payload": None}
+
+    def __init__(self, name: str, config: Dict):
+        super().__init__(name, config)
+        batch_config = config.get("batch") or {}
+        batching = bool(batch_config) and batch_config.get("enabled", True)
+        self.compress = config.get("compress", batching)
+        self.compress_level = config.get("compress_level", 6)
+
+        # Environment variables in headers are resolved once, here
+        headers = {"Content-Type": "application/json"}
+        for key, value in config.get("headers", {}).items():
+            if (
+                isinstance(value, str)
+                and value.startswith("${")
+                and value.endswith("}")
+            ):
+                value = os.getenv(value[2:-1], value)
+            headers[key] = value
+        if self.compress:
+            headers["Content-Encoding"] = "gzip"
+        self.headers = headers
+
+    async def send_alert(self, violation: Violation) -> bool:
+        try:
+            # Lets the receiver drop duplicates when the outbox redelivers
+            return await self._send(
+                self._payload(violation),
+                {"Idempotency-Key": f"{violation.violation_id}:{self.name}"},
+            )
         except Exception as e:
             logger.error(f"Failed to send webhook alert: {e}")
             return False
+
+    async def send_batch(self, violations: List[Violation]) -> bool:
+        """POST all violations as one JSON array"""
+        try:
+            return await self._send(
+                [self._payload(violation) for violation in violations],
+                {"Idempotency-Key": self._batch_key(violations)},
+            )
+        except Exception as e:
+            logger.error(f"Failed to send webhook batch: {e}")
+            return False
+
+    def _batch_key(self, violations: List[Violation]) -> str:
+        # Same violations, same key, so a resent batch can be recognised
+        keys = sorted(
+            f"{violation.violation_id}:{self.name}" for violation in violations
+        )
+        return hashlib.sha256("\n".join(keys).encode()).hexdigest()
+
+    def _payload(self, violation: Violation) -> Any:
+        template = self.templates["payload"]
+        return template.render(violation) if template else violation.to_dict()
+
+    async def _encode(self, payload: Any) -> bytes:
+        body = json.dumps(payload, separators=(",", ":"), default=str).encode()
+        if not self.compress:
+            return body
+        if len(body) < _INLINE_COMPRESS_BYTES:
+            return gzip.compress(body, compresslevel=self.compress_level)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, lambda: gzip.compress(body, compresslevel=self.compress_level)
+        )
+
+    async def _send(self, payload: Any, extra_headers: Dict = None) -> bool:
+        headers = {**self.headers, **extra_headers} if extra_headers else self.headers
+        response = await self._http_request(
+            self.config.get("method", "POST"),
+            self.config["url"],
+            data=await self._encode(payload),
+            headers=headers,
+        )
+        return response.status < 400
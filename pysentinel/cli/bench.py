@@ -0,0 +1,203 @@
+"""
+``pysentinel bench``: run real scan ticks back to back against synthetic
+datasources for a fixed time and report throughput and tick latency.
+
+With a config file the alert groups are kept as they are. Every datasource
+is replaced by a synthetic one of the same name, and every channel by a
+synthetic sink, so the numbers reflect that config's alert count and
+layout without contacting anything. Without a config file a scanner with
+``--alerts`` alerts over ``--datasources`` datasources is generated.
+
+The synthetic types are not part of the scanner's built-in factories; only
+scanners built by ``bench_scanner`` can create them.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+from pysentinel.channels.synthetic import SyntheticChannel
+from pysentinel.cli.dry_run import percentile
+from pysentinel.core.scanner import Scanner
+from pysentinel.datasources.synthetic import SyntheticDataSource
+from pysentinel.utils.constants import Severity
+
+BENCH_DATASOURCE_TYPES = {"synthetic": SyntheticDataSource}
+BENCH_CHANNEL_TYPES = {"synthetic": SyntheticChannel}
+
+# Global sections that start servers or write files; a bench run skips them
+SIDE_EFFECT_SECTIONS = ("api", "metrics_server", "history_db", "outbox", "tracing")
+
+
+def bench_scanner(config: Dict) -> Scanner:
+    """Scanner that can also create the synthetic datasource and channel"""
+    return Scanner(
+        config,
+        datasource_types=BENCH_DATASOURCE_TYPES,
+        channel_types=BENCH_CHANNEL_TYPES,
+    )
+
+
+def generated_config(
+    alerts: int,
+    datasources: int,
+    violation_rate: float,
+    latency_ms: float,
+    error_rate: float,
+) -> Dict:
+    alert_definitions = [
+        {
+            "name": f"alert_{i}",
+            "metrics": "value",
+            "query": f"query_{i}",
+            "datasource": f"ds_{i % datasources}",
+            "threshold": {"max": 100 * (1 - violation_rate)},
+            "severity": "warning",
+            "interval": 0,
+            "alert_channels": ["sink"],
+            "description": "synthetic",
+        }
+        for i in range(alerts)
+    ]
+    return {
+        "global": {"notifications": {"queue_size": 1_000_000}},
+        "datasources": {
+            f"ds_{d}": _synthetic_datasource(["value"], latency_ms, error_rate, d)
+            for d in range(datasources)
+        },
+        "alert_channels": {"sink": {"type": "synthetic"}},
+        "alert_groups": {"bench": {"alerts": alert_definitions}},
+    }
+
+
+def synthetic_config(config: Dict, latency_ms: float, error_rate: float) -> Dict:
+    """Copy of ``config`` with datasources and channels made synthetic"""
+    metrics_by_datasource: Dict[str, List[str]] = {}
+    for group in (config.get("alert_groups") or {}).values():
+        for alert in group.get("alerts", []):
+            metrics_by_datasource.setdefault(alert.get("datasource"), []).append(
+                alert.get("metrics", "value")
+            )
+
+    global_config = {
+        key: value
+        for key, value in (config.get("global") or {}).items()
+        if key not in SIDE_EFFECT_SECTIONS
+    }
+    return {
+        **config,
+        "global": global_config,
+        "datasources": {
+            name: {
+                **_synthetic_datasource(
+                    metrics_by_datasource.get(name, ["value"]),
+                    latency_ms,
+                    error_rate,
+                    index,
+                ),
+                "enabled": datasource.get("enabled", False),
+            }
+            for index, (name, datasource) in enumerate(
+                (config.get("datasources") or {}).items()
+            )
+        },
+        "alert_channels": {
+            name: {"type": "synthetic"} for name in (config.get("alert_channels") or {})
+        },
+    }
+
+
+def _synthetic_datasource(
+    metrics: List[str], latency_ms: float, error_rate: float, seed: int
+) -> Dict:
+    return {
+        "type": "synthetic",
+        "enabled": True,
+        "metrics": {name: {"min": 0, "max": 100} for name in metrics},
+        "latency_ms": latency_ms,
+        "error_rate": error_rate,
+        # Errors must not disable a datasource part way through the run
+        "max_retries": 10**9,
+        "seed": seed,
+    }
+
+
+class BenchResult:
+    def __init__(self, scanner: Scanner, tick_seconds: List[float], seconds: float):
+        self.tick_seconds = tick_seconds
+        self.seconds = seconds
+        self.alerts = len(scanner.alert_definitions)
+        self.evaluations = sum(
+            getattr(datasource, "fetch_count", 0)
+            for datasource in scanner.datasources.values()
+        )
+        violations = scanner.metrics.get("pysentinel_violations")
+        self.violations = sum(
+            violations.labels(severity.value).value for severity in Severity
+        )
+        self.notifications = sum(
+            getattr(channel, "sent", 0) for channel in scanner.alert_channels.values()
+        )
+        self.dropped = scanner.get_notification_stats()["dropped"]
+
+    def to_dict(self) -> Dict:
+        ticks = self.tick_seconds
+        return {
+            "alerts": self.alerts,
+            "ticks": len(ticks),
+            "seconds": self.seconds,
+            "ticks_per_s": len(ticks) / self.seconds if self.seconds else 0.0,
+            "evaluations_per_s": (
+                self.evaluations / self.seconds if self.seconds else 0.0
+            ),
+            "tick_p50_ms": percentile(ticks, 0.5) * 1000,
+            "tick_p90_ms": percentile(ticks, 0.9) * 1000,
+            "tick_p99_ms": percentile(ticks, 0.99) * 1000,
+            "tick_max_ms": max(ticks, default=0.0) * 1000,
+            "violations": self.violations,
+            "notifications": self.notifications,
+            "notifications_dropped": self.dropped,
+        }
+
+    def format(self) -> str:
+        stats = self.to_dict()
+        return "\n".join(
+            [
+                f"alerts:          {stats['alerts']}",
+                f"ticks:           {stats['ticks']} in {stats['seconds']:.1f}s "
+                f"({stats['ticks_per_s']:,.1f}/s)",
+                f"evaluations/s:   {stats['evaluations_per_s']:,.0f}",
+                f"tick ms:         p50 {stats['tick_p50_ms']:.1f}  "
+                f"p90 {stats['tick_p90_ms']:.1f}  "
+                f"p99 {stats['tick_p99_ms']:.1f}  "
+                f"max {stats['tick_max_ms']:.1f}",
+                f"violations:      {stats['violations']:,.0f}",
+                f"notifications:   {stats['notifications']:,} sent, "
+                f"{stats['notifications_dropped']:,} dropped",
+            ]
+        )
+
+
+async def bench_async(
+    scanner: Scanner, duration: float, max_ticks: Optional[int] = None
+) -> BenchResult:
+    """Run scan ticks back to back for ``duration`` seconds"""
+    # Every alert is evaluated on every tick, whatever its interval
+    for alert_def in scanner.alert_definitions:
+        alert_def.interval = 0
+
+    dispatcher = scanner._dispatcher
+    await dispatcher.start()
+    tick_seconds = []
+    start = time.perf_counter()
+    deadline = start + duration
+    try:
+        while time.perf_counter() < deadline:
+            if max_ticks is not None and len(tick_seconds) >= max_ticks:
+                break
+            tick_start = time.perf_counter()
+            await scanner.scan_once_async()
+            tick_seconds.append(time.perf_counter() - tick_start)
+    finally:
+        seconds = time.perf_counter() - start
+        await dispatcher.stop()
+    return BenchResult(scanner, tick_seconds, seconds)
@@ -4,18 +4,38 @@ PySentinel CLI - Command line interface for running the scanner
 """
 import argparse
 import asyncio
+import json
+import os
+import signal
 import sys
 from pathlib import Path
+from typing import Dict, List, Optional
 
 from pysentinel.core.scanner import Scanner
 from pysentinel.config.loader import load_config
+from pysentinel.cli.bench import (
+    bench_async,
+    bench_scanner,
+    generated_config,
+    synthetic_config,
+)
+from pysentinel.cli.dry_run import dry_run_async
+from pysentinel.utils.logging import setup_logging
 
 
-def start_scanner_sync(config_path: str) -> None:
+def start_scanner_sync(
+    config_path: str,
+    watch_interval: Optional[float] = None,
+    logging_overrides: Optional[Dict] = None,
+) -> None:
     """Start the scanner synchronously (blocking)"""
     try:
         config = load_config(config_path)
         scanner = Scanner(config)
+        scanner.config_path = config_path
+        scanner.logging_overrides = logging_overrides or {}
+        if watch_interval:
+            scanner.watch_config(watch_interval)
         print(f"Starting PySentinel scanner with config: {config_path}")
         scanner.start()
     except KeyboardInterrupt:
@@ -26,11 +46,19 @@ def start_scanner_sync(config_path: str) -> None:
         sys.exit(1)
 
 
-async def start_scanner_async(config_path: str) -> None:
+async def start_scanner_async(
+    config_path: str,
+    watch_interval: Optional[float] = None,
+    logging_overrides: Optional[Dict] = None,
+) -> None:
     """Start the scanner asynchronously"""
     try:
         config = load_config(config_path)
         scanner = Scanner(config)
+        scanner.config_path = config_path
+        scanner.logging_overrides = logging_overrides or {}
+        if watch_interval:
+            scanner.watch_config(watch_interval)
         print(f"Starting PySentinel scanner (async) with config: {config_path}")
         await scanner.start_async()
     except KeyboardInterrupt:
@@ -41,6 +69,19 @@ async def start_scanner_async(config_path: str) -> None:
         sys.exit(1)
 
 
+def send_reload_signal(pid: int) -> None:
+    """Ask a running scanner to reload its configuration (SIGHUP)"""
+    if not hasattr(signal, "SIGHUP"):
+        print("Reloading via signal is not supported on this platform")
+        sys.exit(1)
+    try:
+        os.kill(pid, signal.SIGHUP)
+    except OSError as e:
+        print(f"Error signalling process {pid}: {e}")
+        sys.exit(1)
+    print(f"Sent reload signal to process {pid}")
+
+
 def validate_config_file(config_path: str) -> str:
     """Validate that the config file exists"""
     path = Path(config_path)
@@ -51,8 +92,174 @@ def validate_config_file(config_path: str) -> str:
     return str(path)
 
 
+def dry_run_command(argv: List[str]) -> None:
+    """Evaluate every alert once without notifying and report query timings"""
+    parser = argparse.ArgumentParser(
+        prog="pysentinel dry-run",
+        description="Evaluate every alert once against the configured "
+        "datasources without sending notifications, and report per-alert "
+        "and per-datasource query latency. Exits with 1 if a query fails or "
+        "a --max-* budget is exceeded.",
+    )
+    parser.add_argument("config", type=validate_config_file)
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Seconds to wait for each query (default: 30)",
+    )
+    parser.add_argument(
+        "--slowest",
+        type=int,
+        default=10,
+        help="Number of slowest queries to list (default: 10)",
+    )
+    parser.add_argument(
+        "--max-tick-ms",
+        type=float,
+        help="Fail if evaluating all alerts takes longer than this",
+    )
+    parser.add_argument(
+        "--max-alert-ms",
+        type=float,
+        help="Fail if any single query takes longer than this",
+    )
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+    args = parser.parse_args(argv)
+
+    setup_logging(level="WARNING", format="text")
+    try:
+        scanner = Scanner(load_config(args.config))
+        report = asyncio.run(dry_run_async(scanner, timeout=args.timeout))
+    except Exception as e:
+        print(f"Error running dry run: {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report.to_dict(args.slowest), indent=2, default=str))
+    else:
+        print(report.format(args.slowest))
+
+    failures = [f"{len(report.errors)} queries failed"] if report.errors else []
+    if args.max_tick_ms is not None and report.seconds * 1000 > args.max_tick_ms:
+        failures.append(
+            f"tick took {report.seconds * 1000:.1f} ms "
+            f"(budget {args.max_tick_ms:g} ms)"
+        )
+    if args.max_alert_ms is not None:
+        slow = [
+            result
+            for result in report.results
+            if result.seconds * 1000 > args.max_alert_ms
+        ]
+        if slow:
+            failures.append(f"{len(slow)} queries over {args.max_alert_ms:g} ms")
+    if failures:
+        print("FAILED: " + "; ".join(failures), file=sys.stderr)
+        sys.exit(1)
+
+
+def bench_command(argv: List[str]) -> None:
+    """Run scan ticks against synthetic datasources and report throughput"""
+    parser = argparse.ArgumentParser(
+        prog="pysentinel bench",
+        description="Run scan ticks back to back against synthetic "
+        "datasources for a fixed time and report throughput and tick latency "
+        "percentiles. With a config file its alerts are used as they are, "
+        "with every datasource and channel replaced by a synthetic one.",
+    )
+    parser.add_argument(
+        "config",
+        nargs="?",
+        type=validate_config_file,
+        help="Configuration whose alerts to benchmark (default: generated)",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=10.0,
+        help="Seconds to run for (default: 10)",
+    )
+    parser.add_argument(
+        "--alerts",
+        type=int,
+        default=1000,
+        help="Alerts to generate without a config (default: 1000)",
+    )
+    parser.add_argument(
+        "--datasources",
+        type=int,
+        default=10,
+        help="Datasources to generate without a config (default: 10)",
+    )
+    parser.add_argument(
+        "--violation-rate",
+        type=float,
+        default=0.01,
+        help="Share of generated alerts that fire (default: 0.01)",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated query latency (default: 0)",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Share of simulated queries that fail (default: 0)",
+    )
+    parser.add_argument(
+        "--max-p99-ms",
+        type=float,
+        help="Exit with 1 if the p99 tick time exceeds this",
+    )
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+    args = parser.parse_args(argv)
+
+    setup_logging(level="ERROR", format="text")
+    try:
+        if args.config:
+            config = synthetic_config(
+                load_config(args.config), args.latency_ms, args.error_rate
+            )
+        else:
+            config = generated_config(
+                args.alerts,
+                max(1, args.datasources),
+                args.violation_rate,
+                args.latency_ms,
+                args.error_rate,
+            )
+        scanner = bench_scanner(config)
+        result = asyncio.run(bench_async(scanner, args.duration))
+    except Exception as e:
+        print(f"Error running benchmark: {e}")
+        sys.exit(1)
+
+    stats = result.to_dict()
+    print(json.dumps(stats, indent=2) if args.json else result.format())
+    if args.max_p99_ms is not None and stats["tick_p99_ms"] > args.max_p99_ms:
+        print(
+            f"FAILED: p99 tick {stats['tick_p99_ms']:.1f} ms "
+            f"(budget {args.max_p99_ms:g} ms)",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+COMMANDS = {"bench": bench_command, "dry-run": dry_run_command}
+
+
 def main() -> None:
     """Main CLI entry point"""
+    # Subcommands are dispatched before parsing, so a config file path stays
+    # the first positional argument of the default run command
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        COMMANDS[sys.argv[1]](sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description="PySentinel - Threshold-based alerting scanner",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -61,6 +268,10 @@ Examples:
   pysentinel config.yml                 # Run synchronously
   pysentinel config.yml --async         # Run asynchronously
   pysentinel /path/to/config.json       # Use JSON config
+  pysentinel config.yml --watch         # Reload when the file changes
+  pysentinel config.yml --reload 1234   # Make running PID 1234 reload
+  pysentinel dry-run config.yml         # Time every alert once, no notifications
+  pysentinel bench config.yml           # Tick throughput on synthetic datasources
         """,
     )
 
@@ -77,6 +288,40 @@ Examples:
         help="Run scanner asynchronously (non-blocking)",
     )
 
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Reload the configuration whenever the file changes",
+    )
+
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between config file checks with --watch (default: 5)",
+    )
+
+    parser.add_argument(
+        "--reload",
+        metavar="PID",
+        type=int,
+        help="Signal a running scanner to reload its configuration and exit",
+    )
+
+    parser.add_argument(
+        "--log-format",
+        choices=["json", "text"],
+        help="Log output format, overriding global.logging (default: json)",
+    )
+
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        type=str.upper,
+        help="Minimum level of scanner log messages, overriding global.logging "
+        "(default: INFO)",
+    )
+
     parser.add_argument("--version", action="version", version="PySentinel CLI 0.1.0")
 
     # Additional validation for async mode
@@ -85,10 +330,28 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.reload is not None:
+        send_reload_signal(args.reload)
+        return
+
+    # Logs are written by a background thread so the scan loop never waits on I/O.
+    # The scanner reinstalls it from global.logging once the config is loaded,
+    # with any flags given here taking precedence.
+    setup_logging(level=args.log_level or "INFO", format=args.log_format or "json")
+    logging_overrides = {
+        key: value
+        for key, value in (("level", args.log_level), ("format", args.log_format))
+        if value is not None
+    }
+
+    # Only pass the interval when watching, so the plain call stays unchanged
+    kwargs = {"watch_interval": args.watch_interval} if args.watch else {}
+    if logging_overrides:
+        kwargs["logging_overrides"] = logging_overrides
     if args.run_async:
-        asyncio.run(start_scanner_async(args.config))
+        asyncio.run(start_scanner_async(args.config, **kwargs))
     else:
-        start_scanner_sync(args.config)
+        start_scanner_sync(args.config, **kwargs)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,177 @@
+"""
+``pysentinel dry-run``: evaluate every alert once against the configured
+datasources without notifying anyone, and report how long each query took.
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from pysentinel.core.scanner import Scanner
+from pysentinel.core.threshold import AlertDefinition
+
+
+class AlertResult(NamedTuple):
+    alert: str
+    datasource: str
+    query: str
+    seconds: float
+    # Size of the fetch result serialized as JSON
+    result_bytes: int
+    # None when the query failed or the metric was missing from the result
+    breached: Optional[bool]
+    error: Optional[str] = None
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class DryRunReport:
+    def __init__(self, results: List[AlertResult], seconds: float, skipped: Dict):
+        self.results = results
+        # Wall time of the whole run, i.e. what one scan tick would take
+        self.seconds = seconds
+        # alert name -> why it was not evaluated
+        self.skipped = skipped
+
+    @property
+    def errors(self) -> List[AlertResult]:
+        return [result for result in self.results if result.error]
+
+    def slowest(self, count: int = 10) -> List[AlertResult]:
+        return sorted(self.results, key=lambda result: -result.seconds)[:count]
+
+    def by_datasource(self) -> Dict[str, Dict]:
+        grouped: Dict[str, List[AlertResult]] = {}
+        for result in self.results:
+            grouped.setdefault(result.datasource, []).append(result)
+        summary = {}
+        for name, results in grouped.items():
+            seconds = [result.seconds for result in results]
+            summary[name] = {
+                "alerts": len(results),
+                "errors": sum(1 for result in results if result.error),
+                "total_ms": sum(seconds) * 1000,
+                "p50_ms": percentile(seconds, 0.5) * 1000,
+                "max_ms": max(seconds) * 1000,
+                "result_bytes": sum(result.result_bytes for result in results),
+            }
+        return summary
+
+    def to_dict(self, slowest: int = 10) -> Dict:
+        return {
+            "tick_ms": self.seconds * 1000,
+            "alerts": [result._asdict() for result in self.results],
+            "datasources": self.by_datasource(),
+            "slowest": [result.alert for result in self.slowest(slowest)],
+            "skipped": self.skipped,
+            "errors": len(self.errors),
+        }
+
+    def format(self, slowest: int = 10) -> str:
+        lines = [
+            f"Evaluated {len(self.results)} alerts in {self.seconds * 1000:.1f} ms "
+            f"({len(self.errors)} errors, {len(self.skipped)} skipped)",
+            "",
+            f"{'datasource':<24} {'alerts':>6} {'errors':>6} {'total ms':>10} "
+            f"{'p50 ms':>9} {'max ms':>9} {'bytes':>10}",
+        ]
+        for name, stats in sorted(self.by_datasource().items()):
+            lines.append(
+                f"{name:<24} {stats['alerts']:>6} {stats['errors']:>6} "
+                f"{stats['total_ms']:>10.1f} {stats['p50_ms']:>9.1f} "
+                f"{stats['max_ms']:>9.1f} {stats['result_bytes']:>10}"
+            )
+        lines += ["", f"Slowest {min(slowest, len(self.results))} queries:"]
+        for result in self.slowest(slowest):
+            if result.error:
+                outcome = f"error: {result.error}"
+            elif result.breached is None:
+                outcome = "metric missing"
+            else:
+                outcome = "BREACHED" if result.breached else "ok"
+            lines.append(
+                f"  {result.seconds * 1000:>9.1f} ms  {result.alert} "
+                f"[{result.datasource}] {outcome}"
+            )
+        for alert, reason in sorted(self.skipped.items()):
+            lines.append(f"  skipped {alert}: {reason}")
+        return "\n".join(lines)
+
+
+async def _evaluate(
+    scanner: Scanner, alert_def: AlertDefinition, timeout: float
+) -> AlertResult:
+    datasource = scanner.datasources[alert_def.datasource]
+    start = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(datasource.fetch_data(alert_def.query), timeout)
+    except Exception as e:
+        error = str(e) or type(e).__name__
+        return AlertResult(
+            alert_def.name,
+            alert_def.datasource,
+            alert_def.query,
+            time.perf_counter() - start,
+            0,
+            None,
+            error,
+        )
+    seconds = time.perf_counter() - start
+    breached = None
+    if alert_def.metrics in result:
+        breached = alert_def.check_threshold(result[alert_def.metrics])
+    return AlertResult(
+        alert_def.name,
+        alert_def.datasource,
+        alert_def.query,
+        seconds,
+        len(json.dumps(result, default=str)),
+        breached,
+    )
+
+
+async def _evaluate_datasource(
+    scanner: Scanner, alerts: List[AlertDefinition], timeout: float
+) -> List[AlertResult]:
+    # Sequential per datasource and concurrent across them, as in a scan tick
+    return [await _evaluate(scanner, alert_def, timeout) for alert_def in alerts]
+
+
+async def dry_run_async(scanner: Scanner, timeout: float = 30.0) -> DryRunReport:
+    """
+    Fetch and evaluate every enabled alert once. Violations are computed
+    but never recorded or sent, so no channel is contacted.
+    """
+    skipped = {}
+    by_datasource: Dict[str, List[AlertDefinition]] = {}
+    for alert_def in scanner.alert_definitions:
+        if not alert_def.enabled:
+            skipped[alert_def.name] = "alert disabled"
+        elif alert_def.datasource not in scanner.datasources:
+            skipped[alert_def.name] = f"datasource '{alert_def.datasource}' not found"
+        else:
+            by_datasource.setdefault(alert_def.datasource, []).append(alert_def)
+
+    start = time.perf_counter()
+    try:
+        groups = await asyncio.gather(
+            *(
+                _evaluate_datasource(scanner, alerts, timeout)
+                for alerts in by_datasource.values()
+            )
+        )
+    finally:
+        seconds = time.perf_counter() - start
+        for datasource in scanner.datasources.values():
+            try:
+                await datasource.close()
+            except Exception:
+                pass
+    results = [result for group in groups for result in group]
+    return DryRunReport(results, seconds, skipped)
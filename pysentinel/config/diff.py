@@ -0,0 +1,31 @@
+from typing import Dict, List, NamedTuple
+
+
+class SectionDiff(NamedTuple):
+    """Names added, removed, changed and unchanged between two config sections"""
+
+    added: List[str]
+    removed: List[str]
+    changed: List[str]
+    unchanged: List[str]
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": self.changed,
+        }
+
+
+def diff_section(old: Dict[str, Dict], new: Dict[str, Dict]) -> SectionDiff:
+    """Compare two ``name -> config`` mappings entry by entry"""
+    old = old or {}
+    new = new or {}
+    added = [name for name in new if name not in old]
+    removed = [name for name in old if name not in new]
+    changed = []
+    unchanged = []
+    for name in new:
+        if name in old:
+            (changed if new[name] != old[name] else unchanged).append(name)
+    return SectionDiff(added, removed, changed, unchanged)
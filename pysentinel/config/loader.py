@@ -1,23 +1,45 @@
+import hashlib
 import json
+import marshal
+import os
+import stat
+import tempfile
 import yaml
 import logging
-from typing import Union, Dict
+from typing import Any, Optional, Union, Dict
 
+from pysentinel.config.validator import validate_config
 from pysentinel.utils.exception import ScannerException
 
 logger = logging.getLogger(__name__)
 
+try:
+    # libyaml's C loader parses large rule files roughly 10x faster
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader
 
-def load_config(config: Union[str, Dict]):
-    """Load configuration from file or dict"""
+# Bump when the snapshot layout or validation rules change
+SNAPSHOT_VERSION = b"pysentinel-config-2-marshal-%d" % marshal.version
+
+CACHE_ENV_VAR = "PYSENTINEL_CONFIG_CACHE"
+
+
+def load_config(config: Union[str, Dict], cache_dir: Optional[str] = None):
+    """
+    Load configuration from file or dict.
+
+    File configs are validated once and, when ``cache_dir`` (or the
+    ``PYSENTINEL_CONFIG_CACHE`` environment variable) is set, stored as a
+    marshal snapshot keyed by the file's content hash. Later loads of the
+    unchanged file read the snapshot and skip parsing and validation.
+    The cache directory is ignored unless it is owned by the current user
+    and not writable by anyone else.
+    """
     _config = None
     try:
         if isinstance(config, str):
-            with open(config, "r") as f:
-                if config.endswith(".yaml") or config.endswith(".yml"):
-                    _config = yaml.safe_load(f)
-                else:
-                    _config = json.load(f)
+            _config = _load_file(config, cache_dir or os.getenv(CACHE_ENV_VAR))
         else:
             _config = config
 
@@ -26,3 +48,93 @@ def load_config(config: Union[str, Dict]):
 
     except Exception as e:
         raise ScannerException(f"Failed to load configuration: {e}")
+
+
+def _load_file(path: str, cache_dir: Optional[str]) -> Dict:
+    with open(path, "rb") as f:
+        raw = f.read()
+    is_yaml = path.endswith(".yaml") or path.endswith(".yml")
+
+    if not cache_dir or not _is_private_dir(cache_dir):
+        return validate_config(_parse(raw, is_yaml))
+
+    digest = hashlib.sha256(
+        SNAPSHOT_VERSION + (b"yaml" if is_yaml else b"json") + raw
+    ).digest()
+    snapshot_path = _snapshot_path(path, cache_dir)
+    cached = _read_snapshot(snapshot_path, digest)
+    if cached is not None:
+        logger.debug(f"Loaded configuration snapshot {snapshot_path}")
+        return cached
+
+    _config = validate_config(_parse(raw, is_yaml))
+    _write_snapshot(snapshot_path, digest, _config)
+    return _config
+
+
+def _parse(raw: bytes, is_yaml: bool) -> Any:
+    if is_yaml:
+        return yaml.load(raw, Loader=YAMLLoader)
+    return json.loads(raw)
+
+
+def _is_private_dir(directory: str) -> bool:
+    """Snapshots replace validation, so only trust a directory nobody else can write"""
+    try:
+        st = os.stat(directory)
+    except FileNotFoundError:
+        # Created private by _write_snapshot
+        return True
+    if not hasattr(os, "getuid"):  # pragma: no cover - no POSIX ownership
+        return True
+    if st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        logger.warning(
+            f"Ignoring config cache {directory}: it must be owned by the "
+            "current user and not writable by group or others"
+        )
+        return False
+    return True
+
+
+def _snapshot_path(path: str, cache_dir: str) -> str:
+    # One snapshot per source file; a stale one is simply overwritten
+    name = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:32]
+    return os.path.join(cache_dir, f"{name}.snapshot")
+
+
+def _read_snapshot(snapshot_path: str, digest: bytes) -> Optional[Dict]:
+    try:
+        with open(snapshot_path, "rb") as f:
+            if f.read(len(digest)) != digest:
+                return None
+            return marshal.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable config snapshot {snapshot_path}: {e}")
+        return None
+
+
+def _write_snapshot(snapshot_path: str, digest: bytes, config: Dict):
+    directory = os.path.dirname(snapshot_path)
+    try:
+        # marshal only holds plain data; YAML dates and the like are not cached
+        data = marshal.dumps(config)
+    except ValueError as e:
+        logger.debug(f"Not caching configuration snapshot: {e}")
+        return
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not _is_private_dir(directory):
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(digest)
+                f.write(data)
+            os.replace(tmp_path, snapshot_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write config snapshot {snapshot_path}: {e}")
@@ -1,4 +1,10 @@
-from typing import Dict
+import logging
+from typing import Dict, List
+
+from pysentinel.utils.constants import Severity
+from pysentinel.utils.exception import ScannerException
+
+logger = logging.getLogger(__name__)
 
 
 def get_config(self) -> Dict:
@@ -24,3 +30,176 @@ def sanitize_config(self, config: Dict) -> Dict:
         return obj
 
     return remove_sensitive(sanitized)
+
+
+SECTIONS = ("global", "datasources", "alert_channels", "alert_groups")
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# Fakes for benchmarks and tests; a configuration file cannot use them
+TEST_ONLY_TYPES = ("synthetic",)
+
+REQUIRED_ALERT_FIELDS = (
+    "name",
+    "metrics",
+    "query",
+    "datasource",
+    "threshold",
+    "severity",
+    "interval",
+    "alert_channels",
+    "description",
+)
+
+
+def validate_config(config: Dict) -> Dict:
+    """
+    Check the structure of a loaded configuration.
+
+    Unknown top-level keys are allowed. Structural problems are collected
+    and reported together in a single ScannerException. An invalid alert
+    only costs that alert: it is logged and left out of the returned
+    config, which is otherwise the one passed in.
+    """
+    if not isinstance(config, dict):
+        raise ScannerException("Configuration must be a mapping")
+
+    errors = []
+    for section in SECTIONS:
+        if config.get(section) is not None and not isinstance(config[section], dict):
+            errors.append(f"'{section}' must be a mapping")
+
+    for kind in ("datasources", "alert_channels"):
+        entries = config.get(kind)
+        if not isinstance(entries, dict):
+            continue
+        for name, entry in entries.items():
+            if not isinstance(entry, dict):
+                errors.append(f"{kind}.{name} must be a mapping")
+            elif "type" not in entry:
+                errors.append(f"{kind}.{name} is missing 'type'")
+            elif entry["type"] in TEST_ONLY_TYPES:
+                errors.append(
+                    f"{kind}.{name} has type '{entry['type']}', "
+                    "which is only available to pysentinel bench"
+                )
+
+    errors.extend(_validate_executors(config))
+    errors.extend(_validate_logging(config))
+
+    groups = config.get("alert_groups")
+    if isinstance(groups, dict):
+        for group_name, group in groups.items():
+            errors.extend(_validate_group(group_name, group))
+
+    if errors:
+        raise ScannerException("Invalid configuration: " + "; ".join(errors))
+    return _skip_invalid_alerts(config)
+
+
+def _validate_executors(config: Dict) -> List[str]:
+    global_config = config.get("global")
+    executors = (
+        global_config.get("executors", {}) if isinstance(global_config, dict) else {}
+    )
+    if not isinstance(executors, dict):
+        return ["global.executors must be a mapping"]
+    errors = []
+    for name, executor in executors.items():
+        if not isinstance(executor, dict):
+            errors.append(f"global.executors.{name} must be a mapping")
+        elif executor.get("type", "thread") not in ("thread", "process"):
+            errors.append(f"global.executors.{name}.type must be thread or process")
+        elif name == "default" and executor.get("type", "thread") != "thread":
+            # The scanner runs closures on it, which cannot be pickled
+            errors.append("global.executors.default.type must be thread")
+
+    datasources = config.get("datasources")
+    if not isinstance(datasources, dict):
+        return errors
+    known = set(executors) | {"default"}
+    for name, datasource in datasources.items():
+        offload = datasource.get("offload") if isinstance(datasource, dict) else None
+        if (
+            isinstance(offload, dict)
+            and offload.get("executor", "default") not in known
+        ):
+            errors.append(
+                f"datasources.{name}.offload.executor "
+                f"'{offload['executor']}' is not defined in global.executors"
+            )
+    return errors
+
+
+def _validate_logging(config: Dict) -> List[str]:
+    global_config = config.get("global")
+    if not isinstance(global_config, dict) or "logging" not in global_config:
+        return []
+    logging_config = global_config["logging"]
+    if not isinstance(logging_config, dict):
+        return ["global.logging must be a mapping"]
+    errors = []
+    if str(logging_config.get("level", "INFO")).upper() not in LOG_LEVELS:
+        errors.append(f"global.logging.level must be one of {', '.join(LOG_LEVELS)}")
+    if logging_config.get("format", "json") not in ("json", "text"):
+        errors.append("global.logging.format must be json or text")
+    if not isinstance(logging_config.get("queue_size", 1), int):
+        errors.append("global.logging.queue_size must be an integer")
+    rate_limit = logging_config.get("rate_limit", {})
+    if not isinstance(rate_limit, dict):
+        errors.append("global.logging.rate_limit must be a mapping")
+    else:
+        for key in ("interval", "burst"):
+            value = rate_limit.get(key, 0)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                errors.append(f"global.logging.rate_limit.{key} must be a number")
+    return errors
+
+
+def _validate_group(group_name: str, group) -> List[str]:
+    if not isinstance(group, dict):
+        return [f"alert_groups.{group_name} must be a mapping"]
+    alerts = group.get("alerts", [])
+    if not isinstance(alerts, list):
+        return [f"alert_groups.{group_name}.alerts must be a list"]
+    return []
+
+
+def _alert_problems(alert) -> List[str]:
+    if not isinstance(alert, dict):
+        return ["must be a mapping"]
+    problems = []
+    missing = [field for field in REQUIRED_ALERT_FIELDS if field not in alert]
+    if missing:
+        problems.append(f"is missing {', '.join(missing)}")
+    severities = {severity.value for severity in Severity}
+    if "severity" in alert and alert["severity"] not in severities:
+        problems.append(f"has unknown severity '{alert['severity']}'")
+    if "threshold" in alert and not isinstance(alert["threshold"], dict):
+        problems.append("threshold must be a mapping")
+    if "alert_channels" in alert and not isinstance(alert["alert_channels"], list):
+        problems.append("alert_channels must be a list")
+    return problems
+
+
+def _skip_invalid_alerts(config: Dict) -> Dict:
+    groups = config.get("alert_groups") or {}
+    filtered = {}
+    for group_name, group in groups.items():
+        alerts = group.get("alerts", [])
+        valid = []
+        for index, alert in enumerate(alerts):
+            problems = _alert_problems(alert)
+            if not problems:
+                valid.append(alert)
+                continue
+            logger.error(
+                f"Skipping alert_groups.{group_name}.alerts[{index}]: "
+                + "; ".join(problems)
+            )
+        if len(valid) != len(alerts):
+            filtered[group_name] = {**group, "alerts": valid}
+    if not filtered:
+        return config
+    # Copies, so the caller's dict is never modified
+    return {**config, "alert_groups": {**groups, **filtered}}
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import os
+import signal
+from typing import Awaitable, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ReloadCallback = Callable[[], Awaitable[object]]
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    # The inode changes when editors or config management replace the file
+    return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
+
+class ConfigWatcher:
+    """
+    Polls a config file and calls ``on_change`` when it is modified.
+
+    Change detection only stats the file (mtime, inode and size), so it
+    is cheap enough to run every few seconds. A file that disappears is
+    ignored until it comes back, which covers atomic rename-into-place.
+    """
+
+    def __init__(self, path: str, on_change: ReloadCallback, interval: float = 5.0):
+        self.path = path
+        self.on_change = on_change
+        self.interval = interval
+        self._signature = _file_signature(path)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def changed(self) -> bool:
+        """Return True (once) if the file changed since the last check"""
+        signature = _file_signature(self.path)
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        return True
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            if not self.changed():
+                continue
+            logger.info(f"Configuration file {self.path} changed, reloading")
+            try:
+                await self.on_change()
+            except Exception as e:
+                logger.error(f"Failed to reload configuration: {e}")
+
+
+def install_reload_signal(on_reload: ReloadCallback) -> bool:
+    """
+    Call ``on_reload`` on SIGHUP. Returns False where signal handlers
+    can't be installed (Windows, or a loop outside the main thread).
+    """
+    if not hasattr(signal, "SIGHUP"):
+        return False
+    loop = asyncio.get_running_loop()
+
+    def handle():
+        logger.info("Received SIGHUP, reloading configuration")
+        task = loop.create_task(on_reload())
+        task.add_done_callback(_log_reload_failure)
+
+    try:
+        loop.add_signal_handler(signal.SIGHUP, handle)
+    except (NotImplementedError, RuntimeError, ValueError):
+        return False
+    return True
+
+
+def _log_reload_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Failed to reload configuration: {task.exception()}")
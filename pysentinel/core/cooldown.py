@@ -0,0 +1,104 @@
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from pysentinel.core.threshold import Violation
+
+# Violation fields that identify "the same alert" unless configured otherwise
+DEFAULT_FINGERPRINT = ("datasource_name", "alert_name")
+
+
+class CooldownTracker:
+    """
+    Self-expiring notification cooldowns keyed by violation fingerprint.
+
+    A fingerprint is the tuple of the configured ``Violation`` fields, so
+    grouping on fewer fields (e.g. just ``alert_name``) dedups an alert
+    across datasources. Expiry times come from a monotonic clock and are
+    kept in a min-heap; expired entries are popped on every check, so the
+    map only holds fingerprints that are currently cooling down and
+    lookups stay O(1).
+
+    Cooldowns resolve per alert, then per alert group, then the default.
+    """
+
+    def __init__(
+        self,
+        default_seconds: float = 300.0,
+        fingerprint_fields: Sequence[str] = DEFAULT_FINGERPRINT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.default_seconds = default_seconds
+        self.fingerprint_fields = tuple(fingerprint_fields)
+        self.alert_cooldowns: Dict[str, float] = {}
+        self.group_cooldowns: Dict[str, float] = {}
+        self.group_fingerprints: Dict[str, Tuple[str, ...]] = {}
+        self.suppressed = 0
+
+        self._clock = clock
+        self._expiry: Dict[Hashable, float] = {}
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._counter = itertools.count()
+
+    def fingerprint(self, violation: Violation) -> Tuple:
+        fields = self.group_fingerprints.get(
+            violation.alert_group, self.fingerprint_fields
+        )
+        return tuple(getattr(violation, field) for field in fields)
+
+    def cooldown_for(self, violation: Violation) -> float:
+        seconds = self.alert_cooldowns.get(violation.alert_name)
+        if seconds is None:
+            seconds = self.group_cooldowns.get(violation.alert_group)
+        return self.default_seconds if seconds is None else seconds
+
+    def should_notify(self, violation: Violation) -> bool:
+        """Return True and start a cooldown unless one is already running"""
+        return self.acquire(self.fingerprint(violation), self.cooldown_for(violation))
+
+    def acquire(self, key: Hashable, seconds: Optional[float] = None) -> bool:
+        now = self._clock()
+        self._expire(now)
+        if key in self._expiry:
+            self.suppressed += 1
+            return False
+        seconds = self.default_seconds if seconds is None else seconds
+        if seconds > 0:
+            expires = now + seconds
+            self._expiry[key] = expires
+            heapq.heappush(self._heap, (expires, next(self._counter), key))
+        return True
+
+    def remaining(self, key: Hashable) -> float:
+        """Seconds left on the cooldown for ``key`` (0 if none)"""
+        expires = self._expiry.get(key)
+        return max(0.0, expires - self._clock()) if expires is not None else 0.0
+
+    def reset(self, key: Hashable):
+        """Clear the cooldown for ``key``; its heap entry is dropped lazily"""
+        self._expiry.pop(key, None)
+        if len(self._heap) > 2 * len(self._expiry) + 64:
+            self._heap = [
+                entry for entry in self._heap if self._expiry.get(entry[2]) == entry[0]
+            ]
+            heapq.heapify(self._heap)
+
+    def clear(self):
+        self._expiry.clear()
+        self._heap.clear()
+
+    def _expire(self, now: float):
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expires, _, key = heapq.heappop(heap)
+            if self._expiry.get(key) == expires:
+                del self._expiry[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        self._expire(self._clock())
+        return key in self._expiry
+
+    def __len__(self) -> int:
+        self._expire(self._clock())
+        return len(self._expiry)
@@ -0,0 +1,279 @@
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from pysentinel.channels.base import AlertChannel
+from pysentinel.channels.digest import DigestChannel
+from pysentinel.core.threshold import Violation
+from pysentinel.utils import tracing
+from pysentinel.utils.metrics import MetricsRegistry
+from pysentinel.utils.outbox import NotificationOutbox, idempotency_key
+
+logger = logging.getLogger(__name__)
+
+ChannelTarget = Tuple[str, AlertChannel]
+
+
+class _ChannelStats:
+    __slots__ = ("sent", "failed", "timed_out", "latency_total", "latency_max")
+
+    def __init__(self):
+        self.sent = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def to_dict(self) -> Dict:
+        attempts = self.sent + self.failed + self.timed_out
+        return {
+            "sent": self.sent,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "avg_latency_ms": (
+                self.latency_total / attempts * 1000 if attempts else 0.0
+            ),
+            "max_latency_ms": self.latency_max * 1000,
+        }
+
+
+class NotificationDispatcher:
+    """
+    Delivers violations to alert channels off the scan loop.
+
+    Violations are put on a bounded ``asyncio.Queue`` and a pool of worker
+    tasks sends each one to all of its channels concurrently, with a timeout
+    per channel. When the queue is full new notifications are dropped and
+    counted rather than blocking the scan.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        send_timeout: float = 10.0,
+        channel_timeouts: Optional[Dict[str, float]] = None,
+        outbox: Optional[NotificationOutbox] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+        self.channel_timeouts: Dict[str, float] = dict(channel_timeouts or {})
+        self.outbox = outbox
+
+        self.submitted = 0
+        self.dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._channel_stats: Dict[str, _ChannelStats] = {}
+        self._queue_latency_total = 0.0
+        self._dequeued = 0
+        self._in_flight: Set[str] = set()
+        # Keys buffered by a digest whose batch has not been sent yet
+        self._awaiting_digest: Set[str] = set()
+
+        self._send_seconds = None
+        self._results = None
+        self._dropped = None
+        if metrics is not None:
+            self._send_seconds = metrics.histogram(
+                "pysentinel_notification_send_seconds",
+                "Time to send one notification, per channel",
+                ["channel"],
+            )
+            self._results = metrics.counter(
+                "pysentinel_notifications",
+                "Notification attempts by channel and result",
+                ["channel", "result"],
+            )
+            self._dropped = metrics.counter(
+                "pysentinel_notifications_dropped",
+                "Notifications dropped because the queue was full",
+            )
+            metrics.gauge(
+                "pysentinel_notification_queue_depth",
+                "Notifications waiting for a worker",
+            ).set_function(self.queue_depth)
+
+    @property
+    def running(self) -> bool:
+        return bool(self._worker_tasks)
+
+    async def start(self):
+        """Start the worker pool on the running event loop"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+
+    async def stop(self, drain_timeout: float = 5.0):
+        """Stop the workers, giving queued notifications a chance to go out"""
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Dropping {self._queue.qsize()} queued notifications on shutdown"
+            )
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    def submit(self, violation: Violation, channels: Sequence[ChannelTarget]) -> bool:
+        """Queue a violation for delivery; returns False if it was dropped"""
+        if self.outbox is not None:
+            # Replays must not duplicate a delivery that is already queued
+            channels = [
+                (name, channel)
+                for name, channel in channels
+                if idempotency_key(violation.violation_id, name) not in self._in_flight
+            ]
+            if not channels:
+                return True
+            self._in_flight.update(
+                idempotency_key(violation.violation_id, name) for name, _ in channels
+            )
+        try:
+            self._queue.put_nowait(
+                (violation, channels, time.monotonic(), tracing.current_span())
+            )
+        except asyncio.QueueFull:
+            self._release(violation, channels)
+            self.dropped += 1
+            if self._dropped is not None:
+                self._dropped.inc()
+            logger.warning(
+                f"Notification queue full, dropping alert {violation.alert_name}"
+            )
+            return False
+        self.submitted += 1
+        return True
+
+    async def deliver(
+        self, violation: Violation, channels: Sequence[ChannelTarget]
+    ) -> Dict[str, bool]:
+        """Send a violation to all channels in parallel and wait for the results"""
+        results = await asyncio.gather(
+            *(self._send(name, channel, violation) for name, channel in channels)
+        )
+        return {name: ok for (name, _), ok in zip(channels, results)}
+
+    async def _worker(self):
+        while True:
+            violation, channels, enqueued_at, parent = await self._queue.get()
+            try:
+                self._queue_latency_total += time.monotonic() - enqueued_at
+                self._dequeued += 1
+                # Sends join the trace of the tick that raised the violation
+                with tracing.use_span(parent):
+                    await self.deliver(violation, channels)
+            except Exception as e:
+                logger.error(f"Error dispatching alert {violation.alert_name}: {e}")
+            finally:
+                self._release(violation, channels)
+                self._queue.task_done()
+
+    def _release(self, violation: Violation, channels: Sequence[ChannelTarget]):
+        if self.outbox is not None:
+            for name, _ in channels:
+                key = idempotency_key(violation.violation_id, name)
+                # A buffered notification stays in flight until its batch is sent
+                if key not in self._awaiting_digest:
+                    self._in_flight.discard(key)
+
+    def _digest_delivered(
+        self, name: str, violations: List[Violation], results: List[bool]
+    ):
+        for violation, ok in zip(violations, results):
+            key = idempotency_key(violation.violation_id, name)
+            if key not in self._awaiting_digest:
+                continue
+            self._awaiting_digest.discard(key)
+            self._in_flight.discard(key)
+            if ok:
+                self.outbox.mark_delivered(violation.violation_id, name)
+            else:
+                self.outbox.mark_failed(
+                    violation.violation_id, name, "digest batch failed"
+                )
+
+    async def _send(self, name: str, channel: AlertChannel, violation: Violation):
+        with tracing.span("send", channel=name) as send_span:
+            stats = self._channel_stats.get(name)
+            if stats is None:
+                stats = self._channel_stats[name] = _ChannelStats()
+
+            timeout = self.channel_timeouts.get(name) or self.send_timeout
+            start = time.monotonic()
+            ok = False
+            error = None
+            result = "failed"
+            # A digest only buffers the violation, so the outbox row is
+            # settled when the batch is sent, not now
+            deferred = self.outbox is not None and isinstance(channel, DigestChannel)
+            if deferred:
+                channel.on_delivered = partial(self._digest_delivered, name)
+                self._awaiting_digest.add(idempotency_key(violation.violation_id, name))
+            try:
+                ok = await asyncio.wait_for(channel.send_alert(violation), timeout)
+                ok = ok is not False
+                if ok:
+                    stats.sent += 1
+                    result = "sent"
+                else:
+                    stats.failed += 1
+                    error = "channel reported failure"
+            except asyncio.TimeoutError:
+                stats.timed_out += 1
+                result = "timed_out"
+                error = f"timed out after {timeout}s"
+                logger.error(f"Timed out sending alert via {name} after {timeout}s")
+            except Exception as e:
+                stats.failed += 1
+                error = str(e)
+                logger.error(f"Error sending alert via {name}: {e}")
+            finally:
+                if self.outbox is not None and not (deferred and ok):
+                    if deferred:
+                        self._awaiting_digest.discard(
+                            idempotency_key(violation.violation_id, name)
+                        )
+                    if ok:
+                        self.outbox.mark_delivered(violation.violation_id, name)
+                    else:
+                        self.outbox.mark_failed(violation.violation_id, name, error)
+                elapsed = time.monotonic() - start
+                stats.latency_total += elapsed
+                stats.latency_max = max(stats.latency_max, elapsed)
+                if self._send_seconds is not None:
+                    self._send_seconds.labels(name).observe(elapsed)
+                    self._results.labels(name, result).inc()
+            send_span.set_attribute("result", result)
+            return ok
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    def get_stats(self) -> Dict:
+        return {
+            "queue_depth": self.queue_depth(),
+            "max_queue_size": self.max_queue_size,
+            "workers": len(self._worker_tasks),
+            "submitted": self.submitted,
+            "dropped": self.dropped,
+            "avg_queue_latency_ms": (
+                self._queue_latency_total / self._dequeued * 1000
+                if self._dequeued
+                else 0.0
+            ),
+            "channels": {
+                name: stats.to_dict() for name, stats in self._channel_stats.items()
+            },
+        }
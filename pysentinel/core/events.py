@@ -0,0 +1,194 @@
+import asyncio
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+
+_CLOSED = object()
+
+
+class Backpressure(Enum):
+    """What a subscription does when its queue is full"""
+
+    # Discard the oldest queued event to make room
+    DROP_OLDEST = "drop_oldest"
+    # Make the producer wait until the subscriber catches up
+    BLOCK = "block"
+    # Keep only the latest event per key; a full queue drops the oldest key
+    COALESCE = "coalesce"
+
+
+class Subscription:
+    """
+    One consumer's view of a topic. Iterate it with ``async for``; the
+    iteration ends once the subscription (or the whole bus) is closed and
+    the events queued before that have been consumed.
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        topic: str,
+        max_size: int,
+        policy: Backpressure,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        if policy == Backpressure.COALESCE and key is None:
+            raise ValueError("Coalescing subscriptions need a key function")
+        self.bus = bus
+        self.topic = topic
+        self.max_size = max(1, max_size)
+        self.policy = policy
+        self.key = key
+        self.dropped = 0
+        self.closed = False
+        # The bound is enforced here rather than by the queue, so closing
+        # can always enqueue its sentinel
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._pending: Dict[Hashable, Any] = {}
+        self._space: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        if self.policy == Backpressure.COALESCE:
+            return len(self._pending)
+        return self._queue.qsize()
+
+    def offer(self, event: Any) -> bool:
+        """Queue an event without waiting; returns False if it was dropped"""
+        if self.closed:
+            return False
+        if self.policy == Backpressure.COALESCE:
+            key = self.key(event)
+            if key in self._pending:
+                self._pending[key] = event
+                return True
+            if len(self._pending) >= self.max_size:
+                self._pending.pop(self._queue.get_nowait())
+                self.dropped += 1
+            self._pending[key] = event
+            self._queue.put_nowait(key)
+            return True
+        if self._queue.qsize() >= self.max_size:
+            if self.policy == Backpressure.BLOCK:
+                self.dropped += 1
+                return False
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+        return True
+
+    async def put(self, event: Any):
+        """Queue an event, waiting for space under the BLOCK policy"""
+        if self.policy == Backpressure.BLOCK:
+            while not self.closed and self._queue.qsize() >= self.max_size:
+                if self._space is None:
+                    self._space = asyncio.Event()
+                self._space.clear()
+                await self._space.wait()
+        self.offer(event)
+
+    async def get(self) -> Any:
+        """Wait for the next event; raises StopAsyncIteration once closed"""
+        item = await self._queue.get()
+        if item is _CLOSED:
+            # Leave the sentinel for any other waiting reader
+            self._queue.put_nowait(_CLOSED)
+            raise StopAsyncIteration
+        if self._space is not None:
+            self._space.set()
+        if self.policy == Backpressure.COALESCE:
+            return self._pending.pop(item)
+        return item
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self.get()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self._queue.put_nowait(_CLOSED)
+        if self._space is not None:
+            self._space.set()
+        self.bus.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class EventBus:
+    """
+    In-process publish/subscribe with a queue per subscriber.
+
+    Producers call ``publish`` (or ``publish_nowait`` from sync code); a
+    topic with no subscribers costs one dict lookup. Each subscription
+    chooses its own bound and backpressure policy, so a slow consumer only
+    affects itself unless it asks for BLOCK.
+    """
+
+    def __init__(
+        self,
+        default_max_size: int = 1000,
+        default_policy: Backpressure = Backpressure.DROP_OLDEST,
+    ):
+        self.default_max_size = default_max_size
+        self.default_policy = default_policy
+        self._subscribers: Dict[str, List[Subscription]] = {}
+
+    def subscribe(
+        self,
+        topic: str,
+        max_size: Optional[int] = None,
+        policy: Union[Backpressure, str, None] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ) -> Subscription:
+        subscription = Subscription(
+            self,
+            topic,
+            max_size if max_size is not None else self.default_max_size,
+            Backpressure(policy) if policy is not None else self.default_policy,
+            key,
+        )
+        # Copy on write so publishing never iterates a list being modified
+        self._subscribers[topic] = self._subscribers.get(topic, []) + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscribers = self._subscribers.get(subscription.topic, [])
+        remaining = [s for s in subscribers if s is not subscription]
+        if remaining:
+            self._subscribers[subscription.topic] = remaining
+        else:
+            self._subscribers.pop(subscription.topic, None)
+
+    def has_subscribers(self, topic: str) -> bool:
+        return topic in self._subscribers
+
+    def subscriber_count(self, topic: str) -> int:
+        return len(self._subscribers.get(topic, ()))
+
+    async def publish(self, topic: str, event: Any):
+        subscribers = self._subscribers.get(topic)
+        if not subscribers:
+            return
+        for subscription in subscribers:
+            if subscription.policy == Backpressure.BLOCK:
+                await subscription.put(event)
+            else:
+                subscription.offer(event)
+
+    def publish_nowait(self, topic: str, event: Any):
+        """Publish without waiting; full BLOCK subscriptions drop the event"""
+        for subscription in self._subscribers.get(topic, ()):
+            subscription.offer(event)
+
+    def close(self):
+        """Close every subscription, ending their iteration"""
+        for subscribers in list(self._subscribers.values()):
+            for subscription in subscribers:
+                subscription.close()
@@ -0,0 +1,217 @@
+from collections import deque
+from itertools import islice
+from typing import Callable, Deque, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+
+
+class ViolationHistory:
+    """
+    Bounded ring buffer of violations with secondary indexes.
+
+    Violations are evicted oldest-first. Because the evicted violation is
+    always the oldest entry of every index it belongs to, eviction is a
+    ``popleft`` on each index deque and stays O(1) regardless of retention.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.total = 0  # Number of violations ever appended
+        self._ring: Deque[Violation] = deque()
+        self._by_id: Dict[str, Violation] = {}
+        self._by_alert: Dict[str, Deque[Violation]] = {}
+        self._by_datasource: Dict[str, Deque[Violation]] = {}
+        self._by_severity: Dict[Severity, Deque[Violation]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def __iter__(self) -> Iterator[Violation]:
+        return iter(self._ring)
+
+    def append(self, violation: Violation):
+        """Add a violation, evicting the oldest one when full"""
+        if len(self._ring) >= self.max_size:
+            self._evict()
+
+        self._ring.append(violation)
+        self._by_id[violation.violation_id] = violation
+        self._index(self._by_alert, violation.alert_name).append(violation)
+        self._index(self._by_datasource, violation.datasource_name).append(violation)
+        self._index(self._by_severity, violation.severity).append(violation)
+        self.total += 1
+
+    def get(self, violation_id: str) -> Optional[Violation]:
+        """Look up a retained violation by id"""
+        return self._by_id.get(violation_id)
+
+    def latest(self, limit: Optional[int] = None) -> List[Violation]:
+        """Return the most recent violations, oldest first"""
+        return self._tail(self._ring, limit)
+
+    def by_alert(self, alert_name: str, limit: Optional[int] = None) -> List[Violation]:
+        return self._tail(self._by_alert.get(alert_name), limit)
+
+    def by_datasource(
+        self, datasource_name: str, limit: Optional[int] = None
+    ) -> List[Violation]:
+        return self._tail(self._by_datasource.get(datasource_name), limit)
+
+    def by_severity(
+        self, severity: Severity, limit: Optional[int] = None
+    ) -> List[Violation]:
+        return self._tail(self._by_severity.get(severity), limit)
+
+    def query(
+        self,
+        alert_name: Optional[str] = None,
+        datasource_name: Optional[str] = None,
+        severity: Optional[Severity] = None,
+        limit: Optional[int] = None,
+    ) -> List[Violation]:
+        """
+        Return the most recent violations matching every given filter,
+        oldest first. Scans the smallest matching index, newest entries
+        first, and stops once ``limit`` matches are found.
+        """
+        candidates = [self._ring]
+        if alert_name is not None:
+            candidates.append(self._by_alert.get(alert_name))
+        if datasource_name is not None:
+            candidates.append(self._by_datasource.get(datasource_name))
+        if severity is not None:
+            candidates.append(self._by_severity.get(severity))
+        if any(not bucket for bucket in candidates):
+            return []
+        bucket = min(candidates, key=len)
+
+        def matches(violation: Violation) -> bool:
+            return (
+                (alert_name is None or violation.alert_name == alert_name)
+                and (
+                    datasource_name is None
+                    or violation.datasource_name == datasource_name
+                )
+                and (severity is None or violation.severity == severity)
+            )
+
+        recent = list(
+            islice(filter(matches, reversed(bucket)), limit if limit else None)
+        )
+        recent.reverse()
+        return recent
+
+    def clear(self):
+        self._ring.clear()
+        self._by_id.clear()
+        self._by_alert.clear()
+        self._by_datasource.clear()
+        self._by_severity.clear()
+
+    def _evict(self):
+        oldest = self._ring.popleft()
+        if self._by_id.get(oldest.violation_id) is oldest:
+            del self._by_id[oldest.violation_id]
+        self._unindex(self._by_alert, oldest.alert_name)
+        self._unindex(self._by_datasource, oldest.datasource_name)
+        self._unindex(self._by_severity, oldest.severity)
+
+    @staticmethod
+    def _index(index: Dict, key: Hashable) -> Deque[Violation]:
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = deque()
+        return bucket
+
+    @staticmethod
+    def _unindex(index: Dict, key: Hashable):
+        bucket = index[key]
+        bucket.popleft()
+        if not bucket:
+            del index[key]
+
+    @staticmethod
+    def _tail(bucket: Optional[Deque[Violation]], limit: Optional[int]):
+        if not bucket:
+            return []
+        if not limit or limit >= len(bucket):
+            return list(bucket)
+        recent = list(islice(reversed(bucket), limit))
+        recent.reverse()
+        return recent
+
+
+class ActiveViolations(dict):
+    """
+    Currently active violations keyed by (datasource, alert), with a
+    secondary violation_id index for O(1) acknowledgement.
+
+    ``listeners`` are called with ``(previous, current)`` whenever an
+    entry is replaced, added (previous is None) or removed (current is None).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._ids: Dict[str, Hashable] = {}
+        self.listeners: List[
+            Callable[[Optional[Violation], Optional[Violation]], None]
+        ] = []
+
+    def __setitem__(self, key: Hashable, violation: Violation):
+        previous = self.get(key)
+        if previous is not None:
+            self._ids.pop(previous.violation_id, None)
+        super().__setitem__(key, violation)
+        self._ids[violation.violation_id] = key
+        for listener in self.listeners:
+            listener(previous, violation)
+
+    def __delitem__(self, key: Hashable):
+        violation = self[key]
+        self._ids.pop(violation.violation_id, None)
+        super().__delitem__(key)
+        for listener in self.listeners:
+            listener(violation, None)
+
+    def pop(self, key: Hashable, *default):
+        if key in self:
+            violation = self[key]
+            del self[key]
+            return violation
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[Hashable, Violation]:
+        if not self:
+            raise KeyError("popitem(): no active violations")
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def setdefault(self, key: Hashable, violation: Violation) -> Violation:
+        if key not in self:
+            self[key] = violation
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        # dict.update would bypass __setitem__, and with it the listeners
+        for key, violation in dict(*args, **kwargs).items():
+            self[key] = violation
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        removed = list(self.values()) if self.listeners else []
+        self._ids.clear()
+        super().clear()
+        for violation in removed:
+            for listener in self.listeners:
+                listener(violation, None)
+
+    def find(self, violation_id: str) -> Optional[Violation]:
+        """Look up an active violation by its id"""
+        key = self._ids.get(violation_id)
+        return self.get(key) if key is not None else None
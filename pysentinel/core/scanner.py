@@ -2,25 +2,50 @@ import asyncio
 import logging
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Union, List, Callable, Optional
+from typing import Any, Dict, Union, List, Callable, Optional, Tuple, Type
 
+from pysentinel.api.server import APIServer
+from pysentinel.config.diff import diff_section
 from pysentinel.config.loader import load_config
+from pysentinel.config.validator import validate_config
+from pysentinel.config.watcher import ConfigWatcher, install_reload_signal
+from pysentinel.core.cooldown import DEFAULT_FINGERPRINT, CooldownTracker
+from pysentinel.core.dispatcher import NotificationDispatcher
+from pysentinel.core.events import Backpressure, EventBus
+from pysentinel.core.history import ActiveViolations, ViolationHistory
+from pysentinel.core.silence import Inhibitor, SilenceStore
+from pysentinel.core.snapshot import ScannerSnapshot, SnapshotPublisher
 from pysentinel.core.threshold import MetricData, Violation, AlertDefinition, Threshold
 from pysentinel.datasources.api import HTTPDataSource
 from pysentinel.datasources.base import DataSource
 from pysentinel.datasources.database import PostgreSQLDataSource
 from pysentinel.datasources.elasticsearch import ElasticsearchDataSource
+from pysentinel.datasources.offload import (
+    DEFAULT_MIN_BYTES,
+    OffloadPolicy,
+    create_executor,
+)
 from pysentinel.datasources.prometheus import PrometheusDataSource
 from pysentinel.datasources.redis import RedisDataSource
 from pysentinel.channels import Email, Slack, Webhook, Telegram
 from pysentinel.channels.base import AlertChannel
+from pysentinel.channels.digest import DigestChannel
 from pysentinel.utils.constants import Severity, ScannerStatus
-from pysentinel.utils.exception import DataSourceException, ThresholdException
+from pysentinel.utils.exception import (
+    DataSourceException,
+    ScannerException,
+    ThresholdException,
+)
 from pysentinel.utils.alert_db import AlertDB
+from pysentinel.utils.history_db import HistoryDB
+from pysentinel.utils.http_client import close_http_client
+from pysentinel.utils.logging import setup_logging_from_config
+from pysentinel.utils import tracing
+from pysentinel.utils.metrics import MetricsRegistry, MetricsServer
+from pysentinel.utils.outbox import NotificationOutbox
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -29,17 +54,29 @@ class Scanner:
     Scanner class to handle scanning operations.
     """
 
-    def __init__(self, config: Union[str, Dict] = None):
+    def __init__(
+        self,
+        config: Union[str, Dict] = None,
+        datasource_types: Optional[Dict[str, Type[DataSource]]] = None,
+        channel_types: Optional[Dict[str, Type[AlertChannel]]] = None,
+    ):
         self.status = ScannerStatus.STOPPED
+        # Extra types on top of the built-in factories, e.g. the synthetic
+        # fakes that only ``pysentinel bench`` and the tests register
+        self._datasource_types = dict(datasource_types or {})
+        self._channel_types = dict(channel_types or {})
         self.datasources: Dict[str, DataSource] = {}
         self.alert_channels: Dict[str, AlertChannel] = {}
         self.alert_groups: Dict[str, Dict] = {}
-        self.alert_definitions: List[AlertDefinition] = []
+        self._alert_definitions: List[AlertDefinition] = []
+        self._alert_definitions_by_name: Dict[str, AlertDefinition] = {}
 
         # Internal state
         self._running = False
         self._scan_task = None
         self._executor = ThreadPoolExecutor(max_workers=10)
+        # Named pools from global.executors; "default" is self._executor
+        self._executors: Dict[str, Executor] = {"default": self._executor}
         self.start_time = None
         self.last_scan_time = None
         self.thresholds: List[Threshold] = []
@@ -47,12 +84,39 @@ class Scanner:
 
         # Metrics and violations storage
         self._latest_metrics: Dict[str, MetricData] = {}
-        self._active_violations: Dict[str, Violation] = {}
-        self._violation_history: List[Violation] = []
+        self._active_violations = ActiveViolations()
         self._max_history = 1000
+        self._violation_history = ViolationHistory(self._max_history)
+        self._history_db: Optional[HistoryDB] = None
+        self._metric_store = None
+        # Immutable copy of the above for readers on other threads
+        self._snapshots = SnapshotPublisher()
+        self._active_violations.listeners.append(self._snapshots.violation_changed)
+
+        # Self-instrumentation, optionally served by an OpenMetrics endpoint
+        self.metrics = MetricsRegistry()
+        self._metrics_server: Optional[MetricsServer] = None
+        self._api_server: Optional[APIServer] = None
+        self._setup_instruments()
+        self._tracer = tracing.Tracer()
+
+        # Notification delivery
+        self._dispatcher = NotificationDispatcher(metrics=self.metrics)
+        self._outbox: Optional[NotificationOutbox] = None
+        self._outbox_retry_interval = 60.0
+        self._outbox_task = None
 
         # Alert cooldown tracking
-        self._alert_cooldowns: Dict[str, datetime] = {}
+        self._cooldowns = CooldownTracker()
+
+        # Silences and inhibition, checked before any notification work
+        self._silences = SilenceStore()
+        self._inhibitor = Inhibitor()
+        self._active_violations.listeners.append(self._inhibitor.violation_changed)
+        self._suppressed = {"silenced": 0, "inhibited": 0, "acknowledged": 0}
+
+        # Push-based streams of violations ("alerts") and fetches ("metrics")
+        self.events = EventBus()
 
         # Callbacks
         self._violation_callbacks: List[Callable[[Violation], None]] = []
@@ -61,6 +125,13 @@ class Scanner:
         # Configuration
         self._config = {}
         self._global_config = {}
+        self._config_silence_ids: List[str] = []
+        self._config_watcher: Optional[ConfigWatcher] = None
+        self._reload_lock: Optional[asyncio.Lock] = None
+        # File the configuration is reloaded from (SIGHUP, watch_config)
+        self.config_path: Optional[str] = config if isinstance(config, str) else None
+        # Settings that win over global.logging, e.g. from CLI flags
+        self.logging_overrides: Dict = {}
 
         if config:
             self._config = load_config(config)
@@ -72,6 +143,35 @@ class Scanner:
 
         # Setup global configuration
         self._global_config = config.get("global", {})
+        self._max_history = self._global_config.get(
+            "violation_history_size", self._max_history
+        )
+        self._violation_history = ViolationHistory(self._max_history)
+        self._cooldowns = CooldownTracker(
+            default_seconds=self._global_config.get("alert_cooldown_minutes", 5) * 60,
+            fingerprint_fields=self._global_config.get(
+                "alert_group_by", DEFAULT_FINGERPRINT
+            ),
+        )
+        self._setup_suppression(self._global_config)
+        self._setup_executors(self._global_config.get("executors", {}))
+        self._setup_history_db(self._global_config.get("history_db", {}))
+        self._setup_metric_store(self._global_config.get("metric_history", {}))
+
+        # Setup notification delivery
+        notifications_config = self._global_config.get("notifications", {})
+        self._dispatcher = NotificationDispatcher(
+            workers=notifications_config.get("workers", 4),
+            max_queue_size=notifications_config.get("queue_size", 1000),
+            send_timeout=notifications_config.get("send_timeout", 10.0),
+            metrics=self.metrics,
+        )
+        self._setup_metrics_server(self._global_config.get("metrics_server", {}))
+        self._setup_tracing(self._global_config.get("tracing", {}))
+        api_config = self._global_config.get("api", {})
+        if api_config.get("enabled", False):
+            self._api_server = APIServer.from_config(self, api_config)
+        self._setup_outbox(self._global_config.get("outbox", {}))
 
         # Setup data sources
         self._setup_datasources(config.get("datasources", {}))
@@ -82,95 +182,362 @@ class Scanner:
         # Setup alert groups and their alerts
         self._setup_alert_groups(config.get("alert_groups", {}))
 
+    def _setup_suppression(self, global_config: Dict):
+        """Setup configured silences and inhibition rules"""
+        for silence_id in self._config_silence_ids:
+            self._silences.remove(silence_id)
+        self._config_silence_ids = []
+        for silence_config in global_config.get("silences", []):
+            try:
+                silence = self._silences.add(
+                    silence_config["matchers"],
+                    ends_at=silence_config.get("ends_at"),
+                    starts_at=silence_config.get("starts_at"),
+                    duration_minutes=silence_config.get("duration_minutes"),
+                    comment=silence_config.get("comment", ""),
+                    created_by=silence_config.get("created_by", "config"),
+                )
+                self._config_silence_ids.append(silence.id)
+            except Exception as e:
+                logger.error(f"Failed to create silence {silence_config}: {e}")
+
+        try:
+            inhibitor = Inhibitor.from_config(global_config.get("inhibit_rules"))
+        except Exception as e:
+            logger.error(f"Failed to create inhibit rules: {e}")
+            return
+        self._active_violations.listeners.remove(self._inhibitor.violation_changed)
+        self._inhibitor = inhibitor
+        self._active_violations.listeners.append(self._inhibitor.violation_changed)
+        # Seed the new rules with alerts that are already active
+        for violation in self._active_violations.values():
+            inhibitor.violation_changed(None, violation)
+
+    def _setup_instruments(self):
+        registry = self.metrics
+        self._scan_seconds = registry.histogram(
+            "pysentinel_scan_duration_seconds", "Duration of one scan tick"
+        )
+        self._scheduling_lag = registry.histogram(
+            "pysentinel_scheduling_lag_seconds",
+            "Delay between when a scan tick was due and when it started",
+        )
+        self._fetch_seconds = registry.histogram(
+            "pysentinel_datasource_fetch_seconds",
+            "Datasource query latency",
+            ["datasource"],
+        )
+        self._evaluation_seconds = registry.histogram(
+            "pysentinel_evaluation_seconds",
+            "Time to evaluate one alert and handle its violation",
+            ["datasource"],
+        )
+        self._datasource_errors = registry.counter(
+            "pysentinel_datasource_errors", "Failed datasource checks", ["datasource"]
+        )
+        self._datasource_circuit_open = registry.counter(
+            "pysentinel_datasource_circuit_open",
+            "Datasources disabled after reaching max_errors",
+            ["datasource"],
+        )
+        self._scan_errors = registry.counter(
+            "pysentinel_scan_errors", "Unhandled errors in the scan loop"
+        )
+        self._violations_detected = registry.counter(
+            "pysentinel_violations", "Threshold violations detected", ["severity"]
+        )
+        self._outbox_dropped = registry.counter(
+            "pysentinel_outbox_dropped",
+            "Violations not written to the outbox because its queue was full",
+        )
+        registry.gauge(
+            "pysentinel_active_violations", "Violations currently active"
+        ).set_function(lambda: len(self._active_violations))
+
+    def _setup_logging(self):
+        """Install the non-blocking log pipeline described by global.logging"""
+        logging_config = {
+            **(self._global_config.get("logging") or {}),
+            **self.logging_overrides,
+        }
+        if not logging_config:
+            return
+        try:
+            setup_logging_from_config(logging_config)
+        except Exception as e:
+            logger.error(f"Failed to set up logging: {e}")
+
+    def _setup_executors(self, executors_config: Dict):
+        """Create the named worker pools datasources can offload parsing to"""
+        for name, executor_config in executors_config.items():
+            if name == "default" and executor_config.get("type", "thread") != "thread":
+                raise ScannerException(
+                    "Executor 'default' runs scanner tasks and must be a thread pool"
+                )
+            executor = create_executor(name, executor_config)
+            previous = self._executors.get(name)
+            if previous is not None:
+                previous.shutdown(wait=False)
+            self._executors[name] = executor
+        self._executor = self._executors["default"]
+
+    def _offload_policy(self, name: str, config: Dict) -> OffloadPolicy:
+        offload_config = config.get("offload")
+        if not offload_config:
+            return OffloadPolicy()
+        if offload_config is True:
+            offload_config = {}
+        executor_name = offload_config.get("executor", "default")
+        if executor_name not in self._executors:
+            raise ScannerException(
+                f"Datasource '{name}' offloads to unknown executor '{executor_name}'"
+            )
+        return OffloadPolicy(
+            self._executors[executor_name],
+            min_bytes=offload_config.get("min_bytes", DEFAULT_MIN_BYTES),
+        )
+
+    def _setup_metrics_server(self, metrics_server_config: Dict):
+        if metrics_server_config.get("enabled", False):
+            self._metrics_server = MetricsServer(
+                self.metrics,
+                host=metrics_server_config.get("host", "127.0.0.1"),
+                port=metrics_server_config.get("port", 9464),
+                path=metrics_server_config.get("path", "/metrics"),
+            )
+
+    def _setup_tracing(self, tracing_config: Dict):
+        try:
+            self._tracer = tracing.Tracer.from_config(tracing_config)
+        except Exception as e:
+            logger.error(f"Failed to set up tracing: {e}")
+            return
+        if self._tracer.enabled:
+            logger.info(
+                f"Tracing {self._tracer.sample_rate:.1%} of scan ticks "
+                f"to {self._tracer.exporter.path}"
+            )
+
+    def _setup_history_db(self, history_db_config: Dict):
+        """Setup the durable violation history store if enabled"""
+        if not history_db_config.get("enabled", False):
+            return
+        try:
+            self._history_db = HistoryDB(
+                db_path=history_db_config.get("path", "history.db"),
+                batch_size=history_db_config.get("batch_size", 500),
+                max_queue_size=history_db_config.get("max_queue_size", 100_000),
+                retention_days=history_db_config.get("retention_days"),
+            )
+            logger.info(f"Violation history persisted to {self._history_db.db_path}")
+        except Exception as e:
+            logger.error(f"Failed to open violation history database: {e}")
+
+    def _setup_outbox(self, outbox_config: Dict):
+        """Setup the durable notification outbox if enabled"""
+        if not outbox_config.get("enabled", False):
+            return
+        path = outbox_config.get("path")
+        writer = None
+        # With history_db enabled the outbox lives in the same database, so
+        # a violation's history row and outbox rows commit in one transaction
+        if self._history_db and path in (None, self._history_db.db_path):
+            path = self._history_db.db_path
+            writer = self._history_db.writer
+        elif self._history_db:
+            logger.warning(
+                "global.outbox.path differs from global.history_db.path, so "
+                "outbox rows are not committed together with history rows"
+            )
+        try:
+            self._outbox = NotificationOutbox(
+                db_path=path or "outbox.db",
+                max_attempts=outbox_config.get("max_attempts", 10),
+                retention_days=outbox_config.get("retention_days", 7),
+                writer=writer,
+            )
+            self._outbox_retry_interval = outbox_config.get(
+                "retry_interval", self._outbox_retry_interval
+            )
+            self._dispatcher.outbox = self._outbox
+            logger.info(f"Notification outbox stored in {self._outbox.db_path}")
+        except Exception as e:
+            logger.error(f"Failed to open notification outbox: {e}")
+
+    def _setup_metric_store(self, metric_history_config: Dict):
+        """Setup the local on-disk metric history if enabled (requires numpy)"""
+        if not metric_history_config.get("enabled", False):
+            return
+        try:
+            from pysentinel.utils.metric_store import MetricStore
+        except ImportError as e:
+            raise ScannerException(
+                "global.metric_history needs numpy; install it with "
+                f"'pip install pysentinel[metric-store]' ({e})"
+            ) from e
+        try:
+            self._metric_store = MetricStore(
+                path=metric_history_config.get("path", "metric_history"),
+                segment_size=metric_history_config.get("segment_size", 65536),
+                retention_hours=metric_history_config.get(
+                    "retention_hours",
+                    self._global_config.get("metrics_retention_hours", 24),
+                ),
+                max_segments=metric_history_config.get("max_segments", 16),
+                max_open_series=metric_history_config.get("max_open_series", 128),
+            )
+            logger.info(f"Metric history stored in {self._metric_store.path}")
+        except Exception as e:
+            logger.error(f"Failed to open metric history store: {e}")
+
     def _setup_datasources(self, datasources_config: Dict):
         """Setup data sources from configuration"""
+        for name, config in datasources_config.items():
+            datasource = self._create_datasource(name, config)
+            if datasource is not None:
+                self.datasources[name] = datasource
+
+    def _create_datasource(self, name: str, config: Dict) -> Optional[DataSource]:
         datasource_factories = {
             "postgresql": PostgreSQLDataSource,
             "http": HTTPDataSource,
             "redis": RedisDataSource,
             "prometheus": PrometheusDataSource,
             "elasticsearch": ElasticsearchDataSource,
+            **self._datasource_types,
         }
+        ds_type = config.get("type")
+        ds_enabled = config.get("enabled", False)
 
-        for name, config in datasources_config.items():
-            ds_type = config.get("type")
-            ds_enabled = config.get("enabled", False)
-
-            if ds_type in datasource_factories and ds_enabled:
-                try:
-                    datasource = datasource_factories[ds_type](name, config)
-                    self.datasources[name] = datasource
-                    logger.info(f"Added {ds_type} datasource: {name}")
-                except Exception as e:
-                    logger.error(f"Failed to create datasource {name}: {e}")
-            else:
-                logger.warning(f"Unknown datasource type: {ds_type}")
+        if ds_type in datasource_factories and ds_enabled:
+            try:
+                datasource = datasource_factories[ds_type](name, config)
+                datasource.offload = self._offload_policy(name, config)
+                logger.info(f"Added {ds_type} datasource: {name}")
+                return datasource
+            except Exception as e:
+                logger.error(f"Failed to create datasource {name}: {e}")
+        else:
+            logger.warning(f"Unknown datasource type: {ds_type}")
+        return None
 
     def _setup_channels(self, channel_config: Dict):
         """Setup alert channels from configuration"""
+        for name, config in channel_config.items():
+            channel = self._create_channel(name, config)
+            if channel is not None:
+                self.alert_channels[name] = channel
+                if "send_timeout" in config:
+                    self._dispatcher.channel_timeouts[name] = config["send_timeout"]
+
+    def _create_channel(self, name: str, config: Dict) -> Optional[AlertChannel]:
         channel_factory = {
             "email": Email,
             "slack": Slack,
             "webhook": Webhook,
             "telegram": Telegram,
+            **self._channel_types,
         }
-
-        for name, config in channel_config.items():
-            channel_type = config.get("type")
-            if channel_type in channel_factory:
-                try:
-                    channel = channel_factory[channel_type](name, config)
-                    self.alert_channels[name] = channel
-                    logger.info(f"Added {channel_type} alert channel: {name}")
-                except Exception as e:
-                    logger.error(f"Failed to create alert channel {name}: {e}")
-            else:
-                logger.warning(f"Unknown alert channel type: {channel_type}")
+        channel_type = config.get("type")
+        if channel_type not in channel_factory:
+            logger.warning(f"Unknown alert channel type: {channel_type}")
+            return None
+        try:
+            channel = channel_factory[channel_type](name, config)
+            # Webhook batch mode buffers through the same digest layer
+            digest_config = config.get("digest") or config.get("batch")
+            if digest_config and digest_config.get("enabled", True):
+                channel = DigestChannel(
+                    channel,
+                    window_seconds=digest_config.get("window_seconds", 10),
+                    max_batch=digest_config.get("max_batch", 50),
+                )
+            logger.info(f"Added {channel_type} alert channel: {name}")
+            return channel
+        except Exception as e:
+            logger.error(f"Failed to create alert channel {name}: {e}")
+            return None
 
     def _setup_alert_groups(self, alert_groups_config: Dict):
         """Setup alert groups and their alerts from configuration"""
         for group_name, group_config in alert_groups_config.items():
             if not group_config.get("enabled", True):
                 continue
+            self._setup_alert_group(group_name, group_config)
+            for alert_def in self._create_group_alerts(group_name, group_config):
+                self._register_alert_definition(alert_def)
+        logger.info(
+            f"Loaded {len(self._alert_definitions)} alerts "
+            f"in {len(self.alert_groups)} groups"
+        )
 
-            self.alert_groups[group_name] = group_config
-
-            # Setup alerts within this group
-            for alert_config in group_config.get("alerts", []):
-                try:
-                    alert_def = AlertDefinition(
-                        name=alert_config["name"],
-                        metrics=alert_config["metrics"],
-                        query=alert_config["query"],
-                        datasource=alert_config["datasource"],
-                        threshold=alert_config["threshold"],
-                        severity=Severity(alert_config["severity"]),
-                        interval=alert_config["interval"],
-                        alert_channels=alert_config["alert_channels"],
-                        description=alert_config["description"],
-                        alert_group=group_name,
-                    )
-                    self.alert_definitions.append(alert_def)
-                    logger.info(
+    def _setup_alert_group(self, group_name: str, group_config: Dict):
+        self.alert_groups[group_name] = group_config
+        if group_config.get("cooldown_minutes") is not None:
+            self._cooldowns.group_cooldowns[group_name] = (
+                group_config["cooldown_minutes"] * 60
+            )
+        if group_config.get("group_by"):
+            self._cooldowns.group_fingerprints[group_name] = tuple(
+                group_config["group_by"]
+            )
+
+    def _create_group_alerts(
+        self, group_name: str, group_config: Dict
+    ) -> List[AlertDefinition]:
+        alerts = []
+        # Both hoisted out of the loop; they dominate building 100k alerts
+        severities = {severity.value: severity for severity in Severity}
+        log_each = logger.isEnabledFor(logging.DEBUG)
+        for alert_config in group_config.get("alerts", []):
+            try:
+                severity = alert_config["severity"]
+                alert_def = AlertDefinition(
+                    name=alert_config["name"],
+                    metrics=alert_config["metrics"],
+                    query=alert_config["query"],
+                    datasource=alert_config["datasource"],
+                    threshold=alert_config["threshold"],
+                    severity=severities.get(severity) or Severity(severity),
+                    interval=alert_config["interval"],
+                    alert_channels=alert_config["alert_channels"],
+                    description=alert_config["description"],
+                    alert_group=group_name,
+                    cooldown_minutes=alert_config.get("cooldown_minutes"),
+                )
+                alerts.append(alert_def)
+                if log_each:
+                    logger.debug(
                         f"Added alert '{alert_def.name}' to group '{group_name}'"
                     )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to create alert {alert_config.get('name')}: {e}"
-                    )
+            except Exception as e:
+                logger.error(f"Failed to create alert {alert_config.get('name')}: {e}")
+        return alerts
+
+    @property
+    def alert_definitions(self) -> List[AlertDefinition]:
+        return self._alert_definitions
+
+    @alert_definitions.setter
+    def alert_definitions(self, definitions: List[AlertDefinition]):
+        self._alert_definitions = []
+        self._alert_definitions_by_name = {}
+        self._cooldowns.alert_cooldowns.clear()
+        for alert_def in definitions:
+            self._register_alert_definition(alert_def)
+
+    def _register_alert_definition(self, alert_def: AlertDefinition):
+        """Add an alert definition and index it by name"""
+        self._alert_definitions.append(alert_def)
+        self._alert_definitions_by_name[alert_def.name] = alert_def
+        if alert_def.cooldown_minutes is not None:
+            self._cooldowns.alert_cooldowns[alert_def.name] = (
+                alert_def.cooldown_minutes * 60
+            )
 
     def _should_send_alert(self, violation: Violation) -> bool:
         """Check if alert should be sent based on cooldown"""
-        cooldown_minutes = self._global_config.get("alert_cooldown_minutes", 5)
-        cooldown_key = f"{violation.datasource_name}_{violation.alert_name}"
-
-        if cooldown_key in self._alert_cooldowns:
-            time_since_last = datetime.now() - self._alert_cooldowns[cooldown_key]
-            if time_since_last.total_seconds() < cooldown_minutes * 60:
-                return False
-
-        self._alert_cooldowns[cooldown_key] = datetime.now()
-        return True
+        return self._cooldowns.should_notify(violation)
 
     async def start_async(self):
         """Start the scanner asynchronously"""
@@ -182,11 +549,34 @@ class Scanner:
         self._running = True
         self.start_time = datetime.now()
 
+        self._setup_logging()
         logger.info("Starting PySentinel scanner with alert groups...")
 
+        # Start notification workers before any violation can be raised
+        await self._dispatcher.start()
+
+        if self._metrics_server:
+            try:
+                await self._metrics_server.start()
+            except OSError as e:
+                logger.error(f"Failed to start metrics endpoint: {e}")
+        if self._api_server:
+            try:
+                await self._api_server.start()
+            except OSError as e:
+                logger.error(f"Failed to start API server: {e}")
+
+        # Redeliver notifications left pending by a previous run
+        if self._outbox:
+            await self._replay_outbox()
+            self._outbox_task = asyncio.create_task(self._outbox_retry_loop())
+
         # Start the main scan loop
         self._scan_task = asyncio.create_task(self._scan_loop())
+        if self._config_watcher:
+            self._config_watcher.start()
 
+        self._publish_snapshot()
         logger.info("Scanner started successfully")
 
     def start(self):
@@ -196,6 +586,8 @@ class Scanner:
     async def _start_and_wait(self):
         """Helper method for blocking start"""
         await self.start_async()
+        if self.config_path:
+            install_reload_signal(self.reload_config_async)
         try:
             await self._scan_task
         except KeyboardInterrupt:
@@ -231,6 +623,33 @@ class Scanner:
             except asyncio.CancelledError:
                 pass
 
+        if self._config_watcher:
+            await self._config_watcher.stop()
+
+        if self._outbox_task:
+            self._outbox_task.cancel()
+            try:
+                await self._outbox_task
+            except asyncio.CancelledError:
+                pass
+
+        await self._dispatcher.stop()
+        if self._api_server:
+            await self._api_server.stop()
+        # Ends every stream_alerts_async / stream_metrics_async consumer
+        self.events.close()
+        if self._metrics_server:
+            await self._metrics_server.stop()
+        self._tracer.close()
+
+        # Close all alert channels
+        for channel in self.alert_channels.values():
+            try:
+                await channel.close()
+            except Exception as e:
+                logger.error(f"Error closing alert channel {channel.name}: {e}")
+        await close_http_client()
+
         # Close all data sources
         for datasource in self.datasources.values():
             try:
@@ -238,34 +657,248 @@ class Scanner:
             except Exception as e:
                 logger.error(f"Error closing data source {datasource.name}: {e}")
 
-        self._executor.shutdown(wait=True)
+        if self._outbox:
+            self._outbox.close()
+        if self._history_db:
+            self._history_db.close()
+        if self._metric_store:
+            self._metric_store.close()
+
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+        self._publish_snapshot()
         logger.info("Scanner stopped")
 
+    def watch_config(self, interval: float = 5.0):
+        """Reload the configuration file whenever it changes on disk"""
+        if not self.config_path:
+            raise ScannerException("No configuration file to watch")
+        self._config_watcher = ConfigWatcher(
+            self.config_path, self.reload_config_async, interval
+        )
+        if self._running:
+            self._config_watcher.start()
+
+    async def reload_config_async(
+        self, config: Union[str, Dict, None] = None
+    ) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Reload configuration from ``config`` (default: the config file) and
+        rebuild only the datasources, channels and alert groups that changed.
+        Unchanged entries keep their connections, schedules and cooldowns.
+        Returns the names added, removed and changed per section.
+        """
+        source = config if config is not None else self.config_path
+        if source is None:
+            raise ScannerException("No configuration to reload from")
+        return await self._apply_config(load_config(source))
+
+    async def _apply_config(self, new_config: Dict) -> Dict[str, Dict[str, List[str]]]:
+        # Dicts reach here unvalidated (reloads, add_datasource_async), and an
+        # invalid config must be rejected before anything is torn down
+        new_config = validate_config(new_config)
+        if self._reload_lock is None:
+            self._reload_lock = asyncio.Lock()
+        async with self._reload_lock:
+            old_config = self._config
+            changes = {
+                "datasources": await self._reload_datasources(
+                    old_config.get("datasources", {}),
+                    new_config.get("datasources", {}),
+                ),
+                "alert_channels": await self._reload_channels(
+                    old_config.get("alert_channels", {}),
+                    new_config.get("alert_channels", {}),
+                ),
+                "alert_groups": self._reload_alert_groups(
+                    old_config.get("alert_groups", {}),
+                    new_config.get("alert_groups", {}),
+                ),
+            }
+            self._reload_global(
+                old_config.get("global", {}), new_config.get("global", {})
+            )
+            self._config = new_config
+            summary = ", ".join(
+                f"{section}: +{len(diff['added'])} -{len(diff['removed'])} "
+                f"~{len(diff['changed'])}"
+                for section, diff in changes.items()
+            )
+            logger.info(f"Configuration reloaded ({summary})")
+            return changes
+
+    async def _reload_datasources(self, old: Dict, new: Dict) -> Dict[str, List[str]]:
+        diff = diff_section(old, new)
+        stale = [
+            self.datasources.pop(name)
+            for name in diff.removed + diff.changed
+            if name in self.datasources
+        ]
+        for name in diff.added + diff.changed:
+            datasource = self._create_datasource(name, new[name])
+            if datasource is not None:
+                self.datasources[name] = datasource
+        # Close replaced connections only after the new ones are in place
+        for datasource in stale:
+            try:
+                await datasource.close()
+            except Exception as e:
+                logger.error(f"Error closing data source {datasource.name}: {e}")
+        return diff.to_dict()
+
+    async def _reload_channels(self, old: Dict, new: Dict) -> Dict[str, List[str]]:
+        diff = diff_section(old, new)
+        stale = []
+        for name in diff.removed + diff.changed:
+            self._dispatcher.channel_timeouts.pop(name, None)
+            if name in self.alert_channels:
+                stale.append(self.alert_channels.pop(name))
+        self._setup_channels({name: new[name] for name in diff.added + diff.changed})
+        for channel in stale:
+            try:
+                await channel.close()
+            except Exception as e:
+                logger.error(f"Error closing alert channel {channel.name}: {e}")
+        return diff.to_dict()
+
+    def _reload_alert_groups(self, old: Dict, new: Dict) -> Dict[str, List[str]]:
+        diff = diff_section(old, new)
+        unchanged = set(diff.unchanged)
+        definitions = []
+        self.alert_groups = {}
+        self._cooldowns.group_cooldowns.clear()
+        self._cooldowns.group_fingerprints.clear()
+        for group_name, group_config in new.items():
+            if not group_config.get("enabled", True):
+                continue
+            self._setup_alert_group(group_name, group_config)
+            if group_name in unchanged:
+                definitions.extend(
+                    alert_def
+                    for alert_def in self._alert_definitions
+                    if alert_def.alert_group == group_name
+                )
+            else:
+                definitions.extend(self._create_group_alerts(group_name, group_config))
+        self.alert_definitions = definitions
+
+        # Alerts that no longer exist can't resolve, so drop them now
+        for key, violation in list(self._active_violations.items()):
+            if violation.alert_name not in self._alert_definitions_by_name:
+                self._active_violations.pop(key, None)
+        return diff.to_dict()
+
+    def _reload_global(self, old: Dict, new: Dict):
+        self._global_config = new
+        self._cooldowns.default_seconds = new.get("alert_cooldown_minutes", 5) * 60
+        self._cooldowns.fingerprint_fields = tuple(
+            new.get("alert_group_by", DEFAULT_FINGERPRINT)
+        )
+        if old.get("silences") != new.get("silences") or old.get(
+            "inhibit_rules"
+        ) != new.get("inhibit_rules"):
+            self._setup_suppression(new)
+        if self._running and old.get("logging") != new.get("logging"):
+            self._setup_logging()
+
+        restart_only = (
+            "history_db",
+            "metric_history",
+            "notifications",
+            "outbox",
+            "executors",
+            "metrics_server",
+            "tracing",
+            "api",
+            "violation_history_size",
+        )
+        for key in restart_only:
+            if old.get(key) != new.get(key):
+                logger.warning(f"Change to global.{key} takes effect after a restart")
+
     async def _scan_loop(self):
         """Main scanning loop"""
         while self._running:
             try:
                 await self.scan_once_async()
+                due = time.monotonic() + 1
                 await asyncio.sleep(1)  # Small delay between checks
+                self._scheduling_lag.observe(max(0.0, time.monotonic() - due))
             except Exception as e:
                 logger.error(f"Error in scan loop: {e}")
+                self._scan_errors.inc()
                 self.status = ScannerStatus.ERROR
+                self._publish_snapshot()
                 await asyncio.sleep(5)  # Wait before retrying
                 if self._running:
                     self.status = ScannerStatus.RUNNING
 
+    async def _replay_outbox(self, older_than: Optional[float] = None):
+        """Resubmit pending outbox notifications to their channels"""
+        loop = asyncio.get_running_loop()
+        try:
+            pending = await loop.run_in_executor(
+                self._executor, lambda: self._outbox.pending(older_than=older_than)
+            )
+        except Exception as e:
+            logger.error(f"Failed to read notification outbox: {e}")
+            return
+
+        by_violation: Dict[str, tuple] = {}
+        for payload, channel_name in pending:
+            violation_id = payload.get("violation_id")
+            if channel_name not in self.alert_channels:
+                self._outbox.mark_failed(
+                    violation_id, channel_name, "channel not configured"
+                )
+                continue
+            if violation_id not in by_violation:
+                by_violation[violation_id] = (Violation.from_dict(payload), [])
+            by_violation[violation_id][1].append(
+                (channel_name, self.alert_channels[channel_name])
+            )
+
+        if by_violation:
+            logger.info(f"Replaying {len(pending)} pending notifications")
+        for violation, channels in by_violation.values():
+            self._dispatcher.submit(violation, channels)
+
+    async def _outbox_retry_loop(self):
+        """Periodically retry notifications that have not been delivered"""
+        while self._running:
+            await asyncio.sleep(self._outbox_retry_interval)
+            await self._replay_outbox(older_than=self._outbox_retry_interval)
+
     async def scan_once_async(self):
         """Perform a single scan cycle asynchronously"""
+        with self._tracer.start_trace("scan_tick"):
+            try:
+                await self._scan_once()
+            finally:
+                self._publish_snapshot()
+
+    def _publish_snapshot(self):
+        self._snapshots.publish(
+            self.status,
+            self.start_time,
+            self.last_scan_time,
+            self._latest_metrics,
+            self._active_violations,
+        )
+
+    async def _scan_once(self):
         scan_start = time.time()
 
         # Check which alerts need to be evaluated
         current_time = datetime.now()
         alerts_to_check = []
 
-        for alert_def in self.alert_definitions:
-            # Check if it's time to evaluate this alert
-            if self._should_check_alert(alert_def, current_time):
-                alerts_to_check.append(alert_def)
+        with tracing.span("schedule") as schedule_span:
+            for alert_def in self.alert_definitions:
+                # Check if it's time to evaluate this alert
+                if self._should_check_alert(alert_def, current_time):
+                    alerts_to_check.append(alert_def)
+            schedule_span.set_attribute("alerts_due", len(alerts_to_check))
 
         if not alerts_to_check:
             return
@@ -283,12 +916,14 @@ class Scanner:
             # Check if the datasource is enabled and exists
             if datasource_name not in self.datasources:
                 logger.warning(
-                    f"Datasource '{datasource_name}' not found, skipping alerts"
+                    f"Datasource '{datasource_name}' not found, skipping alerts",
+                    extra={"datasource": datasource_name},
                 )
                 continue
             if not self.datasources[datasource_name].enabled:
                 logger.warning(
-                    f"Datasource '{datasource_name}' is disabled, skipping alerts"
+                    f"Datasource '{datasource_name}' is disabled, skipping alerts",
+                    extra={"datasource": datasource_name},
                 )
                 continue
 
@@ -303,6 +938,7 @@ class Scanner:
 
         self.last_scan_time = datetime.now()
         scan_duration = time.time() - scan_start
+        self._scan_seconds.observe(scan_duration)
         logger.debug(f"Scan completed in {scan_duration:.2f}s")
 
     def _should_check_alert(
@@ -330,61 +966,132 @@ class Scanner:
         if not datasource.enabled:
             return
 
+        fetch_seconds = self._fetch_seconds.labels(datasource_name)
+        evaluation_seconds = self._evaluation_seconds.labels(datasource_name)
         for alert_def in alerts:
             try:
                 # Execute the query
-                result = await datasource.fetch_data(alert_def.query)
+                fetch_start = time.perf_counter()
+                with tracing.span(
+                    "fetch", datasource=datasource_name, alert=alert_def.name
+                ):
+                    result = await datasource.fetch_data(alert_def.query)
+                fetch_elapsed = time.perf_counter() - fetch_start
+                fetch_seconds.observe(fetch_elapsed)
 
                 # Check if the metric exists in the result
-                if alert_def.metrics in result:
-                    metric_value = result[alert_def.metrics]
+                with tracing.span("extract", metric=alert_def.metrics):
+                    found = alert_def.metrics in result
+                    metric_value = result[alert_def.metrics] if found else None
 
+                if found:
                     # Check threshold
-                    if alert_def.check_threshold(metric_value):
+                    evaluation_start = time.perf_counter()
+                    with tracing.span("evaluate", alert=alert_def.name):
+                        breached = alert_def.check_threshold(metric_value)
+                    if breached:
                         violation = alert_def.create_violation(
                             metric_value, datasource_name
                         )
-                        await self._handle_violation(violation)
+                        self._violations_detected.labels(alert_def.severity.value).inc()
+                        with tracing.span("notify", alert=alert_def.name):
+                            await self._handle_violation(violation)
                     else:
                         # Clear any existing violation for this alert
-                        violation_key = f"{datasource_name}_{alert_def.name}"
-                        if violation_key in self._active_violations:
-                            del self._active_violations[violation_key]
+                        self._active_violations.pop(
+                            (datasource_name, alert_def.name), None
+                        )
+                    evaluation_seconds.observe(time.perf_counter() - evaluation_start)
 
                 # Store metrics
                 metric_data = MetricData(
                     datasource_name=datasource_name,
                     metrics=result,
                     timestamp=datetime.now(),
+                    collection_time_ms=fetch_elapsed * 1000,
                 )
                 self._latest_metrics[datasource_name] = metric_data
+                self._snapshots.metrics_changed(datasource_name)
+                if self._metric_store and found:
+                    self._record_metric_history(
+                        datasource_name, alert_def.metrics, metric_value, metric_data
+                    )
+                await self.events.publish("metrics", metric_data)
 
             except Exception as e:
                 logger.error(
-                    f"Error checking alert '{alert_def.name}' on datasource '{datasource_name}': {e}"
+                    f"Error checking alert '{alert_def.name}' on datasource '{datasource_name}': {e}",
+                    extra={"datasource": datasource_name, "alert": alert_def.name},
                 )
                 datasource.error_count += 1
+                self._datasource_errors.labels(datasource_name).inc()
 
                 if datasource.error_count >= datasource.max_errors:
                     logger.error(
-                        f"Disabling datasource {datasource_name} due to too many errors"
+                        f"Disabling datasource {datasource_name} due to too many errors",
+                        extra={"datasource": datasource_name},
                     )
                     datasource.enabled = False
+                    self._datasource_circuit_open.labels(datasource_name).inc()
+
+    def _record_metric_history(
+        self,
+        datasource_name: str,
+        metric_name: str,
+        value: Any,
+        metric_data: MetricData,
+    ):
+        """
+        Append the value an alert checked to the metric history. Only metrics
+        referenced by an alert are stored, however wide the fetch result is.
+        """
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return
+        try:
+            self._metric_store.append(
+                datasource_name, metric_name, value, metric_data.timestamp.timestamp()
+            )
+        except Exception as e:
+            logger.error(f"Failed to record history for {metric_name}: {e}")
 
     async def _handle_violation(self, violation: Violation):
         """Handle a threshold violation"""
+        violation_key = (violation.datasource_name, violation.alert_name)
+        previous = self._active_violations.get(violation_key)
+
+        # Acknowledged alerts stay quiet until they resolve
+        if previous is not None and previous.acknowledged:
+            self._suppressed["acknowledged"] += 1
+            return
+
+        # Silenced and inhibited alerts stay active but skip notification
+        reason = self._suppression_reason(violation)
+        if reason:
+            if previous is None:
+                self._active_violations[violation_key] = violation
+            self._suppressed[reason] += 1
+            logger.debug(f"Alert {violation.alert_name} {reason}, not notifying")
+            return
+
         # Check if we should send this alert (cooldown)
         if not self._should_send_alert(violation):
             return
 
         # Store active violation
-        violation_key = f"{violation.datasource_name}_{violation.alert_name}"
         self._active_violations[violation_key] = violation
 
         # Add to history
         self._violation_history.append(violation)
-        if len(self._violation_history) > self._max_history:
-            self._violation_history.pop(0)
+        await self.events.publish("alerts", violation)
+        alert_def = self._alert_definitions_by_name.get(violation.alert_name)
+        channels = []
+        if alert_def:
+            channels = [
+                (channel_name, self.alert_channels[channel_name])
+                for channel_name in alert_def.alert_channels
+                if channel_name in self.alert_channels
+            ]
+        self._persist_violation(violation, [name for name, _ in channels])
 
         logger.warning(f"Alert triggered: {violation.alert_name} - {violation.message}")
 
@@ -396,16 +1103,46 @@ class Scanner:
                 logger.error(f"Error in violation callback: {e}")
 
         # Send alerts to configured channels
-        alert_def = next(
-            (a for a in self.alert_definitions if a.name == violation.alert_name), None
+        if not channels:
+            return
+        if self._dispatcher.running:
+            # Hand off to the notification workers so slow channels
+            # don't hold up the scan loop
+            self._dispatcher.submit(violation, channels)
+        else:
+            await self._dispatcher.deliver(violation, channels)
+
+    def _persist_violation(self, violation: Violation, channel_names: List[str]):
+        """
+        Queue the history row and the outbox rows for a new violation. When
+        both stores share a database they are committed in one transaction.
+        """
+        if not (self._outbox and channel_names):
+            if self._history_db and not self._history_db.record(violation):
+                logger.warning(
+                    f"History queue full, not persisting alert {violation.alert_name}"
+                )
+            return
+
+        shared = self._history_db is not None and (
+            self._outbox.db_path == self._history_db.db_path
         )
-        if alert_def:
-            for channel_name in alert_def.alert_channels:
-                if channel_name in self.alert_channels:
-                    try:
-                        await self.alert_channels[channel_name].send_alert(violation)
-                    except Exception as e:
-                        logger.error(f"Error sending alert via {channel_name}: {e}")
+        if self._history_db and not shared:
+            self._history_db.record(violation)
+        statements = [HistoryDB.insert_statement(violation)] if shared else []
+        if not self._outbox.enqueue(violation, channel_names, statements):
+            self._outbox_dropped.inc()
+            logger.error(
+                f"Outbox queue full, alert {violation.alert_name} is not durable",
+                extra={"alert": violation.alert_name},
+            )
+
+    def _suppression_reason(self, violation: Violation) -> Optional[str]:
+        if self._silences.match(violation) is not None:
+            return "silenced"
+        if self._inhibitor.is_inhibited(violation):
+            return "inhibited"
+        return None
 
     # Status and information methods
     def is_running(self) -> bool:
@@ -431,37 +1168,169 @@ class Scanner:
         return {name: data.to_dict() for name, data in self._latest_metrics.items()}
 
     def get_latest_metrics(self) -> Dict[str, Dict]:
-        """Get latest metrics (sync version)"""
-        return asyncio.run(self.get_latest_metrics_async())
+        """
+        Get latest metrics as of the last scan tick (sync version, safe to
+        call from any thread). The returned dict is shared; don't modify it.
+        """
+        return self._snapshots.current.latest_metrics
+
+    def get_metrics_by_source(self, datasource_name: str) -> Optional[Dict]:
+        """Get latest metrics from specific data source (sync version)"""
+        return self._snapshots.current.latest_metrics.get(datasource_name)
+
+    def get_snapshot(self) -> ScannerSnapshot:
+        """
+        Get an immutable, consistent view of status, latest metrics and
+        active alerts as of the last scan tick. Safe to call from any
+        thread, e.g. a web app polling a scanner run by start_background.
+        """
+        return self._snapshots.current
 
     async def get_metrics_by_source_async(self, datasource_name: str) -> Optional[Dict]:
         """Get latest metrics from specific data source"""
         metric_data = self._latest_metrics.get(datasource_name)
         return metric_data.to_dict() if metric_data else None
 
+    def get_metric_history(
+        self,
+        name: str,
+        since: Optional[datetime] = None,
+        datasource: Optional[str] = None,
+        until: Optional[datetime] = None,
+    ):
+        """
+        Get the recorded history of a metric as ``(timestamps, values)`` NumPy
+        arrays. ``datasource`` may be omitted when the metric name is unique.
+        """
+        if not self._metric_store:
+            raise ScannerException("Metric history is not enabled")
+        if datasource is None:
+            datasource = next(
+                (
+                    ds_name
+                    for ds_name in self.datasources
+                    if self._metric_store.has_series(ds_name, name)
+                ),
+                None,
+            )
+            if datasource is None:
+                raise DataSourceException(f"No history recorded for metric '{name}'")
+        return self._metric_store.read(
+            datasource,
+            name,
+            since=since.timestamp() if since else None,
+            until=until.timestamp() if until else None,
+        )
+
     async def get_active_alerts_async(self) -> List[Dict]:
         """Get currently active alerts"""
         return [violation.to_dict() for violation in self._active_violations.values()]
 
-    async def get_alert_history_async(self, limit: int = 100) -> List[Dict]:
-        """Get alert history"""
-        recent_violations = (
-            self._violation_history[-limit:] if limit else self._violation_history
+    def get_active_alerts(self) -> Tuple[Dict, ...]:
+        """Get active alerts as of the last scan tick (sync version)"""
+        return self._snapshots.current.active_alerts
+
+    async def get_alert_history_async(
+        self,
+        limit: int = 100,
+        alert_name: Optional[str] = None,
+        datasource_name: Optional[str] = None,
+        severity: Optional[Union[Severity, str]] = None,
+    ) -> List[Dict]:
+        """Get alert history, optionally filtered by alert, datasource and severity"""
+        recent_violations = self._violation_history.query(
+            alert_name=alert_name,
+            datasource_name=datasource_name,
+            severity=Severity(severity) if severity is not None else None,
+            limit=limit,
         )
         return [violation.to_dict() for violation in recent_violations]
 
+    async def get_alert_history_page_async(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        alert_name: Optional[str] = None,
+        severity: Optional[Union[Severity, str]] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        datasource_name: Optional[str] = None,
+    ) -> Dict:
+        """
+        Get a page of persisted alert history, newest first.
+
+        Pass the returned ``next_cursor`` back in to fetch the following page.
+        """
+        if not self._history_db:
+            raise ScannerException("Persistent alert history is not enabled")
+        if severity is not None:
+            severity = Severity(severity).value
+        loop = asyncio.get_running_loop()
+        items, next_cursor = await loop.run_in_executor(
+            self._executor,
+            lambda: self._history_db.query(
+                start=start,
+                end=end,
+                alert_name=alert_name,
+                severity=severity,
+                limit=limit,
+                cursor=cursor,
+                datasource_name=datasource_name,
+            ),
+        )
+        return {"items": items, "next_cursor": next_cursor}
+
     async def acknowledge_alert_async(self, alert_id: str) -> bool:
         """Acknowledge an alert"""
-        for violation in self._active_violations.values():
-            if violation.violation_id == alert_id:
-                violation.acknowledged = True
-                logger.info(f"Alert {alert_id} acknowledged")
-                return True
-        return False
+        violation = self._active_violations.find(alert_id)
+        if violation is None:
+            return False
+        violation.acknowledged = True
+        self._snapshots.alert_changed((violation.datasource_name, violation.alert_name))
+        self._publish_snapshot()
+        logger.info(f"Alert {alert_id} acknowledged")
+        return True
+
+    def get_notification_stats(self) -> Dict:
+        """Get notification queue depth, latency and drop counters"""
+        return {**self._dispatcher.get_stats(), "suppressed": dict(self._suppressed)}
+
+    async def add_silence_async(
+        self,
+        matchers,
+        ends_at=None,
+        duration_minutes: Optional[float] = None,
+        starts_at=None,
+        comment: str = "",
+        created_by: str = "",
+    ) -> Dict:
+        """
+        Mute notifications for violations matching all ``matchers``, given as
+        ``["alert_name=High CPU", "datasource_name=~prod-.*"]`` or a dict of
+        equality matches, until ``ends_at`` or for ``duration_minutes``
+        """
+        silence = self._silences.add(
+            matchers,
+            ends_at=ends_at,
+            starts_at=starts_at,
+            duration_minutes=duration_minutes,
+            comment=comment,
+            created_by=created_by,
+        )
+        logger.info(f"Silence {silence.id} added: {silence.to_dict()['matchers']}")
+        return silence.to_dict()
+
+    async def remove_silence_async(self, silence_id: str) -> bool:
+        """Expire a silence early"""
+        return self._silences.remove(silence_id)
+
+    async def get_silences_async(self) -> List[Dict]:
+        """Get all silences that have not expired"""
+        return [silence.to_dict() for silence in self._silences.active()]
 
     def get_datasources(self) -> List[str]:
         """Get list of data source names"""
-        return [ds.name for ds in self.datasources]
+        return list(self.datasources)
 
     def get_metric_count_async(self) -> int:
         """Get total number of metrics being collected"""
@@ -492,52 +1361,83 @@ class Scanner:
             raise ThresholdException(f"Failed to update thresholds: {e}")
 
     async def add_datasource_async(self, datasource_config: Dict):
-        """Add data source dynamically"""
-        # This would use a factory pattern to create the appropriate datasource
-        # based on the config type
-        raise NotImplementedError("Dynamic datasource addition not implemented")
+        """Add data source dynamically; ``datasource_config`` needs a ``name``"""
+        datasource_config = dict(datasource_config)
+        name = datasource_config.pop("name", None)
+        if not name:
+            raise DataSourceException("Data source config needs a 'name'")
+        datasources = self._config.get("datasources", {})
+        if name in datasources or name in self.datasources:
+            raise DataSourceException(f"Data source '{name}' already exists")
+
+        await self._apply_config(
+            {**self._config, "datasources": {**datasources, name: datasource_config}}
+        )
+        if name not in self.datasources:
+            raise DataSourceException(f"Failed to create data source '{name}'")
 
     async def remove_datasource_async(self, datasource_name: str):
         """Remove data source dynamically"""
-        datasource = next(
-            (ds for ds in self.datasources if ds.name == datasource_name), None
-        )
-        if datasource:
-            await datasource.close()
-            self.remove_datasource(datasource_name)
+        datasources = self._config.get("datasources", {})
+        if datasource_name in datasources:
+            await self._apply_config(
+                {
+                    **self._config,
+                    "datasources": {
+                        name: config
+                        for name, config in datasources.items()
+                        if name != datasource_name
+                    },
+                }
+            )
+        elif datasource_name in self.datasources:
+            # Registered directly rather than through the configuration
+            await self.datasources.pop(datasource_name).close()
         else:
             raise DataSourceException(f"Data source '{datasource_name}' not found")
 
-    async def stream_alerts_async(self):
-        """Async generator for streaming alerts"""
-        last_violation_count = len(self._violation_history)
-
-        while self._running:
-            current_violation_count = len(self._violation_history)
-
-            if current_violation_count > last_violation_count:
-                # New violations occurred
-                new_violations = self._violation_history[last_violation_count:]
-                for violation in new_violations:
-                    yield violation
-
-                last_violation_count = current_violation_count
-
-            await asyncio.sleep(1)
-
-    async def stream_metrics_async(self):
-        """Async generator for streaming metrics"""
-        last_metrics = {}
-
-        while self._running:
-            current_metrics = await self.get_latest_metrics_async()
-
-            # Check for new or updated metrics
-            for source_name, metrics in current_metrics.items():
-                if source_name not in last_metrics or metrics[
-                    "timestamp"
-                ] != last_metrics.get(source_name, {}).get("timestamp"):
-                    yield {source_name: metrics}
-
-            last_metrics = current_metrics
-            await asyncio.sleep(5)  # Stream every 5 seconds
+    async def stream_alerts_async(
+        self,
+        max_queue_size: int = 1000,
+        policy: Union[Backpressure, str] = Backpressure.DROP_OLDEST,
+    ):
+        """
+        Async generator yielding each new violation as it is recorded.
+
+        Violations are pushed to a queue per consumer. When the consumer
+        falls ``max_queue_size`` behind, ``policy`` decides whether the
+        oldest violations are dropped or the scanner waits ("block").
+        "coalesce" keeps only the latest violation per datasource and alert.
+        The stream ends when the scanner stops.
+        """
+        if not self._running:
+            return
+        with self.events.subscribe(
+            "alerts",
+            max_queue_size,
+            policy,
+            key=lambda violation: (violation.datasource_name, violation.alert_name),
+        ) as subscription:
+            async for violation in subscription:
+                yield violation
+
+    async def stream_metrics_async(
+        self,
+        max_queue_size: int = 1000,
+        policy: Union[Backpressure, str] = Backpressure.COALESCE,
+    ):
+        """
+        Async generator yielding ``{datasource_name: metrics}`` after each
+        fetch. By default a slow consumer only sees the latest result per
+        datasource rather than every intermediate one.
+        """
+        if not self._running:
+            return
+        with self.events.subscribe(
+            "metrics",
+            max_queue_size,
+            policy,
+            key=lambda metric_data: metric_data.datasource_name,
+        ) as subscription:
+            async for metric_data in subscription:
+                yield {metric_data.datasource_name: metric_data.to_dict()}
@@ -0,0 +1,341 @@
+import heapq
+import re
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.exception import ScannerException
+
+MATCHER_FIELDS = frozenset(
+    {
+        "alert_name",
+        "metric_name",
+        "datasource_name",
+        "alert_group",
+        "severity",
+        "operator",
+        "violation_id",
+    }
+)
+
+_MATCHER_RE = re.compile(r"^\s*(\w+)\s*(=~|!~|!=|=)\s*(.*?)\s*$")
+
+MatcherSpec = Union[str, Dict[str, Any]]
+
+
+def field_value(violation: Violation, field: str) -> Any:
+    value = getattr(violation, field, None)
+    return value.value if isinstance(value, Enum) else value
+
+
+def _timestamp(value: Union[None, float, datetime, str]) -> Optional[float]:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+class Matcher:
+    """
+    A single ``field op value`` condition on a violation.
+
+    ``=`` and ``!=`` compare for equality; ``=~`` and ``!~`` use a regex
+    that must match the whole value and is compiled once.
+    """
+
+    __slots__ = ("field", "op", "value", "_regex")
+
+    def __init__(self, field: str, op: str, value: Any):
+        if field not in MATCHER_FIELDS:
+            raise ScannerException(f"Cannot match on unknown field '{field}'")
+        self.field = field
+        self.op = op
+        self.value = value
+        self._regex = None
+        if op in ("=~", "!~"):
+            try:
+                self._regex = re.compile(str(value))
+            except re.error as e:
+                raise ScannerException(f"Invalid matcher regex {value!r}: {e}")
+        elif op not in ("=", "!="):
+            raise ScannerException(f"Unknown matcher operator '{op}'")
+
+    @classmethod
+    def parse(cls, spec: str) -> "Matcher":
+        """Parse ``field=value``, ``field!=value``, ``field=~re`` or ``field!~re``"""
+        match = _MATCHER_RE.match(spec)
+        if not match:
+            raise ScannerException(f"Invalid matcher '{spec}'")
+        field, op, value = match.groups()
+        return cls(field, op, value.strip("\"'"))
+
+    @property
+    def is_equality(self) -> bool:
+        return self.op == "="
+
+    def matches(self, violation: Violation) -> bool:
+        value = field_value(violation, self.field)
+        if self._regex is not None:
+            matched = value is not None and bool(self._regex.fullmatch(str(value)))
+            return matched if self.op == "=~" else not matched
+        if self.op == "=":
+            return value == self.value
+        return value != self.value
+
+    def __str__(self):
+        return f"{self.field}{self.op}{self.value}"
+
+
+def parse_matchers(specs: Union[None, Dict[str, Any], Sequence[MatcherSpec]]):
+    """Build matchers from ``["field=value", ...]`` or ``{field: value}``"""
+    if not specs:
+        return []
+    if isinstance(specs, dict):
+        specs = [specs]
+    matchers = []
+    for spec in specs:
+        if isinstance(spec, str):
+            matchers.append(Matcher.parse(spec))
+        else:
+            matchers.extend(Matcher(field, "=", value) for field, value in spec.items())
+    return matchers
+
+
+def _matches_all(matchers: Iterable[Matcher], violation: Violation) -> bool:
+    return all(matcher.matches(violation) for matcher in matchers)
+
+
+class Silence:
+    """A time-bounded mute for every violation matching all its matchers"""
+
+    __slots__ = (
+        "id",
+        "matchers",
+        "starts_at",
+        "ends_at",
+        "comment",
+        "created_by",
+    )
+
+    def __init__(
+        self,
+        matchers: List[Matcher],
+        ends_at: float,
+        starts_at: Optional[float] = None,
+        comment: str = "",
+        created_by: str = "",
+        silence_id: Optional[str] = None,
+    ):
+        if not matchers:
+            raise ScannerException("A silence needs at least one matcher")
+        self.id = silence_id or uuid.uuid4().hex
+        self.matchers = matchers
+        self.starts_at = starts_at if starts_at is not None else time.time()
+        self.ends_at = ends_at
+        self.comment = comment
+        self.created_by = created_by
+
+    def is_active(self, now: float) -> bool:
+        return self.starts_at <= now < self.ends_at
+
+    def matches(self, violation: Violation) -> bool:
+        return _matches_all(self.matchers, violation)
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "matchers": [str(matcher) for matcher in self.matchers],
+            "starts_at": datetime.fromtimestamp(self.starts_at).isoformat(),
+            "ends_at": datetime.fromtimestamp(self.ends_at).isoformat(),
+            "comment": self.comment,
+            "created_by": self.created_by,
+        }
+
+
+class SilenceStore:
+    """
+    Active silences indexed for constant-time lookup.
+
+    Each silence is filed under one of its equality matchers in a
+    ``field -> value -> silence ids`` hash index, so a check only looks at
+    silences whose anchor value equals the violation's; silences made only
+    of negative or regex matchers are scanned linearly. Expired silences
+    are dropped from a min-heap of end times on every check.
+    """
+
+    def __init__(self):
+        self._silences: Dict[str, Silence] = {}
+        self._index: Dict[str, Dict[Any, Set[str]]] = defaultdict(dict)
+        self._unindexed: Set[str] = set()
+        self._expiry: List[Tuple[float, str]] = []
+
+    def add(
+        self,
+        matchers: Union[Dict[str, Any], Sequence[MatcherSpec]],
+        ends_at: Union[None, float, datetime, str] = None,
+        starts_at: Union[None, float, datetime, str] = None,
+        duration_minutes: Optional[float] = None,
+        comment: str = "",
+        created_by: str = "",
+    ) -> Silence:
+        starts_at = _timestamp(starts_at)
+        ends_at = _timestamp(ends_at)
+        if ends_at is None:
+            if duration_minutes is None:
+                raise ScannerException("A silence needs ends_at or duration_minutes")
+            ends_at = (starts_at or time.time()) + duration_minutes * 60
+        silence = Silence(
+            parse_matchers(matchers),
+            ends_at=ends_at,
+            starts_at=starts_at,
+            comment=comment,
+            created_by=created_by,
+        )
+        self._silences[silence.id] = silence
+        anchor = self._anchor(silence)
+        if anchor is None:
+            self._unindexed.add(silence.id)
+        else:
+            self._index[anchor.field].setdefault(anchor.value, set()).add(silence.id)
+        heapq.heappush(self._expiry, (silence.ends_at, silence.id))
+        return silence
+
+    def remove(self, silence_id: str) -> bool:
+        silence = self._silences.pop(silence_id, None)
+        if silence is None:
+            return False
+        anchor = self._anchor(silence)
+        if anchor is None:
+            self._unindexed.discard(silence_id)
+        else:
+            values = self._index[anchor.field]
+            ids = values.get(anchor.value)
+            if ids is not None:
+                ids.discard(silence_id)
+                if not ids:
+                    del values[anchor.value]
+        return True
+
+    def get(self, silence_id: str) -> Optional[Silence]:
+        return self._silences.get(silence_id)
+
+    def active(self) -> List[Silence]:
+        self._expire(time.time())
+        return list(self._silences.values())
+
+    def match(
+        self, violation: Violation, now: Optional[float] = None
+    ) -> Optional[Silence]:
+        """Return an active silence covering ``violation``, if any"""
+        if not self._silences:
+            return None
+        now = time.time() if now is None else now
+        self._expire(now)
+        for field, values in self._index.items():
+            ids = values.get(field_value(violation, field))
+            if ids:
+                for silence_id in ids:
+                    silence = self._silences[silence_id]
+                    if silence.is_active(now) and silence.matches(violation):
+                        return silence
+        for silence_id in self._unindexed:
+            silence = self._silences[silence_id]
+            if silence.is_active(now) and silence.matches(violation):
+                return silence
+        return None
+
+    @staticmethod
+    def _anchor(silence: Silence) -> Optional[Matcher]:
+        return next((m for m in silence.matchers if m.is_equality), None)
+
+    def _expire(self, now: float):
+        while self._expiry and self._expiry[0][0] <= now:
+            _, silence_id = heapq.heappop(self._expiry)
+            self.remove(silence_id)
+
+    def __len__(self) -> int:
+        return len(self._silences)
+
+
+class InhibitRule:
+    """
+    Suppress violations matching ``target`` while a violation matching
+    ``source`` is active with the same values for the ``equal`` fields.
+    """
+
+    __slots__ = ("source", "target", "equal", "_sources")
+
+    def __init__(
+        self,
+        source: List[Matcher],
+        target: List[Matcher],
+        equal: Sequence[str] = (),
+    ):
+        self.source = source
+        self.target = target
+        self.equal = tuple(equal)
+        # Active source violations counted by their equal-field values
+        self._sources: Dict[Tuple, int] = defaultdict(int)
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "InhibitRule":
+        return cls(
+            source=parse_matchers(config.get("source")),
+            target=parse_matchers(config.get("target")),
+            equal=config.get("equal", ()),
+        )
+
+    def key(self, violation: Violation) -> Tuple:
+        return tuple(field_value(violation, field) for field in self.equal)
+
+    def source_changed(self, violation: Violation, delta: int):
+        if _matches_all(self.source, violation):
+            key = self.key(violation)
+            count = self._sources[key] + delta
+            if count > 0:
+                self._sources[key] = count
+            else:
+                del self._sources[key]
+
+    def inhibits(self, violation: Violation) -> bool:
+        return (
+            bool(self._sources)
+            and _matches_all(self.target, violation)
+            # A violation never inhibits itself
+            and not _matches_all(self.source, violation)
+            and self.key(violation) in self._sources
+        )
+
+
+class Inhibitor:
+    """
+    Evaluates inhibition rules against the active violations.
+
+    ``violation_changed`` is registered as an ``ActiveViolations`` listener
+    so each rule keeps a hash of its active sources and a check costs one
+    lookup per rule rather than a scan of the active violations.
+    """
+
+    def __init__(self, rules: Optional[List[InhibitRule]] = None):
+        self.rules = list(rules or [])
+
+    @classmethod
+    def from_config(cls, rules_config: Optional[List[Dict]]) -> "Inhibitor":
+        return cls([InhibitRule.from_config(rule) for rule in rules_config or []])
+
+    def violation_changed(
+        self, previous: Optional[Violation], current: Optional[Violation]
+    ):
+        for rule in self.rules:
+            if previous is not None:
+                rule.source_changed(previous, -1)
+            if current is not None:
+                rule.source_changed(current, 1)
+
+    def is_inhibited(self, violation: Violation) -> bool:
+        return any(rule.inhibits(violation) for rule in self.rules)
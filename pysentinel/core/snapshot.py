@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import Dict, Hashable, NamedTuple, Optional, Set, Tuple
+
+from pysentinel.core.threshold import MetricData, Violation
+from pysentinel.utils.constants import ScannerStatus
+
+
+class ScannerSnapshot(NamedTuple):
+    """
+    Immutable view of the scanner's state as of the end of a scan tick.
+
+    The containers are built once per publish and never modified again;
+    callers share them, so treat the dicts as read-only.
+    """
+
+    status: ScannerStatus
+    start_time: Optional[datetime]
+    last_scan_time: Optional[datetime]
+    # datasource name -> MetricData.to_dict()
+    latest_metrics: Dict[str, Dict]
+    # Violation.to_dict() of every active violation
+    active_alerts: Tuple[Dict, ...]
+    version: int
+
+    @property
+    def uptime_seconds(self) -> float:
+        if self.start_time:
+            return (datetime.now() - self.start_time).total_seconds()
+        return 0
+
+
+EMPTY_SNAPSHOT = ScannerSnapshot(ScannerStatus.STOPPED, None, None, {}, (), 0)
+
+
+class SnapshotPublisher:
+    """
+    Builds ``ScannerSnapshot``s on the event loop for readers on any thread.
+
+    The loop marks what changed as it goes and ``publish`` copies only those
+    entries into new containers, reusing the serialized form of everything
+    else. The new snapshot replaces the old one with a single reference
+    assignment, so a reader holding ``current`` always sees one consistent
+    tick and never takes a lock or waits on the loop.
+    """
+
+    def __init__(self):
+        self.current = EMPTY_SNAPSHOT
+        self._metrics: Dict[str, Dict] = {}
+        self._alerts: Dict[Hashable, Dict] = {}
+        self._changed_metrics: Set[str] = set()
+        self._changed_alerts: Set[Hashable] = set()
+
+    def metrics_changed(self, datasource_name: str):
+        self._changed_metrics.add(datasource_name)
+
+    def alert_changed(self, key: Hashable):
+        self._changed_alerts.add(key)
+
+    def violation_changed(
+        self, previous: Optional[Violation], current: Optional[Violation]
+    ):
+        """ActiveViolations listener"""
+        violation = current if current is not None else previous
+        self._changed_alerts.add((violation.datasource_name, violation.alert_name))
+
+    def publish(
+        self,
+        status: ScannerStatus,
+        start_time: Optional[datetime],
+        last_scan_time: Optional[datetime],
+        latest_metrics: Dict[str, MetricData],
+        active_violations: Dict[Hashable, Violation],
+    ) -> ScannerSnapshot:
+        previous = self.current
+        metrics = previous.latest_metrics
+        alerts = previous.active_alerts
+
+        if self._changed_metrics:
+            metrics = self._metrics = dict(self._metrics)
+            for name in self._changed_metrics:
+                metric_data = latest_metrics.get(name)
+                if metric_data is None:
+                    metrics.pop(name, None)
+                else:
+                    metrics[name] = metric_data.to_dict()
+            self._changed_metrics = set()
+
+        if self._changed_alerts:
+            # Published as a fresh tuple, so the index can be updated in place
+            for key in self._changed_alerts:
+                violation = active_violations.get(key)
+                if violation is None:
+                    self._alerts.pop(key, None)
+                else:
+                    self._alerts[key] = violation.to_dict()
+            alerts = tuple(self._alerts.values())
+            self._changed_alerts = set()
+
+        self.current = ScannerSnapshot(
+            status=status,
+            start_time=start_time,
+            last_scan_time=last_scan_time,
+            latest_metrics=metrics,
+            active_alerts=alerts,
+            version=previous.version + 1,
+        )
+        return self.current
@@ -1,54 +1,232 @@
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from pysentinel.utils.constants import Severity
 
 
-@dataclass
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    Intern an identifier repeated across many records, such as an alert or
+    datasource name, so they all share one copy. Free text such as a
+    message is unique per record and is never interned.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
 class Violation:
     """Represents a threshold violation"""
 
-    alert_name: str
-    metric_name: str
-    current_value: Any
-    threshold_value: Any
-    operator: str
-    severity: Severity
-    message: str
-    timestamp: datetime
-    datasource_name: str
-    alert_group: str = None
-    violation_id: str = None
-    acknowledged: bool = False
+    __slots__ = (
+        "alert_name",
+        "metric_name",
+        "current_value",
+        "threshold_value",
+        "operator",
+        "severity",
+        "message",
+        "timestamp",
+        "datasource_name",
+        "alert_group",
+        "_violation_id",
+        "_acknowledged",
+        "_dict",
+    )
+
+    def __init__(
+        self,
+        alert_name: str,
+        metric_name: str,
+        current_value: Any,
+        threshold_value: Any,
+        operator: str,
+        severity: Severity,
+        message: str,
+        timestamp: datetime,
+        datasource_name: str,
+        alert_group: str = None,
+        violation_id: str = None,
+        acknowledged: bool = False,
+    ):
+        # Severity is an enum, so its members are shared already
+        self.alert_name = _intern(alert_name)
+        self.metric_name = metric_name
+        self.current_value = current_value
+        self.threshold_value = threshold_value
+        self.operator = operator
+        self.severity = severity
+        self.message = message
+        self.timestamp = timestamp
+        self.datasource_name = _intern(datasource_name)
+        self.alert_group = alert_group
+        self._violation_id = violation_id
+        self._acknowledged = acknowledged
+        self._dict = None
+
+    def __setattr__(self, name: str, value: Any):
+        # Setting any field invalidates the cached to_dict() result
+        object.__setattr__(self, name, value)
+        if name != "_dict":
+            object.__setattr__(self, "_dict", None)
+
+    @property
+    def violation_id(self) -> str:
+        # Built on first access; most violations are only ever looked up by key
+        if not self._violation_id:
+            self._violation_id = "_".join(
+                (
+                    self.datasource_name,
+                    self.alert_name,
+                    str(int(self.timestamp.timestamp())),
+                )
+            )
+        return self._violation_id
+
+    @violation_id.setter
+    def violation_id(self, value: str):
+        self._violation_id = value
+
+    @property
+    def acknowledged(self) -> bool:
+        return self._acknowledged
 
-    def __post_init__(self):
-        if not self.violation_id:
-            self.violation_id = f"{self.datasource_name}_{self.alert_name}_{int(self.timestamp.timestamp())}"
+    @acknowledged.setter
+    def acknowledged(self, value: bool):
+        self._acknowledged = value
 
     def to_dict(self) -> Dict:
-        data = asdict(self)
-        data["severity"] = self.severity.value
-        data["timestamp"] = self.timestamp.isoformat()
-        return data
+        # The serialized form is built once and reused; callers get a shallow
+        # copy so they can't corrupt the cache.
+        if self._dict is None:
+            self._dict = {
+                "alert_name": self.alert_name,
+                "metric_name": self.metric_name,
+                "current_value": self.current_value,
+                "threshold_value": self.threshold_value,
+                "operator": self.operator,
+                "severity": self.severity.value,
+                "message": self.message,
+                "timestamp": self.timestamp.isoformat(),
+                "datasource_name": self.datasource_name,
+                "alert_group": self.alert_group,
+                "violation_id": self.violation_id,
+                "acknowledged": self._acknowledged,
+            }
+        return dict(self._dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Violation":
+        """Rebuild a violation from the output of ``to_dict``"""
+        return cls(
+            alert_name=data["alert_name"],
+            metric_name=data["metric_name"],
+            current_value=data["current_value"],
+            threshold_value=data["threshold_value"],
+            operator=data["operator"],
+            severity=Severity(data["severity"]),
+            message=data["message"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            datasource_name=data["datasource_name"],
+            alert_group=data.get("alert_group"),
+            violation_id=data.get("violation_id"),
+            acknowledged=data.get("acknowledged", False),
+        )
+
+    def _astuple(self) -> tuple:
+        return (
+            self.alert_name,
+            self.metric_name,
+            self.current_value,
+            self.threshold_value,
+            self.operator,
+            self.severity,
+            self.message,
+            self.timestamp,
+            self.datasource_name,
+            self.alert_group,
+            self.violation_id,
+            self._acknowledged,
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (
+            f"Violation(alert_name={self.alert_name!r}, "
+            f"datasource_name={self.datasource_name!r}, "
+            f"severity={self.severity}, current_value={self.current_value!r}, "
+            f"violation_id={self.violation_id!r})"
+        )
 
 
-@dataclass
 class MetricData:
     """Represents collected metric data"""
 
-    datasource_name: str
-    metrics: Dict[str, Any]
-    timestamp: datetime
-    collection_time_ms: float = 0
+    __slots__ = (
+        "datasource_name",
+        "metrics",
+        "timestamp",
+        "collection_time_ms",
+        "_dict",
+    )
+
+    def __init__(
+        self,
+        datasource_name: str,
+        metrics: Dict[str, Any],
+        timestamp: datetime,
+        collection_time_ms: float = 0,
+    ):
+        self.datasource_name = _intern(datasource_name)
+        self.metrics = metrics
+        self.timestamp = timestamp
+        self.collection_time_ms = collection_time_ms
+        self._dict = None
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name != "_dict":
+            object.__setattr__(self, "_dict", None)
 
     def to_dict(self) -> Dict:
-        return {
-            "datasource_name": self.datasource_name,
-            "metrics": self.metrics,
-            "timestamp": self.timestamp.isoformat(),
-            "collection_time_ms": self.collection_time_ms,
-        }
+        if self._dict is None:
+            self._dict = {
+                "datasource_name": self.datasource_name,
+                "metrics": self.metrics,
+                "timestamp": self.timestamp.isoformat(),
+                "collection_time_ms": self.collection_time_ms,
+            }
+        return dict(self._dict)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.datasource_name,
+            self.metrics,
+            self.timestamp,
+            self.collection_time_ms,
+        ) == (
+            other.datasource_name,
+            other.metrics,
+            other.timestamp,
+            other.collection_time_ms,
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (
+            f"MetricData(datasource_name={self.datasource_name!r}, "
+            f"metrics={self.metrics!r}, timestamp={self.timestamp!r}, "
+            f"collection_time_ms={self.collection_time_ms!r})"
+        )
 
 
 @dataclass
@@ -66,6 +244,7 @@ class AlertDefinition:
     description: str
     alert_group: str = None
     enabled: bool = True
+    cooldown_minutes: Optional[float] = None
 
     def create_violation(self, current_value: Any, datasource_name: str) -> Violation:
         """Create a violation from this alert definition"""
@@ -1,9 +1,22 @@
+import json
 import os
+import re
 from typing import Dict, Any
 
 from pysentinel.datasources.base import DataSource, logger
 from pysentinel.utils.exception import DataSourceException
 
+# application/json and application/<anything>+json, as aiohttp accepts
+_JSON_CONTENT_TYPE = re.compile(r"^application/(?:[\w.+-]+?\+)?json")
+
+
+def parse_json(body: bytes) -> Any:
+    """Decode a JSON response body; an empty body gives None"""
+    body = body.strip()
+    if not body:
+        return None
+    return json.loads(body)
+
 
 class HTTPDataSource(DataSource):
     """HTTP API data source implementation"""
@@ -37,12 +50,18 @@ class HTTPDataSource(DataSource):
             ) as session:
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        return data
+                        content_type = response.headers.get("Content-Type", "")
+                        if not _JSON_CONTENT_TYPE.match(content_type.lower()):
+                            raise DataSourceException(
+                                "Attempt to decode JSON with unexpected "
+                                f"mimetype: {content_type}"
+                            )
+                        body = await response.read()
+                        return await self.offload.run(parse_json, body)
                     else:
                         raise DataSourceException(
                             f"HTTP {response.status}: {await response.text()}"
                         )
         except Exception as e:
-            logger.error(f"Error fetching from HTTP API: {e}")
+            logger.debug(f"Error fetching from HTTP API: {e}")
             raise DataSourceException(f"HTTP fetch failed: {e}")
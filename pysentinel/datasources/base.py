@@ -3,6 +3,8 @@ from datetime import datetime
 from typing import Dict, Any
 import logging
 
+from pysentinel.datasources.offload import OffloadPolicy
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +21,8 @@ class DataSource(ABC):
         self.max_errors = config.get("max_retries", 5)
         self.connection_timeout = config.get("timeout", 30)
         self._connection = None
+        # Where large responses are parsed; set up by the scanner
+        self.offload = OffloadPolicy()
 
     @abstractmethod
     async def fetch_data(self, query: str) -> Dict[str, Any]:
@@ -24,5 +24,5 @@ class PostgreSQLDataSource(DataSource):
             result = await self._connection.fetchrow(query)
             return dict(result) if result else {}
         except Exception as e:
-            logger.error(f"Error executing PostgreSQL query: {e}")
+            logger.debug(f"Error executing PostgreSQL query: {e}")
             raise DataSourceException(f"PostgreSQL query failed: {e}")
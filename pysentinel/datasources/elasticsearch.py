@@ -3,7 +3,46 @@ from typing import Dict, Any
 
 from pysentinel.datasources.base import DataSource, logger
 from pysentinel.utils.exception import DataSourceException
-from elasticsearch import AsyncElasticsearch
+from elasticsearch import ApiError, AsyncElasticsearch
+from elastic_transport import JsonSerializer
+
+
+class RawJsonSerializer(JsonSerializer):
+    """
+    Encodes requests as usual but hands response bodies back as bytes.
+    Error bodies stay undecoded too; ``describe_api_error`` reads them.
+    """
+
+    def loads(self, data: bytes) -> bytes:
+        return data
+
+
+def extract_aggregations(body: bytes) -> Dict[str, Any]:
+    """Decode a search response and keep only the aggregation values"""
+    result = json.loads(body) if body else {}
+    metrics = {}
+    if "aggregations" in result:
+        for agg_name, agg_result in result["aggregations"].items():
+            if "value" in agg_result:
+                metrics[agg_name] = agg_result["value"]
+            elif "doc_count" in agg_result:
+                metrics[agg_name] = agg_result["doc_count"]
+    return metrics
+
+
+def describe_api_error(error: ApiError) -> str:
+    """Status, error type and reason from an error response left as bytes"""
+    body = error.body
+    if isinstance(body, bytes):
+        try:
+            body = json.loads(body)
+        except ValueError:
+            body = body.decode("utf-8", "replace")
+    details = body.get("error", body) if isinstance(body, dict) else body
+    if isinstance(details, dict) and "type" in details:
+        reason = details.get("reason")
+        details = f"{details['type']}: {reason}" if reason else details["type"]
+    return f"{error.status_code} {details}"
 
 
 class ElasticsearchDataSource(DataSource):
@@ -11,8 +50,11 @@ class ElasticsearchDataSource(DataSource):
 
     async def connect(self):
         if not self._connection:
+            # Responses stay undecoded so the offload policy decides where
+            # they are parsed
             self._connection = AsyncElasticsearch(
                 self.config["hosts"],
+                serializer=RawJsonSerializer(),
             )
 
     async def close(self):
@@ -24,20 +66,14 @@ class ElasticsearchDataSource(DataSource):
         await self.connect()
         try:
             query_dict = json.loads(query)
-            result = await self._connection.search(
+            response = await self._connection.search(
                 index=self.config["index_pattern"], body=query_dict
             )
-
-            # Extract aggregation results
-            metrics = {}
-            if "aggregations" in result:
-                for agg_name, agg_result in result["aggregations"].items():
-                    if "value" in agg_result:
-                        metrics[agg_name] = agg_result["value"]
-                    elif "doc_count" in agg_result:
-                        metrics[agg_name] = agg_result["doc_count"]
-
-            return metrics
+            return await self.offload.run(extract_aggregations, response.body)
+        except ApiError as e:
+            message = describe_api_error(e)
+            logger.debug(f"Error executing Elasticsearch query: {message}")
+            raise DataSourceException(f"Elasticsearch query failed: {message}")
         except Exception as e:
-            logger.error(f"Error executing Elasticsearch query: {e}")
+            logger.debug(f"Error executing Elasticsearch query: {e}")
             raise DataSourceException(f"Elasticsearch query failed: {e}")
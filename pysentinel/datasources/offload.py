@@ -0,0 +1,55 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from pysentinel.utils.exception import ScannerException
+
+# Below this size a response is parsed in place; the hop to a pool costs
+# more than decoding it
+DEFAULT_MIN_BYTES = 1024 * 1024
+
+
+class OffloadPolicy:
+    """
+    Decides where a datasource parses a response body.
+
+    Bodies of at least ``min_bytes`` are handed to ``executor`` together
+    with a module-level ``parse`` function, so decoding and extraction do
+    not hold up the event loop. A thread pool receives the ``bytes`` object
+    itself, without a copy; a process pool pickles it once, so ``parse``
+    should reduce the document to the values the scanner needs and only
+    those travel back. CPython's JSON decoders hold the GIL, so only a
+    process pool keeps the loop responsive while they run; a thread pool
+    helps parsers that release it. Without an executor everything is
+    parsed inline, as before.
+    """
+
+    def __init__(
+        self, executor: Optional[Executor] = None, min_bytes: int = DEFAULT_MIN_BYTES
+    ):
+        self.executor = executor
+        self.min_bytes = min_bytes
+        self.offloaded = 0
+
+    async def run(self, parse: Callable[[bytes], Any], body: bytes) -> Any:
+        if self.executor is None or len(body) < self.min_bytes:
+            return parse(body)
+        self.offloaded += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parse, body)
+
+
+def create_executor(name: str, config: Dict) -> Executor:
+    """Build an executor from a ``global.executors`` entry"""
+    executor_type = config.get("type", "thread")
+    max_workers = config.get("max_workers")
+    if executor_type == "thread":
+        return ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"pysentinel-{name}"
+        )
+    if executor_type == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ScannerException(
+        f"Executor '{name}' has unknown type '{executor_type}', "
+        "expected thread or process"
+    )
@@ -38,5 +38,5 @@ class PrometheusDataSource(DataSource):
                     else:
                         raise DataSourceException(f"Prometheus HTTP {response.status}")
         except Exception as e:
-            logger.error(f"Error fetching from Prometheus: {e}")
+            logger.debug(f"Error fetching from Prometheus: {e}")
             raise DataSourceException(f"Prometheus query failed: {e}")
@@ -47,5 +47,5 @@ class RedisDataSource(DataSource):
             else:
                 return {}
         except Exception as e:
-            logger.error(f"Error executing Redis query: {e}")
+            logger.debug(f"Error executing Redis query: {e}")
             raise DataSourceException(f"Redis query failed: {e}")
@@ -0,0 +1,48 @@
+import asyncio
+import random
+from typing import Dict, Any
+
+from pysentinel.datasources.base import DataSource
+from pysentinel.utils.exception import DataSourceException
+
+
+class SyntheticDataSource(DataSource):
+    """
+    In-process data source that generates metric values, for benchmarks,
+    load tests and dry runs.
+
+    Config:
+        metrics: {name: {min, max}} - each fetch returns a uniform random
+            value per metric (default ``{"value": {min: 0, max: 100}}``)
+        latency_ms / jitter_ms: simulated query latency
+        error_rate: probability that a fetch raises DataSourceException
+        seed: makes the generated values reproducible
+    """
+
+    def __init__(self, name: str, config: Dict, **kwargs):
+        super().__init__(name, config, **kwargs)
+        self.metrics = config.get("metrics") or {"value": {"min": 0, "max": 100}}
+        self.latency = config.get("latency_ms", 0) / 1000
+        self.jitter = config.get("jitter_ms", 0) / 1000
+        self.error_rate = config.get("error_rate", 0.0)
+        self._random = random.Random(config.get("seed"))
+        self.fetch_count = 0
+
+    async def connect(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def fetch_data(self, query: str) -> Dict[str, Any]:
+        self.fetch_count += 1
+        rng = self._random
+        delay = self.latency + (rng.uniform(0, self.jitter) if self.jitter else 0)
+        # A zero sleep still yields, like a real network round trip would
+        await asyncio.sleep(delay)
+        if self.error_rate and rng.random() < self.error_rate:
+            raise DataSourceException(f"Synthetic failure for query: {query}")
+        return {
+            name: rng.uniform(bounds.get("min", 0), bounds.get("max", 100))
+            for name, bounds in self.metrics.items()
+        }
@@ -14,3 +14,9 @@ class ThresholdException(ScannerException):
     """Exception for threshold related errors"""
 
     pass
+
+
+class TemplateException(ScannerException):
+    """Exception for invalid notification templates"""
+
+    pass
@@ -0,0 +1,223 @@
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from pysentinel.utils.sqlite_writer import SQLiteBatchWriter, Statement, connect_wal
+
+_INSERT_SQL = """
+    INSERT INTO violation_history (
+        violation_id, alert_name, alert_group, datasource_name,
+        metric_name, severity, timestamp, current_value,
+        threshold_value, operator, message, acknowledged
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class HistoryDB:
+    """
+    Durable violation history backed by SQLite in WAL mode.
+
+    ``record`` never touches the database: violations are queued and a
+    background writer thread inserts them in batches, one transaction per
+    batch. Queries use keyset pagination on ``(timestamp, id)`` so deep pages
+    cost the same as the first one.
+    """
+
+    def __init__(
+        self,
+        db_path="history.db",
+        batch_size=500,
+        poll_interval=1.0,
+        max_queue_size=100_000,
+        retention_days=None,
+    ):
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self._last_purge = 0.0
+
+        self._read_lock = threading.Lock()
+        self._read_conn = connect_wal(db_path)
+        self._create_table(self._read_conn)
+
+        self._writer = SQLiteBatchWriter(
+            db_path,
+            name="pysentinel-history-writer",
+            batch_size=batch_size,
+            poll_interval=poll_interval,
+            max_queue_size=max_queue_size,
+            maintenance=self._purge if retention_days else None,
+        )
+
+    @property
+    def dropped(self) -> int:
+        return self._writer.dropped
+
+    @property
+    def writer(self) -> SQLiteBatchWriter:
+        """The batch writer, shared with stores that commit alongside history"""
+        return self._writer
+
+    @staticmethod
+    def _create_table(conn):
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS violation_history (
+                    id INTEGER PRIMARY KEY,
+                    violation_id TEXT NOT NULL,
+                    alert_name TEXT NOT NULL,
+                    alert_group TEXT,
+                    datasource_name TEXT NOT NULL,
+                    metric_name TEXT,
+                    severity TEXT NOT NULL,
+                    timestamp REAL NOT NULL,
+                    current_value TEXT,
+                    threshold_value TEXT,
+                    operator TEXT,
+                    message TEXT,
+                    acknowledged INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_violation_history_timestamp "
+                "ON violation_history (timestamp, id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_violation_history_alert "
+                "ON violation_history (alert_name, timestamp, id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_violation_history_severity "
+                "ON violation_history (severity, timestamp, id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_violation_history_datasource "
+                "ON violation_history (datasource_name, timestamp, id)"
+            )
+
+    def record(self, violation) -> bool:
+        """Queue a violation for insertion; returns False if the queue is full"""
+        return self._writer.submit(*self.insert_statement(violation))
+
+    @staticmethod
+    def insert_statement(violation) -> Statement:
+        """The ``(sql, params)`` that records ``violation``"""
+        row = (
+            violation.violation_id,
+            violation.alert_name,
+            violation.alert_group,
+            violation.datasource_name,
+            violation.metric_name,
+            violation.severity.value,
+            violation.timestamp.timestamp(),
+            json.dumps(violation.current_value, default=str),
+            json.dumps(violation.threshold_value, default=str),
+            violation.operator,
+            violation.message,
+            int(violation.acknowledged),
+        )
+        return _INSERT_SQL, row
+
+    def flush(self):
+        """Block until every queued violation has been written"""
+        self._writer.flush()
+
+    def close(self):
+        """Flush pending writes and stop the writer thread"""
+        self._writer.close()
+        with self._read_lock:
+            self._read_conn.close()
+
+    def _purge(self, conn):
+        # Runs on the writer thread after each batch; purges at most hourly
+        now = time.time()
+        if now - self._last_purge < 3600:
+            return
+        self._last_purge = now
+        with conn:
+            conn.execute(
+                "DELETE FROM violation_history WHERE timestamp < ?",
+                (now - self.retention_days * 86400,),
+            )
+
+    def query(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        alert_name: Optional[str] = None,
+        severity: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        datasource_name: Optional[str] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Return one page of violations, newest first, and the cursor for the
+        next page (None when there are no more rows).
+        """
+        clauses = []
+        params = []
+        if alert_name is not None:
+            clauses.append("alert_name = ?")
+            params.append(alert_name)
+        if datasource_name is not None:
+            clauses.append("datasource_name = ?")
+            params.append(datasource_name)
+        if severity is not None:
+            clauses.append("severity = ?")
+            params.append(severity)
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start.timestamp())
+        if end is not None:
+            clauses.append("timestamp < ?")
+            params.append(end.timestamp())
+        if cursor:
+            last_ts, last_id = self._decode_cursor(cursor)
+            clauses.append("(timestamp, id) < (?, ?)")
+            params.extend((last_ts, last_id))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+        sql = (
+            "SELECT id, violation_id, alert_name, alert_group, datasource_name, "
+            "metric_name, severity, timestamp, current_value, threshold_value, "
+            "operator, message, acknowledged FROM violation_history "
+            f"{where} ORDER BY timestamp DESC, id DESC LIMIT ?"
+        )
+        with self._read_lock:
+            rows = self._read_conn.execute(sql, params).fetchall()
+
+        items = [self._row_to_dict(row) for row in rows]
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = f"{rows[-1][7]!r}:{rows[-1][0]}"
+        return items, next_cursor
+
+    def count(self) -> int:
+        with self._read_lock:
+            return self._read_conn.execute(
+                "SELECT COUNT(*) FROM violation_history"
+            ).fetchone()[0]
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[float, int]:
+        last_ts, _, last_id = cursor.rpartition(":")
+        return float(last_ts), int(last_id)
+
+    @staticmethod
+    def _row_to_dict(row) -> Dict:
+        return {
+            "alert_name": row[2],
+            "metric_name": row[5],
+            "current_value": json.loads(row[8]),
+            "threshold_value": json.loads(row[9]),
+            "operator": row[10],
+            "severity": row[6],
+            "message": row[11],
+            "timestamp": datetime.fromtimestamp(row[7]).isoformat(),
+            "datasource_name": row[4],
+            "alert_group": row[3],
+            "violation_id": row[1],
+            "acknowledged": bool(row[12]),
+        }
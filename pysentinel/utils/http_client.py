@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import random
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class HTTPResponse(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Allows bursts of up to ``burst`` requests and a sustained ``rate``
+    requests per second. ``pause`` blocks every caller until a deadline,
+    which is how a provider's ``Retry-After`` is shared by concurrent senders.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> Optional["TokenBucket"]:
+        if not config or not config.get("rate"):
+            return None
+        return cls(rate=config["rate"], burst=config.get("burst"))
+
+    def pause(self, seconds: float):
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self):
+        if self._lock is None:
+            # Created lazily so it binds to the loop that actually uses it
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HTTPClient:
+    """
+    Pooled keep-alive HTTP client shared by the alert channels.
+
+    Failed requests (connection errors, 429 and 5xx) are retried with
+    exponential backoff and full jitter. A ``Retry-After`` header takes
+    precedence over the computed backoff and also pauses the caller's
+    rate limiter.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        keepalive_timeout: float = 30,
+        timeout: float = 30,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30,
+        max_retry_after: float = 300,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self._session = None
+
+    def _get_session(self):
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        attempts: int = 3,
+        rate_limiter: Optional[TokenBucket] = None,
+        json: Any = None,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+    ) -> HTTPResponse:
+        """
+        Send a request, retrying retryable failures up to ``attempts`` times
+        in total. The last response is returned even if it is an error; the
+        last exception is raised if no response was received at all.
+        """
+        import aiohttp
+
+        session = self._get_session()
+        attempts = max(1, attempts)
+        for attempt in range(attempts):
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            retry_after = None
+            try:
+                async with session.request(
+                    method, url, json=json, data=data, headers=headers, params=params
+                ) as response:
+                    body = await response.read()
+                    result = HTTPResponse(response.status, dict(response.headers), body)
+                if result.status not in RETRYABLE_STATUSES or attempt == attempts - 1:
+                    return result
+                retry_after = parse_retry_after(result.headers.get("Retry-After"))
+                logger.warning(
+                    f"HTTP {result.status} from {url}, retrying ({attempt + 1}/{attempts})"
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == attempts - 1:
+                    raise
+                logger.warning(
+                    f"Request to {url} failed: {e!r}, retrying ({attempt + 1}/{attempts})"
+                )
+
+            if retry_after is not None:
+                delay = min(retry_after, self.max_retry_after)
+                if rate_limiter is not None:
+                    rate_limiter.pause(delay)
+            else:
+                delay = self._backoff(attempt)
+            await asyncio.sleep(delay)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# One client per event loop: aiohttp sessions can't be shared across loops
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, HTTPClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> HTTPClient:
+    """Return the shared HTTP client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = HTTPClient()
+    return client
+
+
+async def close_http_client():
+    """Close the shared HTTP client of the running event loop, if any"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
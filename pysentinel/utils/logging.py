@@ -0,0 +1,286 @@
+"""
+Non-blocking, structured logging for PySentinel.
+
+Nothing here runs on import. ``setup_logging`` attaches a ``QueueHandler``
+to the ``pysentinel`` logger, so a log call only formats the message and
+puts the record on a bounded queue; a ``QueueListener`` thread does the
+JSON (or text) formatting and the stream I/O. A full queue drops records
+rather than blocking the caller, which is usually the scanner's event loop.
+
+Repeated warnings and errors are rate limited before they are queued. Records
+are grouped by the ``datasource``, ``alert`` and ``channel`` extras when the
+caller passes them, otherwise by message. Each group allows ``burst`` records
+per ``interval`` seconds. The first record after a quiet spell reports how
+many were suppressed::
+
+    logger.error(f"Fetch failed: {e}", extra={"datasource": "prometheus"})
+"""
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Hashable, Optional, TextIO, Tuple
+
+ROOT_LOGGER = "pysentinel"
+
+# Extras used to group records for rate limiting, in key order
+RATE_LIMIT_FIELDS = ("datasource", "alert", "channel")
+
+# Attributes every LogRecord has; anything else was passed as ``extra``
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None))
+) | {"message", "asctime", "taskName"}
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line, with ``extra`` fields as top-level keys"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for name, value in vars(record).items():
+            if name not in _RECORD_ATTRIBUTES and not name.startswith("_"):
+                entry[name] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets through at most ``burst`` records per key every ``interval`` seconds
+    for records at ``level`` or above; lower levels always pass. The next
+    record let through for a key carries ``suppressed``, the number dropped.
+    At most ``max_keys`` keys are tracked, least recently seen evicted first.
+    """
+
+    def __init__(
+        self,
+        interval: float = 60.0,
+        burst: int = 5,
+        level: int = logging.WARNING,
+        max_keys: int = 10000,
+        clock=time.monotonic,
+    ):
+        super().__init__()
+        self.interval = interval
+        self.burst = max(1, burst)
+        self.level = level
+        self.max_keys = max_keys
+        self.clock = clock
+        self.suppressed_total = 0
+        # key -> [window start, records in window, suppressed since last emit]
+        self._windows: "OrderedDict[Hashable, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(record: logging.LogRecord) -> Tuple:
+        fields = tuple(getattr(record, name, None) for name in RATE_LIMIT_FIELDS)
+        if any(field is not None for field in fields):
+            return (record.name, record.levelno) + fields
+        return record.name, record.levelno, str(record.msg)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level or self.interval <= 0:
+            return True
+        key = self.key(record)
+        now = self.clock()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = [now, 0, 0]
+                if len(self._windows) > self.max_keys:
+                    self._windows.popitem(last=False)
+            else:
+                self._windows.move_to_end(key)
+            if now - window[0] >= self.interval:
+                window[0] = now
+                window[1] = 0
+            if window[1] >= self.burst:
+                window[2] += 1
+                self.suppressed_total += 1
+                return False
+            window[1] += 1
+            suppressed, window[2] = window[2], 0
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of waiting on a full queue"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message and traceback now, since args and exc_info may
+        # not survive the hop to the listener thread, but leave formatting
+        # (including JSON) to the listener
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _QueueListener(QueueListener):
+    def enqueue_sentinel(self):
+        # Waits for room rather than failing when stopping with a full queue
+        self.queue.put(self._sentinel)
+
+
+class _StderrHandler(logging.StreamHandler):
+    """Writes to whatever ``sys.stderr`` is when a record is emitted"""
+
+    def __init__(self):
+        super().__init__(sys.stderr)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class _SuppressedCountFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, "suppressed", None)
+        if suppressed:
+            text += f" ({suppressed} similar messages suppressed)"
+        return text
+
+
+class LoggingPipeline:
+    """Handle returned by ``setup_logging``; ``stop`` flushes and detaches"""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        handler: _NonBlockingQueueHandler,
+        listener: QueueListener,
+        rate_limit: RateLimitFilter,
+    ):
+        self.logger = logger
+        self.handler = handler
+        self.listener = listener
+        self.rate_limit = rate_limit
+        self._saved = (logger.level, logger.propagate)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "queued": self.handler.queue.qsize(),
+            "dropped": self.handler.dropped,
+            "suppressed": self.rate_limit.suppressed_total,
+        }
+
+    def stop(self):
+        """Detach the handler and write out everything already queued"""
+        if self.handler not in self.logger.handlers:
+            return
+        self.logger.removeHandler(self.handler)
+        self.logger.setLevel(self._saved[0])
+        self.logger.propagate = self._saved[1]
+        self.listener.stop()
+
+
+_pipeline: Optional[LoggingPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def setup_logging(
+    level: str = "INFO",
+    format: str = "json",
+    stream: Optional[TextIO] = None,
+    rate_limit_interval: float = 60.0,
+    rate_limit_burst: int = 5,
+    queue_size: int = 10000,
+    logger_name: str = ROOT_LOGGER,
+) -> LoggingPipeline:
+    """
+    Route the ``pysentinel`` loggers through a background writer thread.
+
+    ``format`` is "json" or "text". Calling it again replaces the previous
+    setup. Records no longer propagate to the root logger, so handlers an
+    application put there will not see PySentinel's logs twice.
+    """
+    global _pipeline
+
+    if format == "json":
+        formatter = JSONFormatter()
+    elif format == "text":
+        formatter = _SuppressedCountFormatter(
+            "%(asctime)s %(levelname)s %(name)s: %(message)s"
+        )
+    else:
+        raise ValueError(f"Unknown log format '{format}', expected json or text")
+
+    output = logging.StreamHandler(stream) if stream is not None else _StderrHandler()
+    output.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    handler = _NonBlockingQueueHandler(log_queue)
+    rate_limit = RateLimitFilter(rate_limit_interval, rate_limit_burst)
+    handler.addFilter(rate_limit)
+    listener = _QueueListener(log_queue, output, respect_handler_level=True)
+
+    logger = logging.getLogger(logger_name)
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.stop()
+        else:
+            atexit.register(stop_logging)
+        _pipeline = LoggingPipeline(logger, handler, listener, rate_limit)
+        logger.setLevel(level.upper() if isinstance(level, str) else level)
+        logger.addHandler(handler)
+        logger.propagate = False
+        listener.start()
+    return _pipeline
+
+
+def setup_logging_from_config(logging_config: Dict) -> LoggingPipeline:
+    """Call ``setup_logging`` with a ``global.logging`` config section"""
+    rate_limit = logging_config.get("rate_limit", {})
+    return setup_logging(
+        level=logging_config.get("level", "INFO"),
+        format=logging_config.get("format", "json"),
+        rate_limit_interval=rate_limit.get("interval", 60.0),
+        rate_limit_burst=rate_limit.get("burst", 5),
+        queue_size=logging_config.get("queue_size", 10000),
+    )
+
+
+def stop_logging():
+    """Flush and remove the pipeline installed by ``setup_logging``"""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.stop()
+            _pipeline = None
@@ -0,0 +1,264 @@
+import logging
+import os
+import shutil
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TS_SUFFIX = ".ts"
+_VALUE_SUFFIX = ".val"
+
+
+class _Segment:
+    """
+    A fixed-capacity pair of memory-mapped timestamp/value columns.
+
+    Each open map holds a file descriptor, so the maps are only open while
+    the segment is written or read; ``close`` drops them and keeps the
+    sample count and time range.
+    """
+
+    def __init__(self, path: str, seq: int, capacity: int, create: bool = False):
+        self.seq = seq
+        self.base = os.path.join(path, f"{seq:012d}")
+        if create:
+            for suffix in (_TS_SUFFIX, _VALUE_SUFFIX):
+                with open(self.base + suffix, "wb") as f:
+                    f.truncate(capacity * 8)
+        self.timestamps = self.values = None
+        self.open()
+        self.capacity = len(self.timestamps)
+        # Timestamps are strictly positive, so unwritten slots are the zero tail
+        self.count = 0 if create else int(np.count_nonzero(self.timestamps))
+        self.first_ts = float(self.timestamps[0]) if self.count else 0.0
+        self.last_ts = float(self.timestamps[self.count - 1]) if self.count else 0.0
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def open(self):
+        if self.timestamps is None:
+            self.timestamps = np.memmap(self.base + _TS_SUFFIX, dtype="<f8", mode="r+")
+            self.values = np.memmap(self.base + _VALUE_SUFFIX, dtype="<f8", mode="r+")
+
+    def append(self, ts: float, value: float):
+        self.open()
+        # Value first: a torn write leaves a zero timestamp, which is ignored
+        self.values[self.count] = value
+        self.timestamps[self.count] = ts
+        if not self.count:
+            self.first_ts = ts
+        self.last_ts = ts
+        self.count += 1
+
+    def slice(self, since: Optional[float], until: Optional[float]):
+        self.open()
+        timestamps = self.timestamps[: self.count]
+        lo = 0 if since is None else int(np.searchsorted(timestamps, since, "left"))
+        hi = (
+            self.count
+            if until is None
+            else int(np.searchsorted(timestamps, until, "right"))
+        )
+        return timestamps[lo:hi], self.values[lo:hi]
+
+    def flush(self):
+        if self.timestamps is not None:
+            self.timestamps.flush()
+            self.values.flush()
+
+    def close(self):
+        # Views handed out by read() keep their map alive until released
+        self.flush()
+        self.timestamps = self.values = None
+
+    def delete(self):
+        self.timestamps = self.values = None
+        for suffix in (_TS_SUFFIX, _VALUE_SUFFIX):
+            try:
+                os.remove(self.base + suffix)
+            except FileNotFoundError:
+                pass
+
+
+class _Series:
+    """All segments of one metric, oldest first; only the newest stays open"""
+
+    def __init__(self, path: str, capacity: int):
+        self.path = path
+        self.capacity = capacity
+        os.makedirs(path, exist_ok=True)
+        seqs = sorted(
+            int(name[: -len(_TS_SUFFIX)])
+            for name in os.listdir(path)
+            if name.endswith(_TS_SUFFIX)
+        )
+        self.segments: List[_Segment] = [_Segment(path, seq, capacity) for seq in seqs]
+        for segment in self.segments[:-1]:
+            segment.close()
+
+    def active(self) -> _Segment:
+        if not self.segments or self.segments[-1].full:
+            if self.segments:
+                self.segments[-1].close()
+            seq = self.segments[-1].seq + 1 if self.segments else 1
+            self.segments.append(_Segment(self.path, seq, self.capacity, create=True))
+        return self.segments[-1]
+
+    def enforce_retention(self, cutoff: Optional[float], max_segments: int):
+        # Never drop the active segment
+        while len(self.segments) > 1 and (
+            len(self.segments) > max_segments
+            or (cutoff is not None and self.segments[0].last_ts < cutoff)
+        ):
+            self.segments.pop(0).delete()
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+
+
+class MetricStore:
+    """
+    Local append-only metric history.
+
+    Each metric is stored as columnar segments: a float64 timestamp file and
+    a float64 value file, both memory-mapped and preallocated to
+    ``segment_size`` samples. Full segments are rotated, and old segments are
+    deleted by ``retention_hours`` and ``max_segments``, which bounds disk use
+    to ``16 * segment_size * max_segments`` bytes per metric.
+
+    Every open map holds a file descriptor. Only the newest segment of a
+    series is kept mapped, and at most ``max_open_series`` series are open
+    at once; the least recently used one is closed and reopened from disk
+    when it is next written or read.
+    """
+
+    def __init__(
+        self,
+        path: str = "metric_history",
+        segment_size: int = 65536,
+        retention_hours: Optional[float] = 24,
+        max_segments: int = 16,
+        max_open_series: int = 128,
+    ):
+        self.path = path
+        self.segment_size = segment_size
+        self.retention_seconds = retention_hours * 3600 if retention_hours else None
+        self.max_segments = max_segments
+        self.max_open_series = max(1, max_open_series)
+        self._series: "OrderedDict[Tuple[str, str], _Series]" = OrderedDict()
+        os.makedirs(path, exist_ok=True)
+
+    def _get_series(self, datasource_name: str, metric_name: str) -> _Series:
+        key = (datasource_name, metric_name)
+        series = self._series.get(key)
+        if series is not None:
+            self._series.move_to_end(key)
+            return series
+        series_path = os.path.join(
+            self.path, quote(datasource_name, safe=""), quote(metric_name, safe="")
+        )
+        series = self._series[key] = _Series(series_path, self.segment_size)
+        while len(self._series) > self.max_open_series:
+            self._series.popitem(last=False)[1].close()
+        return series
+
+    def append(
+        self,
+        datasource_name: str,
+        metric_name: str,
+        value: float,
+        timestamp: Optional[float] = None,
+    ):
+        """Append one sample; timestamp is epoch seconds and must not go backwards"""
+        series = self._get_series(datasource_name, metric_name)
+        rotating = not series.segments or series.segments[-1].full
+        series.active().append(
+            time.time() if timestamp is None else timestamp, float(value)
+        )
+        if rotating:
+            cutoff = (
+                time.time() - self.retention_seconds if self.retention_seconds else None
+            )
+            series.enforce_retention(cutoff, self.max_segments)
+
+    def read(
+        self,
+        datasource_name: str,
+        metric_name: str,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return ``(timestamps, values)`` for samples in ``[since, until]``.
+
+        When the range falls inside one segment the arrays are read-only
+        views of the memory map, so no data is copied; ranges spanning
+        several segments are concatenated.
+        """
+        if not self.has_series(datasource_name, metric_name):
+            return np.empty(0, dtype="<f8"), np.empty(0, dtype="<f8")
+        series = self._get_series(datasource_name, metric_name)
+        parts = []
+        for segment in series.segments:
+            if (
+                segment.count
+                and (since is None or segment.last_ts >= since)
+                and (until is None or segment.first_ts <= until)
+            ):
+                parts.append(segment.slice(since, until))
+                if segment is not series.segments[-1]:
+                    segment.close()
+        if not parts:
+            return np.empty(0, dtype="<f8"), np.empty(0, dtype="<f8")
+        if len(parts) == 1:
+            timestamps, values = parts[0]
+        else:
+            timestamps = np.concatenate([p[0] for p in parts])
+            values = np.concatenate([p[1] for p in parts])
+        timestamps = timestamps.view(np.ndarray)
+        values = values.view(np.ndarray)
+        timestamps.flags.writeable = False
+        values.flags.writeable = False
+        return timestamps, values
+
+    def metrics(self) -> List[Tuple[str, str]]:
+        """List the (datasource, metric) pairs currently open in this store"""
+        return list(self._series)
+
+    def has_series(self, datasource_name: str, metric_name: str) -> bool:
+        return (datasource_name, metric_name) in self._series or os.path.isdir(
+            os.path.join(
+                self.path, quote(datasource_name, safe=""), quote(metric_name, safe="")
+            )
+        )
+
+    def flush(self):
+        for series in self._series.values():
+            if series.segments:
+                series.segments[-1].flush()
+
+    def close(self):
+        for series in self._series.values():
+            series.close()
+        self._series.clear()
+
+    def drop(self, datasource_name: str, metric_name: Optional[str] = None):
+        """Delete stored history for one metric, or for a whole datasource"""
+        for key in [
+            k
+            for k in self._series
+            if k[0] == datasource_name and metric_name in (None, k[1])
+        ]:
+            del self._series[key]
+        target = os.path.join(self.path, quote(datasource_name, safe=""))
+        if metric_name is not None:
+            target = os.path.join(target, quote(metric_name, safe=""))
+        shutil.rmtree(target, ignore_errors=True)
@@ -0,0 +1,339 @@
+import logging
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Latency buckets in seconds, from sub-millisecond evaluation to slow fetches
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    # OpenMetrics spells the special values NaN, +Inf and -Inf
+    if isinstance(value, float) and not math.isfinite(value):
+        if math.isnan(value):
+            return "NaN"
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value", "function")
+
+    def __init__(self):
+        self.value = 0
+        self.function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def set_function(self, function: Callable[[], float]):
+        """Read the value from ``function`` at scrape time"""
+        self.function = function
+
+    def get(self) -> float:
+        if self.function is None:
+            return self.value
+        try:
+            return self.function()
+        except Exception as e:
+            logger.debug(f"Gauge callback failed: {e}")
+            return math.nan
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # One slot per bucket plus +Inf; made cumulative only when rendered
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+
+class _Metric(ABC):
+    """
+    A metric family. ``labels(*values)`` returns the child for one label
+    set; metrics without labels forward ``inc``/``set``/``observe`` to a
+    single default child.
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def labels(self, *values):
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {key}"
+                )
+            child = self._children[key] = self._new_child()
+        return child
+
+    def remove(self, *values):
+        self._children.pop(tuple(str(value) for value in values), None)
+
+    @abstractmethod
+    def _new_child(self):
+        """Create the child that holds the value for one label set"""
+        pass
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Exposition lines for every child of this family"""
+        pass
+
+    def render(self) -> str:
+        lines = [
+            f"# TYPE {self.name} {self.type_name}",
+            f"# HELP {self.name} {_escape(self.documentation)}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count; exposed as ``<name>_total``"""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1):
+        self._default.value += amount
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}_total{_format_labels(self.labelnames, key)} "
+            f"{_format_value(child.value)}"
+            for key, child in self._children.items()
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be read from a callback"""
+
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float):
+        self._default.set(value)
+
+    def inc(self, amount: float = 1):
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1):
+        self._default.dec(amount)
+
+    def set_function(self, function: Callable[[], float]):
+        self._default.set_function(function)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} "
+            f"{_format_value(child.get())}"
+            for key, child in self._children.items()
+        ]
+
+
+class Histogram(_Metric):
+    """
+    Fixed-bucket histogram. ``observe`` is a bisect and two additions, so
+    it is cheap enough for per-fetch and per-send timings.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.bounds = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(self.bounds + (math.inf,), child.counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == math.inf else f'le="{bound!r}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} "
+                    f"{cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together in the OpenMetrics text format.
+
+    The ``counter``/``gauge``/``histogram`` factories return the existing
+    metric when the name is already registered, so components that are
+    rebuilt (e.g. on config reload) keep accumulating into the same series.
+    Updates are not locked; they are expected from the event loop thread.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, *args, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(
+                f"Metric {name} is already registered as a {metric.type_name}"
+            )
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        body = "\n".join(metric.render() for metric in self._metrics.values())
+        return f"{body}\n# EOF\n" if body else "# EOF\n"
+
+
+class MetricsServer:
+    """Minimal aiohttp server exposing a registry at ``path``"""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        path: str = "/metrics",
+    ):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.path = path
+        self._runner = None
+
+    async def start(self):
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get(self.path, self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            # Report the ephemeral port actually bound
+            self.port = self._runner.addresses[0][1]
+        logger.info(
+            f"Metrics endpoint listening on http://{self.host}:{self.port}{self.path}"
+        )
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request):
+        from aiohttp import web
+
+        return web.Response(
+            body=self.registry.render().encode(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
@@ -0,0 +1,210 @@
+import json
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pysentinel.utils.sqlite_writer import SQLiteBatchWriter, Statement, connect_wal
+
+PENDING = "pending"
+DELIVERED = "delivered"
+FAILED = "failed"
+
+_ENQUEUE_SQL = """
+    INSERT OR IGNORE INTO notification_outbox (
+        idempotency_key, violation_id, channel, payload, state, attempts,
+        created_at, updated_at
+    ) VALUES (?, ?, ?, ?, 'pending', 0, ?, ?)
+"""
+_DELIVERED_SQL = """
+    UPDATE notification_outbox
+    SET state = 'delivered', attempts = attempts + 1, last_error = NULL,
+        updated_at = ?
+    WHERE idempotency_key = ?
+"""
+_FAILED_SQL = """
+    UPDATE notification_outbox
+    SET attempts = attempts + 1,
+        state = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END,
+        last_error = ?, updated_at = ?
+    WHERE idempotency_key = ? AND state = 'pending'
+"""
+
+
+def idempotency_key(violation_id: str, channel: str) -> str:
+    return f"{violation_id}:{channel}"
+
+
+class NotificationOutbox:
+    """
+    Durable notification outbox backed by SQLite in WAL mode.
+
+    Every (violation, channel) pair gets a row keyed by
+    ``violation_id:channel``, so enqueueing the same violation twice is a
+    no-op. Enqueues and delivery-state updates share one background writer
+    and are committed together in batches. Rows still ``pending`` when the
+    process stops are returned by ``pending()`` on the next start and
+    delivered again, giving at-least-once delivery.
+
+    Given the ``writer`` of another store on the same database (the
+    scanner passes the history database's), the outbox shares it, and
+    ``enqueue`` commits its rows in the same transaction as the statements
+    passed with them, so a crash loses both or neither.
+    """
+
+    def __init__(
+        self,
+        db_path="outbox.db",
+        max_attempts=10,
+        batch_size=500,
+        poll_interval=0.05,
+        max_queue_size=100_000,
+        retention_days=7,
+        writer: Optional[SQLiteBatchWriter] = None,
+    ):
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.retention_days = retention_days
+        self._last_purge = 0.0
+
+        self._read_lock = threading.Lock()
+        self._read_conn = connect_wal(db_path)
+        self._create_table(self._read_conn)
+
+        self._owns_writer = writer is None
+        if writer is None:
+            writer = SQLiteBatchWriter(
+                db_path,
+                name="pysentinel-outbox-writer",
+                batch_size=batch_size,
+                poll_interval=poll_interval,
+                max_queue_size=max_queue_size,
+            )
+        elif writer.db_path != db_path:
+            raise ValueError("A shared writer must write to the outbox database")
+        if retention_days:
+            writer.add_maintenance(self._purge)
+        self._writer = writer
+
+    @property
+    def dropped(self) -> int:
+        return self._writer.dropped
+
+    @staticmethod
+    def _create_table(conn):
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS notification_outbox (
+                    idempotency_key TEXT PRIMARY KEY,
+                    violation_id TEXT NOT NULL,
+                    channel TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_notification_outbox_state "
+                "ON notification_outbox (state, created_at)"
+            )
+
+    def enqueue(
+        self,
+        violation,
+        channels: Iterable[str],
+        with_statements: Sequence[Statement] = (),
+    ) -> bool:
+        """
+        Record that ``violation`` must be delivered to each of ``channels``,
+        committed together with ``with_statements``. Returns False, and
+        writes nothing, if the writer queue is full.
+        """
+        now = time.time()
+        payload = json.dumps(violation.to_dict(), default=str)
+        statements = list(with_statements)
+        for channel in channels:
+            statements.append(
+                (
+                    _ENQUEUE_SQL,
+                    (
+                        idempotency_key(violation.violation_id, channel),
+                        violation.violation_id,
+                        channel,
+                        payload,
+                        now,
+                        now,
+                    ),
+                )
+            )
+        return self._writer.submit_many(statements)
+
+    def mark_delivered(self, violation_id: str, channel: str):
+        self._writer.submit(
+            _DELIVERED_SQL, (time.time(), idempotency_key(violation_id, channel))
+        )
+
+    def mark_failed(self, violation_id: str, channel: str, error: str = None):
+        self._writer.submit(
+            _FAILED_SQL,
+            (
+                self.max_attempts,
+                error,
+                time.time(),
+                idempotency_key(violation_id, channel),
+            ),
+        )
+
+    def pending(
+        self, limit: Optional[int] = None, older_than: Optional[float] = None
+    ) -> List[Tuple[Dict, str]]:
+        """
+        Return ``(violation_dict, channel)`` for undelivered notifications,
+        oldest first. ``older_than`` skips rows updated in the last N seconds.
+        """
+        self._writer.flush()
+        sql = "SELECT payload, channel FROM notification_outbox WHERE state = 'pending'"
+        params = []
+        if older_than is not None:
+            sql += " AND updated_at <= ?"
+            params.append(time.time() - older_than)
+        sql += " ORDER BY created_at"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._read_lock:
+            rows = self._read_conn.execute(sql, params).fetchall()
+        return [(json.loads(payload), channel) for payload, channel in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of outbox rows per delivery state"""
+        with self._read_lock:
+            rows = self._read_conn.execute(
+                "SELECT state, COUNT(*) FROM notification_outbox GROUP BY state"
+            ).fetchall()
+        return {PENDING: 0, DELIVERED: 0, FAILED: 0, **dict(rows)}
+
+    def flush(self):
+        self._writer.flush()
+
+    def close(self):
+        if self._owns_writer:
+            self._writer.close()
+        else:
+            self._writer.flush()
+        with self._read_lock:
+            self._read_conn.close()
+
+    def _purge(self, conn):
+        # Delivered rows are only kept for idempotency; drop them after retention
+        now = time.time()
+        if now - self._last_purge < 3600:
+            return
+        self._last_purge = now
+        with conn:
+            conn.execute(
+                "DELETE FROM notification_outbox WHERE state != 'pending' "
+                "AND updated_at < ?",
+                (now - self.retention_days * 86400,),
+            )
@@ -0,0 +1,129 @@
+import logging
+import queue
+import sqlite3
+import threading
+from itertools import groupby
+from typing import Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+Statement = Tuple[str, Sequence]
+
+
+def connect_wal(db_path: str) -> sqlite3.Connection:
+    """Open a SQLite connection in WAL mode with relaxed fsync"""
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class SQLiteBatchWriter:
+    """
+    Background thread that applies queued SQL statements in batches.
+
+    ``submit`` only enqueues ``(sql, params)``; the writer drains whatever is
+    queued (up to ``batch_size``) and applies it in a single transaction,
+    grouping consecutive statements with the same SQL into ``executemany``.
+    Statements passed together to ``submit_many`` are one queue item, so
+    they always land in the same transaction. Several stores may share one
+    writer (and database); each registers its own ``maintenance`` hook.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        name: str,
+        batch_size: int = 500,
+        poll_interval: float = 1.0,
+        max_queue_size: int = 100_000,
+        maintenance: Optional[Callable[[sqlite3.Connection], None]] = None,
+    ):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._maintenance: List[Callable[[sqlite3.Connection], None]] = []
+        if maintenance is not None:
+            self._maintenance.append(maintenance)
+        self.dropped = 0
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, sql: str, params: Sequence) -> bool:
+        """Queue a statement; returns False if the queue is full"""
+        return self.submit_many([(sql, params)])
+
+    def submit_many(self, statements: Sequence[Statement]) -> bool:
+        """Queue statements to commit together; False if the queue is full"""
+        try:
+            self._queue.put_nowait(tuple(statements))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def add_maintenance(self, maintenance: Callable[[sqlite3.Connection], None]):
+        """Run ``maintenance`` on the writer thread after each batch"""
+        self._maintenance.append(maintenance)
+
+    def flush(self):
+        """Block until every queued statement has been committed"""
+        self._queue.join()
+
+    def close(self):
+        """Commit pending statements and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _run(self):
+        conn = connect_wal(self.db_path)
+        try:
+            while True:
+                batch = []
+                stop = False
+                try:
+                    item = self._queue.get(timeout=self.poll_interval)
+                    if item is _STOP:
+                        stop = True
+                    else:
+                        batch.append(item)
+                except queue.Empty:
+                    pass
+
+                while not stop and len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                    else:
+                        batch.append(item)
+
+                try:
+                    if batch:
+                        self._apply(conn, batch)
+                    for maintenance in self._maintenance:
+                        maintenance(conn)
+                except Exception as e:
+                    logger.error(f"Failed to write batch to {self.db_path}: {e}")
+                finally:
+                    for _ in range(len(batch) + stop):
+                        self._queue.task_done()
+
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _apply(conn: sqlite3.Connection, batch: Sequence[Sequence[Statement]]):
+        flat = [statement for item in batch for statement in item]
+        with conn:
+            for sql, statements in groupby(flat, key=lambda item: item[0]):
+                conn.executemany(sql, [params for _, params in statements])
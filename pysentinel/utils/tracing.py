@@ -0,0 +1,364 @@
+import asyncio
+import itertools
+import json
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[Optional["Span"]] = ContextVar("pysentinel_span", default=None)
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class _NoopSpan:
+    """Returned for unsampled traces; every operation is a no-op"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def child(self, name: str, **attributes) -> "_NoopSpan":
+        return self
+
+    @property
+    def sampled(self) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """
+    One timed operation. Trace and span ids follow the W3C/OpenTelemetry
+    format (128-bit and 64-bit hex), so exported files line up with spans
+    from instrumented services. Used as a context manager, a span becomes
+    the parent of spans started inside it, including in child tasks.
+    """
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "status",
+        "status_message",
+        "lane",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.attributes = attributes or {}
+        self.start_ns = 0
+        self.end_ns = 0
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self.lane = 0
+        self._token = None
+
+    @property
+    def sampled(self) -> bool:
+        return True
+
+    @property
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header value for propagating this span"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def child(self, name: str, **attributes) -> "Span":
+        return Span(self.tracer, name, self.trace_id, self.span_id, attributes)
+
+    def __enter__(self):
+        self.lane = self.tracer.lane()
+        self._token = _current.set(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.time_ns()
+        _current.reset(self._token)
+        if exc_type is not None and not issubclass(exc_type, asyncio.CancelledError):
+            self.status = STATUS_ERROR
+            self.status_message = str(exc)
+        self.tracer.export(self)
+        return False
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def span(name: str, **attributes):
+    """Start a child of the current span, or a no-op outside a sampled trace"""
+    parent = _current.get()
+    if parent is None:
+        return NOOP_SPAN
+    return Span(parent.tracer, name, parent.trace_id, parent.span_id, attributes)
+
+
+class use_span:
+    """Make ``parent`` current, e.g. in a worker handling queued work"""
+
+    __slots__ = ("parent", "_token")
+
+    def __init__(self, parent: Optional[Span]):
+        self.parent = parent
+        self._token = None
+
+    def __enter__(self):
+        if self.parent is not None:
+            self._token = _current.set(self.parent)
+        return self.parent
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._token is not None:
+            _current.reset(self._token)
+        return False
+
+
+class ChromeTraceExporter:
+    """
+    Writes Chrome trace-event "complete" events, loadable in Perfetto and
+    chrome://tracing. The file is a streamed JSON array; the closing
+    bracket is optional in this format, so a crash leaves it readable.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "w")
+        self._file.write("[\n")
+        self._first = True
+        self._pid = os.getpid()
+
+    def export(self, spans: List[Span]):
+        for item in spans:
+            event = {
+                "name": item.name,
+                "cat": "pysentinel",
+                "ph": "X",
+                "ts": item.start_ns / 1000,
+                "dur": item.duration_ns / 1000,
+                "pid": self._pid,
+                "tid": item.lane,
+                "args": {
+                    **item.attributes,
+                    "trace_id": item.trace_id,
+                    "span_id": item.span_id,
+                },
+            }
+            if item.status == STATUS_ERROR:
+                event["args"]["error"] = item.status_message
+            self._file.write(
+                ("" if self._first else ",\n") + json.dumps(event, default=str)
+            )
+            self._first = False
+
+    def close(self):
+        if not self._file.closed:
+            self._file.write("\n]\n")
+            self._file.close()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OTLPJSONExporter:
+    """
+    Writes spans as OTLP/JSON ``TracesData``, one JSON document per line,
+    the layout of the OpenTelemetry Collector file exporter. The file can
+    be replayed into any OTLP backend.
+    """
+
+    def __init__(self, path: str, service_name: str = "pysentinel"):
+        self.path = path
+        self.service_name = service_name
+        self._file = open(path, "a")
+
+    def export(self, spans: List[Span]):
+        document = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": self.service_name},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "pysentinel"},
+                            "spans": [self._span(item) for item in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        self._file.write(json.dumps(document, separators=(",", ":")) + "\n")
+
+    @staticmethod
+    def _span(item: Span) -> Dict[str, Any]:
+        data = {
+            "traceId": item.trace_id,
+            "spanId": item.span_id,
+            "name": item.name,
+            "kind": 1,
+            "startTimeUnixNano": str(item.start_ns),
+            "endTimeUnixNano": str(item.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in item.attributes.items()
+            ],
+            "status": {"code": item.status},
+        }
+        if item.parent_id:
+            data["parentSpanId"] = item.parent_id
+        if item.status_message:
+            data["status"]["message"] = item.status_message
+        return data
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+EXPORTERS = {"chrome": ChromeTraceExporter, "otlp": OTLPJSONExporter}
+
+
+class Tracer:
+    """
+    Head-sampling tracer. The keep/drop decision is made once per trace in
+    ``start_trace``; unsampled traces get ``NOOP_SPAN``, so the cost on the
+    hot path is a random draw per tick and a context lookup per phase.
+
+    Finished spans are buffered and handed to the exporter in batches when
+    a root span ends or the buffer fills.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        exporter=None,
+        max_buffer: int = 512,
+        sampler: Callable[[], float] = random.random,
+    ):
+        self.sample_rate = sample_rate if exporter is not None else 0.0
+        self.exporter = exporter
+        self.max_buffer = max_buffer
+        self.sampler = sampler
+        self.sampled = 0
+        self._buffer: List[Span] = []
+        self._lanes = weakref.WeakKeyDictionary()
+        self._lane_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> "Tracer":
+        if not config or not config.get("enabled", False):
+            return cls()
+        fmt = config.get("format", "chrome")
+        if fmt not in EXPORTERS:
+            raise ValueError(f"Unknown trace format: {fmt}")
+        path = config.get("path", f"pysentinel-trace.{fmt}.json")
+        return cls(
+            sample_rate=config.get("sample_rate", 0.01),
+            exporter=EXPORTERS[fmt](path),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    def start_trace(self, name: str, **attributes):
+        if self.sample_rate <= 0 or (
+            self.sample_rate < 1 and self.sampler() >= self.sample_rate
+        ):
+            return NOOP_SPAN
+        self.sampled += 1
+        return Span(self, name, f"{random.getrandbits(128):032x}", None, attributes)
+
+    def lane(self) -> int:
+        """Small stable id for the current task, used as the Chrome ``tid``"""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is None:
+            return 0
+        lane = self._lanes.get(task)
+        if lane is None:
+            lane = self._lanes[task] = next(self._lane_ids)
+        return lane
+
+    def export(self, item: Span):
+        with self._lock:
+            self._buffer.append(item)
+            if item.parent_id is not None and len(self._buffer) < self.max_buffer:
+                return
+            spans, self._buffer = self._buffer, []
+        self._write(spans)
+
+    def flush(self):
+        with self._lock:
+            spans, self._buffer = self._buffer, []
+        if spans:
+            self._write(spans)
+
+    def _write(self, spans: List[Span]):
+        try:
+            self.exporter.export(spans)
+        except Exception as e:
+            logger.error(f"Failed to export {len(spans)} spans: {e}")
+
+    def close(self):
+        if self.exporter is not None:
+            self.flush()
+            self.exporter.close()
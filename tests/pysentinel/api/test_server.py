@@ -0,0 +1,207 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from pysentinel.api import APIServer
+from pysentinel.core.scanner import Scanner
+from pysentinel.core.threshold import AlertDefinition
+from pysentinel.utils.constants import Severity
+
+ALERT = AlertDefinition(
+    name="cpu",
+    metrics="m",
+    query="q",
+    datasource="db",
+    threshold={"max": 5},
+    severity=Severity.WARNING,
+    interval=60,
+    alert_channels=[],
+    description="High CPU",
+)
+
+
+async def make_client(api):
+    client = TestClient(TestServer(api.create_app()))
+    await client.start_server()
+    return client
+
+
+def add_active(scanner, count):
+    violations = []
+    for i in range(count):
+        violation = ALERT.create_violation(10 + i, f"db{i}")
+        scanner._active_violations[(f"db{i}", "cpu")] = violation
+        violations.append(violation)
+    return violations
+
+
+@pytest.mark.asyncio
+async def test_active_alerts_are_paginated_with_etag():
+    scanner = Scanner()
+    add_active(scanner, 3)
+    client = await make_client(APIServer(scanner))
+    try:
+        response = await client.get("/api/alerts", params={"limit": 2})
+        page = await response.json()
+        etag = response.headers["ETag"]
+
+        cached = await client.get(
+            "/api/alerts", params={"limit": 2}, headers={"If-None-Match": etag}
+        )
+        second = await client.get("/api/alerts", params={"limit": 2, "offset": 2})
+        last_page = await second.json()
+    finally:
+        await client.close()
+
+    assert [item["datasource_name"] for item in page["items"]] == ["db0", "db1"]
+    assert page["total"] == 3 and page["next_offset"] == 2
+    assert cached.status == 304
+    assert last_page["next_offset"] is None
+
+
+@pytest.mark.asyncio
+async def test_status_lists_configured_datasources():
+    scanner = Scanner(
+        {
+            "datasources": {
+                "db": {"type": "http", "enabled": True, "base_url": "http://db"}
+            }
+        }
+    )
+    client = await make_client(APIServer(scanner))
+    try:
+        response = await client.get("/api/status")
+        status = await response.json()
+    finally:
+        await client.close()
+
+    assert response.status == 200
+    assert status["datasources"] == ["db"]
+    assert status["status"] == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_invalid_query_parameters_are_rejected():
+    scanner = Scanner()
+    scanner._violation_history.append(ALERT.create_violation(10, "db"))
+    client = await make_client(APIServer(scanner))
+    try:
+        bad_severity = await client.get(
+            "/api/alerts/history", params={"severity": "bogus"}
+        )
+        message = (await bad_severity.json())["error"]
+        bad_limit = await client.get("/api/alerts/history", params={"limit": "x"})
+        bad_offset = await client.get("/api/alerts", params={"offset": "x"})
+        good = await client.get("/api/alerts/history", params={"severity": "warning"})
+        items = (await good.json())["items"]
+    finally:
+        await client.close()
+
+    assert bad_severity.status == 400 and "severity must be one of" in message
+    assert bad_limit.status == 400
+    assert bad_offset.status == 400
+    assert [item["alert_name"] for item in items] == ["cpu"]
+
+
+@pytest.mark.asyncio
+async def test_persisted_history_filters_by_datasource(tmp_path):
+    scanner = Scanner(
+        {"global": {"history_db": {"enabled": True, "path": str(tmp_path / "h.db")}}}
+    )
+    for datasource in ("db1", "db2", "db1"):
+        scanner._history_db.record(ALERT.create_violation(10, datasource))
+    scanner._history_db.flush()
+    client = await make_client(APIServer(scanner))
+    try:
+        response = await client.get(
+            "/api/alerts/history", params={"datasource_name": "db1"}
+        )
+        page = await response.json()
+    finally:
+        await client.close()
+        scanner._history_db.close()
+
+    assert response.status == 200
+    assert [item["datasource_name"] for item in page["items"]] == ["db1", "db1"]
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_acknowledge_alert():
+    scanner = Scanner()
+    (violation,) = add_active(scanner, 1)
+    client = await make_client(APIServer(scanner))
+    try:
+        missing = await client.post("/api/alerts/nope/ack")
+        response = await client.post(f"/api/alerts/{violation.violation_id}/ack")
+    finally:
+        await client.close()
+
+    assert missing.status == 404
+    assert response.status == 200
+    assert violation.acknowledged
+
+
+@pytest.mark.asyncio
+async def test_token_is_required_when_configured():
+    client = await make_client(APIServer(Scanner(), token="secret"))
+    try:
+        denied = await client.get("/api/metrics")
+        allowed = await client.get(
+            "/api/metrics", headers={"Authorization": "Bearer secret"}
+        )
+    finally:
+        await client.close()
+
+    assert denied.status == 401
+    assert allowed.status == 200
+
+
+@pytest.mark.asyncio
+async def test_live_events_are_serialized_once_for_all_clients():
+    scanner = Scanner()
+    api = APIServer(scanner)
+    first = api.frames.subscribe("frames")
+    second = api.frames.subscribe("frames")
+    pump = asyncio.ensure_future(api._pump("alerts", api._alert_frame))
+    await asyncio.sleep(0)
+
+    violation = ALERT.create_violation(10, "db")
+    await scanner.events.publish("alerts", violation)
+    frame = await asyncio.wait_for(first.get(), 1)
+
+    assert await asyncio.wait_for(second.get(), 1) is frame
+    assert json.loads(frame.data)["data"]["violation_id"] == violation.violation_id
+    assert frame.sse.startswith(b"event: alerts\ndata: ")
+    pump.cancel()
+
+
+@pytest.mark.asyncio
+async def test_sse_and_websocket_clients_receive_alerts():
+    scanner = Scanner()
+    api = APIServer(scanner)
+    pump = asyncio.ensure_future(api._pump("alerts", api._alert_frame))
+    client = await make_client(api)
+    try:
+        sse = await client.get("/api/events", params={"topics": "alerts"})
+        assert await sse.content.readuntil(b"\n\n") == b"retry: 3000\n\n"
+        ws = await client.ws_connect("/api/ws")
+        while api.frames.subscriber_count("frames") < 2:
+            await asyncio.sleep(0.01)
+
+        violation = ALERT.create_violation(10, "db")
+        await scanner.events.publish("alerts", violation)
+
+        event = await asyncio.wait_for(sse.content.readuntil(b"\n\n"), 1)
+        message = await asyncio.wait_for(ws.receive_json(), 1)
+        await ws.close()
+        sse.close()
+    finally:
+        api.frames.close()
+        pump.cancel()
+        await client.close()
+
+    assert event.startswith(b"event: alerts\n")
+    assert message["data"]["violation_id"] == violation.violation_id
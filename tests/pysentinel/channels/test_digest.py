@@ -0,0 +1,121 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pysentinel.channels.base import AlertChannel
+from pysentinel.channels.digest import DigestChannel, group_violations
+from pysentinel.channels.slack import Slack
+from pysentinel.channels.telegram import Telegram
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+
+
+class RecordingChannel(AlertChannel):
+    def __init__(self):
+        super().__init__("recorder", {})
+        self.batches = []
+
+    async def send_alert(self, violation):
+        self.batches.append([violation])
+        return True
+
+    async def send_batch(self, violations):
+        self.batches.append(list(violations))
+        return True
+
+
+def make_violation(name, group="db", severity=Severity.WARNING):
+    return Violation(
+        alert_name=name,
+        metric_name="m",
+        current_value=10,
+        threshold_value=5,
+        operator="<=",
+        severity=severity,
+        message=f"{name} fired",
+        timestamp=datetime.now(),
+        datasource_name="ds",
+        alert_group=group,
+    )
+
+
+@pytest.mark.asyncio
+async def test_digest_flushes_after_window():
+    inner = RecordingChannel()
+    digest = DigestChannel(inner, window_seconds=0.05, max_batch=100)
+
+    for i in range(5):
+        assert await digest.send_alert(make_violation(f"a{i}")) is True
+    assert inner.batches == []
+
+    await asyncio.sleep(0.1)
+    assert len(inner.batches) == 1
+    assert len(inner.batches[0]) == 5
+    assert digest.received == 5 and digest.batches_sent == 1
+
+
+@pytest.mark.asyncio
+async def test_digest_flushes_when_batch_is_full_and_on_close():
+    inner = RecordingChannel()
+    digest = DigestChannel(inner, window_seconds=60, max_batch=3)
+
+    for i in range(4):
+        await digest.send_alert(make_violation(f"a{i}"))
+    await asyncio.sleep(0)
+    assert [len(batch) for batch in inner.batches] == [3]
+
+    await digest.close()
+    assert [len(batch) for batch in inner.batches] == [3, 1]
+
+
+def test_group_violations_orders_by_severity_then_group():
+    violations = [
+        make_violation("w1", group="b"),
+        make_violation("c1", group="b", severity=Severity.CRITICAL),
+        make_violation("w2", group="a"),
+        make_violation("w3", group="b"),
+    ]
+    groups = group_violations(violations)
+    assert [key for key, _ in groups] == [
+        ("b", Severity.CRITICAL),
+        ("a", Severity.WARNING),
+        ("b", Severity.WARNING),
+    ]
+    assert [v.alert_name for v in groups[2][1]] == ["w1", "w3"]
+
+
+@pytest.mark.asyncio
+async def test_slack_batch_renders_one_grouped_message():
+    slack = Slack(
+        "slack",
+        {"channel": "#alerts", "username": "bot", "icon_emoji": ":x:"},
+    )
+    slack._post = AsyncMock(return_value=True)
+
+    await slack.send_batch(
+        [
+            make_violation("a"),
+            make_violation("b", severity=Severity.CRITICAL),
+            make_violation("c"),
+        ]
+    )
+
+    slack._post.assert_awaited_once()
+    payload = slack._post.await_args.args[0]
+    assert "3" in payload["text"]
+    assert len(payload["attachments"]) == 2
+    assert payload["attachments"][0]["color"] == "danger"
+
+
+@pytest.mark.asyncio
+async def test_telegram_batch_renders_one_message():
+    telegram = Telegram("tg", {"chat_id": "1"})
+    telegram._post = AsyncMock(return_value=True)
+
+    await telegram.send_batch([make_violation("a"), make_violation("b")])
+
+    telegram._post.assert_awaited_once()
+    text = telegram._post.await_args.args[0]
+    assert "a: 10" in text and "b: 10" in text
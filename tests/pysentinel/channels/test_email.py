@@ -0,0 +1,188 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from pysentinel.channels.email import Email
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+
+
+class StubSMTPServer:
+    """Minimal in-process SMTP server that records sessions and messages"""
+
+    def __init__(self, reject=None):
+        self.connections = 0
+        self.messages = []
+        # Messages containing this text get a permanent DATA failure
+        self.reject = reject
+        self._server = None
+        self.port = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        writer.write(b"220 stub ESMTP\r\n")
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                writer.write(b"250 stub\r\n")
+            elif command == "DATA":
+                writer.write(b"354 go ahead\r\n")
+                await writer.drain()
+                data = []
+                while True:
+                    body_line = await reader.readline()
+                    if body_line in (b".\r\n", b""):
+                        break
+                    data.append(body_line)
+                message = b"".join(data).decode()
+                if self.reject and self.reject in message:
+                    writer.write(b"554 rejected\r\n")
+                else:
+                    self.messages.append(message)
+                    writer.write(b"250 queued\r\n")
+            elif command == "QUIT":
+                writer.write(b"221 bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"250 ok\r\n")
+            await writer.drain()
+        writer.close()
+
+
+def make_violation(name="cpu_high"):
+    return Violation(
+        alert_name=name,
+        metric_name="cpu",
+        current_value=95,
+        threshold_value=90,
+        operator="<=",
+        severity=Severity.CRITICAL,
+        message="CPU usage is too high",
+        timestamp=datetime.now(),
+        datasource_name="db",
+    )
+
+
+@asynccontextmanager
+async def running_smtp_server(**kwargs):
+    server = StubSMTPServer(**kwargs)
+    await server.start()
+    try:
+        yield server
+    finally:
+        await server.stop()
+
+
+def make_channel(port, **overrides):
+    config = {
+        "smtp_server": "127.0.0.1",
+        "smtp_port": port,
+        "use_tls": False,
+        "from_address": "alerts@example.com",
+        "recipients": ["oncall@example.com"],
+        "subject_template": "[ALERT] {alert_title}",
+    }
+    config.update(overrides)
+    return Email("email", config)
+
+
+@pytest.mark.asyncio
+async def test_alerts_reuse_one_smtp_session():
+    async with running_smtp_server() as smtp_server:
+        channel = make_channel(smtp_server.port)
+        try:
+            assert await channel.send_alert(make_violation("a")) is True
+            assert await channel.send_alert(make_violation("b")) is True
+            assert await channel.send_batch([make_violation("c"), make_violation("d")])
+        finally:
+            await channel.close()
+
+        assert smtp_server.connections == 1
+        assert len(smtp_server.messages) == 4
+        assert "Subject: [ALERT] a" in smtp_server.messages[0]
+
+
+@pytest.mark.asyncio
+async def test_reconnects_after_idle_timeout():
+    async with running_smtp_server() as smtp_server:
+        channel = make_channel(smtp_server.port, idle_timeout=0)
+        try:
+            await channel.send_alert(make_violation())
+            await channel.send_alert(make_violation())
+        finally:
+            await channel.close()
+
+        assert len(smtp_server.messages) == 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_keeps_running_during_send():
+    async with running_smtp_server() as smtp_server:
+        channel = make_channel(smtp_server.port)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        try:
+            assert await channel.send_alert(make_violation()) is True
+        finally:
+            task.cancel()
+            await channel.close()
+        assert ticks > 1
+
+
+@pytest.mark.asyncio
+async def test_send_failure_returns_false():
+    channel = make_channel(1, timeout=1)
+    try:
+        assert await channel.send_alert(make_violation()) is False
+    finally:
+        await channel.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_each_message_separately():
+    async with running_smtp_server(reject="[ALERT] bad") as smtp_server:
+        channel = make_channel(smtp_server.port)
+        try:
+            results = await channel.send_each(
+                [make_violation("a"), make_violation("bad"), make_violation("c")]
+            )
+        finally:
+            await channel.close()
+
+        assert results == [True, False, True]
+        assert len(smtp_server.messages) == 2
+        assert smtp_server.connections == 1
+
+
+@pytest.mark.parametrize(
+    "use_ssl, smtp_class, port", [(False, "SMTP", 587), (True, "SMTP_SSL", 465)]
+)
+def test_smtp_port_defaults_to_submission_port(use_ssl, smtp_class, port):
+    channel = Email("email", {"smtp_server": "mail", "use_ssl": use_ssl})
+    with patch(f"smtplib.{smtp_class}") as mock_smtp:
+        channel._session()
+    channel._executor.shutdown(wait=False)
+
+    mock_smtp.assert_called_once_with("mail", port, timeout=30)
@@ -0,0 +1,121 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pysentinel.channels.slack import Slack
+from pysentinel.channels.telegram import Telegram
+from pysentinel.channels.templates import StructuredTemplate, Template
+from pysentinel.channels.webhook import Webhook
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+from pysentinel.utils.exception import TemplateException
+
+
+def make_violation(severity=Severity.CRITICAL):
+    return Violation(
+        alert_name="High CPU",
+        metric_name="cpu",
+        current_value=97.5,
+        threshold_value=90,
+        operator="<=",
+        severity=severity,
+        message="CPU too high",
+        timestamp=datetime(2024, 1, 2, 3, 4, 5),
+        datasource_name="prod",
+        alert_group="system",
+    )
+
+
+def test_text_template_renders_fields_and_format_specs():
+    template = Template(
+        "[{severity_upper}] {alert_name} {threshold} @ {timestamp:%H:%M}"
+    )
+
+    assert template.render(make_violation()) == "[CRITICAL] High CPU <= 90 @ 03:04"
+
+
+def test_static_text_template_is_cached():
+    template = Template("no placeholders")
+
+    assert template.render(make_violation()) is template.render(make_violation())
+
+
+def test_unknown_field_fails_at_compile_time():
+    with pytest.raises(TemplateException):
+        Template("{nope}")
+    with pytest.raises(TemplateException):
+        StructuredTemplate({"a": ["{nope}"]})
+
+
+def test_structured_template_keeps_raw_values_and_shares_static_parts():
+    template = StructuredTemplate(
+        {
+            "value": "{current_value}",
+            "label": "{alert_name} is {current_value}",
+            "meta": {"source": "pysentinel", "tags": ["a", "b"]},
+        }
+    )
+
+    first = template.render(make_violation())
+    second = template.render(make_violation(Severity.WARNING))
+
+    assert first["value"] == 97.5
+    assert first["label"] == "High CPU is 97.5"
+    assert first["meta"] == {"source": "pysentinel", "tags": ["a", "b"]}
+    assert first["meta"] is second["meta"]
+
+
+def test_default_telegram_template_matches_previous_format():
+    channel = Telegram("tg", {"chat_id": "1", "webhook_url": "http://t"})
+
+    assert channel.templates["message"].render(make_violation()) == (
+        "🚨 *CRITICAL* Alert: High CPU\n"
+        "Message: CPU too high\n"
+        "Current Value: 97.5\n"
+        "Threshold: <= 90\n"
+        "Datasource: prod\n"
+        "Time: 2024-01-02 03:04:05 UTC"
+    )
+
+
+@pytest.mark.asyncio
+async def test_slack_uses_configured_template():
+    channel = Slack(
+        "slack",
+        {
+            "channel": "#alerts",
+            "username": "bot",
+            "icon_emoji": ":x:",
+            "webhook_url": "http://s",
+            "templates": {"message": "{alert_name}: {current_value}"},
+        },
+    )
+    channel._post = AsyncMock(return_value=True)
+
+    await channel.send_alert(make_violation())
+
+    payload = channel._post.call_args.args[0]
+    assert payload["text"] == "High CPU: 97.5"
+    assert payload["channel"] == "#alerts"
+
+
+def test_webhook_payload_template():
+    channel = Webhook(
+        "hook",
+        {
+            "url": "http://w",
+            "templates": {"payload": {"id": "{violation_id}", "v": "{current_value}"}},
+        },
+    )
+    violation = make_violation()
+
+    assert channel._payload(violation) == {
+        "id": violation.violation_id,
+        "v": 97.5,
+    }
+
+
+def test_unknown_template_name_is_rejected():
+    with pytest.raises(TemplateException):
+        Webhook("hook", {"url": "http://w", "templates": {"body": "x"}})
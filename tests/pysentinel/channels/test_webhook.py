@@ -0,0 +1,109 @@
+import gzip
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pysentinel.channels.digest import DigestChannel
+from pysentinel.channels.webhook import Webhook
+from pysentinel.core.scanner import Scanner
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+from pysentinel.utils.http_client import HTTPResponse
+
+
+def make_violation(name):
+    return Violation(
+        alert_name=name,
+        metric_name="m",
+        current_value=10,
+        threshold_value=5,
+        operator="<=",
+        severity=Severity.WARNING,
+        message="fired",
+        timestamp=datetime(2024, 1, 1),
+        datasource_name="ds",
+    )
+
+
+def make_webhook(**config):
+    channel = Webhook("hook", {"url": "http://ingest", **config})
+    channel._http_request = AsyncMock(return_value=HTTPResponse(200, {}, b""))
+    return channel
+
+
+def test_headers_resolved_once_without_mutating_config(monkeypatch):
+    monkeypatch.setenv("INGEST_TOKEN", "secret")
+    config_headers = {"Authorization": "${INGEST_TOKEN}"}
+
+    channel = make_webhook(headers=config_headers)
+
+    assert channel.headers["Authorization"] == "secret"
+    assert config_headers == {"Authorization": "${INGEST_TOKEN}"}
+    assert "Content-Encoding" not in channel.headers
+
+
+@pytest.mark.asyncio
+async def test_single_alert_is_plain_json():
+    channel = make_webhook()
+    violation = make_violation("cpu")
+
+    assert await channel.send_alert(violation) is True
+
+    kwargs = channel._http_request.call_args.kwargs
+    assert json.loads(kwargs["data"]) == violation.to_dict()
+    assert kwargs["headers"]["Idempotency-Key"] == f"{violation.violation_id}:hook"
+
+
+@pytest.mark.asyncio
+async def test_batch_mode_posts_gzipped_array():
+    channel = make_webhook(batch={"max_batch": 3})
+    violations = [make_violation(f"a{i}") for i in range(3)]
+
+    assert await channel.send_batch(violations) is True
+
+    kwargs = channel._http_request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    body = json.loads(gzip.decompress(kwargs["data"]))
+    assert [item["alert_name"] for item in body] == ["a0", "a1", "a2"]
+
+    # Resending the same violations reuses the key, in any order
+    key = kwargs["headers"]["Idempotency-Key"]
+    await channel.send_batch(violations[::-1])
+    assert channel._http_request.call_args.kwargs["headers"]["Idempotency-Key"] == key
+    await channel.send_batch(violations[:2])
+    assert channel._http_request.call_args.kwargs["headers"]["Idempotency-Key"] != key
+
+
+@pytest.mark.asyncio
+async def test_batch_flushes_when_full():
+    channel = make_webhook(batch={"max_batch": 2, "window_seconds": 60})
+    digest = DigestChannel(channel, window_seconds=60, max_batch=2)
+
+    await digest.send_alert(make_violation("a"))
+    channel._http_request.assert_not_awaited()
+    await digest.send_alert(make_violation("b"))
+    await digest.close()
+
+    assert channel._http_request.await_count == 1
+
+
+@patch("pysentinel.core.scanner.load_config")
+def test_scanner_wraps_batched_webhook(mock_load):
+    mock_load.return_value = {
+        "alert_channels": {
+            "ingest": {
+                "type": "webhook",
+                "url": "http://ingest",
+                "batch": {"window_seconds": 2, "max_batch": 500},
+            }
+        }
+    }
+
+    scanner = Scanner(config="config.yml")
+
+    channel = scanner.alert_channels["ingest"]
+    assert isinstance(channel, DigestChannel)
+    assert channel.max_batch == 500
+    assert channel.channel.compress is True
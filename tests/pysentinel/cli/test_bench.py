@@ -0,0 +1,47 @@
+import pytest
+
+from pysentinel.cli.bench import (
+    bench_async,
+    bench_scanner,
+    generated_config,
+    synthetic_config,
+)
+
+
+def test_synthetic_config_keeps_alerts_and_replaces_backends():
+    config = {
+        "global": {"api": {"enabled": True}, "alert_cooldown_minutes": 1},
+        "datasources": {
+            "prom": {"type": "prometheus", "url": "http://prom", "enabled": True},
+            "off": {"type": "redis", "enabled": False},
+        },
+        "alert_channels": {"pager": {"type": "webhook", "url": "http://pager"}},
+        "alert_groups": {
+            "g": {"alerts": [{"name": "cpu", "datasource": "prom", "metrics": "cpu"}]}
+        },
+    }
+
+    bench_config = synthetic_config(config, latency_ms=2, error_rate=0)
+
+    assert bench_config["global"] == {"alert_cooldown_minutes": 1}
+    assert bench_config["alert_groups"] == config["alert_groups"]
+    assert bench_config["datasources"]["prom"]["type"] == "synthetic"
+    assert bench_config["datasources"]["prom"]["metrics"] == {
+        "cpu": {"min": 0, "max": 100}
+    }
+    assert bench_config["datasources"]["off"]["enabled"] is False
+    assert bench_config["alert_channels"] == {"pager": {"type": "synthetic"}}
+
+
+@pytest.mark.asyncio
+async def test_bench_runs_every_alert_each_tick():
+    scanner = bench_scanner(generated_config(20, 2, 1.0, 0, 0))
+
+    result = await bench_async(scanner, duration=5, max_ticks=3)
+
+    stats = result.to_dict()
+    assert stats["ticks"] == 3
+    assert result.evaluations == 60
+    assert stats["violations"] == 60
+    assert stats["tick_p99_ms"] >= stats["tick_p50_ms"] > 0
+    assert stats["notifications"] == 20
@@ -157,6 +157,35 @@ class TestMainCLI:
 
         mock_start_sync.assert_called_once_with(str(config_file))
 
+    @patch("pysentinel.cli.cli.start_scanner_sync")
+    def test_main_watch_mode(self, mock_start_sync, tmp_path):
+        """Test --watch passes the polling interval"""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("test: config")
+
+        argv = ["pysentinel", str(config_file), "--watch", "--watch-interval", "2"]
+        with patch("sys.argv", argv):
+            main()
+
+        mock_start_sync.assert_called_once_with(str(config_file), watch_interval=2.0)
+
+    @patch("pysentinel.cli.cli.start_scanner_sync")
+    @patch("pysentinel.cli.cli.os.kill")
+    def test_main_reload_signals_running_scanner(
+        self, mock_kill, mock_start_sync, tmp_path
+    ):
+        """Test --reload sends SIGHUP instead of starting a scanner"""
+        import signal
+
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("test: config")
+
+        with patch("sys.argv", ["pysentinel", str(config_file), "--reload", "1234"]):
+            main()
+
+        mock_kill.assert_called_once_with(1234, signal.SIGHUP)
+        mock_start_sync.assert_not_called()
+
     @patch("pysentinel.cli.cli.asyncio.run")
     @patch("pysentinel.cli.cli.start_scanner_async")
     def test_main_async_mode(self, mock_start_async, mock_asyncio_run, tmp_path):
@@ -164,6 +193,8 @@ class TestMainCLI:
         config_file = tmp_path / "config.yml"
         config_file.write_text("test: config")
 
+        # The mocked run never awaits the coroutine, so close it instead
+        mock_asyncio_run.side_effect = lambda coro: coro.close()
         with patch("sys.argv", ["pysentinel", str(config_file), "--async"]):
             main()
 
@@ -244,6 +275,8 @@ class TestCLIIntegration:
         config_file = tmp_path / "config.yml"
         config_file.write_text("scanner:\n  interval: 10")
 
+        # The mocked run never awaits the coroutine, so close it instead
+        mock_asyncio_run.side_effect = lambda coro: coro.close()
         with patch("sys.argv", ["pysentinel", str(config_file), "--async"]):
             main()
 
@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+import pytest
+
+from pysentinel.cli.bench import bench_scanner
+from pysentinel.cli.cli import main
+from pysentinel.cli.dry_run import dry_run_async
+
+
+def make_config():
+    def alert(name, datasource, threshold):
+        return {
+            "name": name,
+            "metrics": "value",
+            "query": f"query_{name}",
+            "datasource": datasource,
+            "threshold": {"max": threshold},
+            "severity": "warning",
+            "interval": 60,
+            "alert_channels": ["sink"],
+            "description": name,
+        }
+
+    return {
+        "datasources": {
+            "fast": {"type": "synthetic", "enabled": True},
+            "slow": {"type": "synthetic", "enabled": True, "latency_ms": 20},
+            "broken": {"type": "synthetic", "enabled": True, "error_rate": 1.0},
+        },
+        "alert_channels": {"sink": {"type": "synthetic"}},
+        "alert_groups": {
+            "g": {
+                "alerts": [
+                    alert("always", "fast", -1),
+                    alert("never", "fast", 1000),
+                    alert("slow", "slow", 1000),
+                    alert("failing", "broken", 1000),
+                    alert("orphan", "missing", 1000),
+                ]
+            }
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_dry_run_times_alerts_without_notifying():
+    scanner = bench_scanner(make_config())
+
+    report = await dry_run_async(scanner)
+
+    results = {result.alert: result for result in report.results}
+    assert results["always"].breached is True
+    assert results["never"].breached is False
+    assert results["failing"].error
+    assert report.skipped == {"orphan": "datasource 'missing' not found"}
+    assert report.slowest(1)[0].alert == "slow"
+    assert report.by_datasource()["fast"]["alerts"] == 2
+    assert scanner.alert_channels["sink"].sent == 0
+    assert scanner.get_notification_stats()["submitted"] == 0
+
+
+@patch("pysentinel.cli.cli.Scanner", bench_scanner)
+@patch("pysentinel.cli.cli.load_config", return_value=make_config())
+def test_dry_run_command_fails_on_errors_and_budgets(
+    mock_load_config, tmp_path, capsys
+):
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("test: config")
+
+    with patch("sys.argv", ["pysentinel", "dry-run", str(config_file)]):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+    assert exc_info.value.code == 1
+    captured = capsys.readouterr()
+    assert "Slowest" in captured.out
+    assert "1 queries failed" in captured.err
@@ -1,8 +1,10 @@
+import datetime
 import pytest
 import tempfile
 import os
 import json
 import yaml
+from unittest.mock import patch
 from pysentinel.config.loader import load_config
 from pysentinel.utils.exception import ScannerException
 
@@ -48,3 +50,73 @@ def test_load_config_raises_scanner_exception_on_invalid_content():
         with pytest.raises(ScannerException):
             load_config(f.name)
     os.unlink(f.name)
+
+
+def write_yaml(path, data):
+    with open(path, "w") as f:
+        yaml.dump(data, f)
+
+
+def test_snapshot_skips_parsing_when_unchanged(tmp_path):
+    config_path = str(tmp_path / "config.yml")
+    cache_dir = str(tmp_path / "cache")
+    write_yaml(config_path, {"foo": "bar"})
+
+    assert load_config(config_path, cache_dir=cache_dir) == {"foo": "bar"}
+    with patch("pysentinel.config.loader._parse") as mock_parse:
+        assert load_config(config_path, cache_dir=cache_dir) == {"foo": "bar"}
+    mock_parse.assert_not_called()
+
+
+def test_snapshot_is_invalidated_by_content_change(tmp_path, monkeypatch):
+    config_path = str(tmp_path / "config.yml")
+    monkeypatch.setenv("PYSENTINEL_CONFIG_CACHE", str(tmp_path / "cache"))
+    write_yaml(config_path, {"foo": "bar"})
+    load_config(config_path)
+
+    write_yaml(config_path, {"foo": "baz"})
+
+    assert load_config(config_path) == {"foo": "baz"}
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+
+def test_invalid_config_is_not_cached(tmp_path):
+    config_path = str(tmp_path / "config.yml")
+    cache_dir = tmp_path / "cache"
+    write_yaml(config_path, {"datasources": {"db": {"enabled": True}}})
+
+    with pytest.raises(ScannerException, match="missing 'type'"):
+        load_config(config_path, cache_dir=str(cache_dir))
+    assert not cache_dir.exists()
+
+
+def test_shared_cache_directory_is_ignored(tmp_path):
+    config_path = str(tmp_path / "config.yml")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    cache_dir.chmod(0o777)
+    write_yaml(config_path, {"foo": "bar"})
+
+    load_config(config_path, cache_dir=str(cache_dir))
+    with patch(
+        "pysentinel.config.loader._parse", return_value={"foo": "bar"}
+    ) as mock_parse:
+        assert load_config(config_path, cache_dir=str(cache_dir)) == {"foo": "bar"}
+
+    mock_parse.assert_called_once()
+    assert os.listdir(cache_dir) == []
+
+
+def test_cache_directory_is_private_and_skips_non_plain_data(tmp_path):
+    config_path = str(tmp_path / "config.yml")
+    cache_dir = tmp_path / "cache"
+    write_yaml(config_path, {"foo": "bar"})
+    load_config(config_path, cache_dir=str(cache_dir))
+
+    # YAML dates cannot be marshalled, so this config is never cached
+    write_yaml(str(tmp_path / "dated.yml"), {"since": datetime.date(2024, 1, 1)})
+    dated = load_config(str(tmp_path / "dated.yml"), cache_dir=str(cache_dir))
+
+    assert dated == {"since": datetime.date(2024, 1, 1)}
+    assert len(os.listdir(cache_dir)) == 1
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
@@ -0,0 +1,112 @@
+import pytest
+
+from pysentinel.config.validator import validate_config
+from pysentinel.utils.exception import ScannerException
+
+ALERT = {
+    "name": "cpu",
+    "metrics": "cpu",
+    "query": "SELECT 1",
+    "datasource": "db",
+    "threshold": {"max": 90},
+    "severity": "warning",
+    "interval": 60,
+    "alert_channels": ["slack"],
+    "description": "High CPU",
+}
+
+
+def test_valid_config_is_returned_unchanged():
+    config = {
+        "datasources": {"db": {"type": "postgresql"}},
+        "alert_groups": {"system": {"alerts": [ALERT]}},
+        "custom": 1,
+    }
+
+    assert validate_config(config) is config
+
+
+def test_all_problems_are_reported_together():
+    config = {
+        "datasources": {"db": {"enabled": True}, "api": {}},
+        "alert_groups": {"system": {"alerts": "cpu"}},
+    }
+
+    with pytest.raises(ScannerException) as exc_info:
+        validate_config(config)
+
+    message = str(exc_info.value)
+    assert "datasources.db is missing 'type'" in message
+    assert "datasources.api is missing 'type'" in message
+    assert "alert_groups.system.alerts must be a list" in message
+
+
+def test_invalid_alerts_are_logged_and_skipped(caplog):
+    config = {
+        "datasources": {"db": {"type": "postgresql"}},
+        "alert_groups": {
+            "system": {
+                "alerts": [
+                    {**ALERT, "severity": "urgent"},
+                    ALERT,
+                    {"name": "disk"},
+                ]
+            },
+            "other": {"alerts": [ALERT]},
+        },
+    }
+
+    validated = validate_config(config)
+
+    assert validated["alert_groups"]["system"]["alerts"] == [ALERT]
+    assert validated["alert_groups"]["other"] is config["alert_groups"]["other"]
+    assert len(config["alert_groups"]["system"]["alerts"]) == 3
+    assert "alerts[0]: has unknown severity 'urgent'" in caplog.text
+    assert "alerts[2]: is missing metrics" in caplog.text
+
+
+def test_sections_must_be_mappings():
+    with pytest.raises(ScannerException, match="'alert_groups' must be a mapping"):
+        validate_config({"alert_groups": []})
+
+
+def test_executors_and_offload_references_are_checked():
+    config = {
+        "global": {
+            "executors": {"parse": {"type": "fiber"}, "default": {"type": "process"}}
+        },
+        "datasources": {
+            "logs": {"type": "elasticsearch", "offload": {"executor": "missing"}},
+            "api": {"type": "http", "offload": {"executor": "parse"}},
+        },
+    }
+
+    with pytest.raises(ScannerException) as exc_info:
+        validate_config(config)
+
+    message = str(exc_info.value)
+    assert "global.executors.parse.type must be thread or process" in message
+    assert "global.executors.default.type must be thread" in message
+    assert "datasources.logs.offload.executor 'missing'" in message
+    assert "datasources.api" not in message
+
+
+def test_logging_section_is_checked():
+    config = {
+        "global": {
+            "logging": {
+                "level": "LOUD",
+                "format": "xml",
+                "rate_limit": {"burst": "five"},
+            }
+        }
+    }
+
+    with pytest.raises(ScannerException) as exc_info:
+        validate_config(config)
+
+    message = str(exc_info.value)
+    assert "global.logging.level must be one of" in message
+    assert "global.logging.format must be json or text" in message
+    assert "global.logging.rate_limit.burst must be a number" in message
+    assert "interval" not in message
@@ -0,0 +1,58 @@
+import asyncio
+import os
+
+import pytest
+
+from pysentinel.config.diff import diff_section
+from pysentinel.config.watcher import ConfigWatcher
+
+
+def test_diff_section():
+    diff = diff_section(
+        {"a": {"x": 1}, "b": {"x": 1}, "c": {"x": 1}},
+        {"a": {"x": 1}, "b": {"x": 2}, "d": {"x": 1}},
+    )
+
+    assert diff.added == ["d"]
+    assert diff.removed == ["c"]
+    assert diff.changed == ["b"]
+    assert diff.unchanged == ["a"]
+
+
+def test_watcher_detects_rewrite_and_replacement(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("a: 1")
+
+    async def noop():
+        pass
+
+    watcher = ConfigWatcher(str(path), noop)
+    assert watcher.changed() is False
+
+    path.write_text("a: 22")
+    assert watcher.changed() is True
+    assert watcher.changed() is False
+
+    # Atomic replace: new inode at the same path
+    replacement = tmp_path / "config.yml.tmp"
+    replacement.write_text("a: 3")
+    os.replace(replacement, path)
+    assert watcher.changed() is True
+
+
+@pytest.mark.asyncio
+async def test_watcher_calls_callback_on_change(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("a: 1")
+    reloaded = asyncio.Event()
+
+    async def on_change():
+        reloaded.set()
+
+    watcher = ConfigWatcher(str(path), on_change, interval=0.01)
+    watcher.start()
+    try:
+        path.write_text("a: 2")
+        await asyncio.wait_for(reloaded.wait(), timeout=1)
+    finally:
+        await watcher.stop()
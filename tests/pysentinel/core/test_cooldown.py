@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock
+
+from pysentinel.core.cooldown import CooldownTracker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_violation(alert="cpu", datasource="db1", group="system"):
+    violation = MagicMock()
+    violation.alert_name = alert
+    violation.datasource_name = datasource
+    violation.alert_group = group
+    return violation
+
+
+def test_cooldown_suppresses_until_expiry():
+    clock = FakeClock()
+    tracker = CooldownTracker(default_seconds=60, clock=clock)
+    violation = make_violation()
+
+    assert tracker.should_notify(violation) is True
+    clock.now += 59
+    assert tracker.should_notify(violation) is False
+    clock.now += 1
+    assert tracker.should_notify(violation) is True
+    assert tracker.suppressed == 1
+
+
+def test_expired_entries_are_pruned():
+    clock = FakeClock()
+    tracker = CooldownTracker(default_seconds=10, clock=clock)
+    for i in range(100):
+        tracker.should_notify(make_violation(datasource=f"db{i}"))
+    assert len(tracker) == 100
+
+    clock.now += 10
+
+    assert len(tracker) == 0
+    assert tracker._heap == []
+
+
+def test_fingerprint_grouping_across_datasources():
+    tracker = CooldownTracker(default_seconds=60, clock=FakeClock())
+    tracker.group_fingerprints["system"] = ("alert_name",)
+
+    assert tracker.should_notify(make_violation(datasource="db1")) is True
+    assert tracker.should_notify(make_violation(datasource="db2")) is False
+    # Other groups still use the default fingerprint
+    assert tracker.should_notify(make_violation(datasource="db1", group="app"))
+    assert tracker.should_notify(make_violation(datasource="db2", group="app"))
+
+
+def test_per_alert_and_group_cooldowns():
+    clock = FakeClock()
+    tracker = CooldownTracker(default_seconds=300, clock=clock)
+    tracker.group_cooldowns["system"] = 30
+    tracker.alert_cooldowns["disk"] = 5
+
+    assert tracker.cooldown_for(make_violation("disk")) == 5
+    assert tracker.cooldown_for(make_violation("cpu")) == 30
+    assert tracker.cooldown_for(make_violation("cpu", group="app")) == 300
+
+    tracker.should_notify(make_violation("disk"))
+    clock.now += 5
+    assert tracker.should_notify(make_violation("disk")) is True
+
+
+def test_reset_allows_immediate_notification():
+    tracker = CooldownTracker(default_seconds=60, clock=FakeClock())
+    violation = make_violation()
+    tracker.should_notify(violation)
+
+    tracker.reset(tracker.fingerprint(violation))
+
+    assert tracker.should_notify(violation) is True
@@ -0,0 +1,161 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pysentinel.channels.base import AlertChannel
+from pysentinel.channels.digest import DigestChannel
+from pysentinel.core.dispatcher import NotificationDispatcher
+from pysentinel.core.threshold import Violation
+
+
+def make_channel(delay=0.0, result=True):
+    channel = MagicMock()
+
+    async def send_alert(violation):
+        await asyncio.sleep(delay)
+        return result
+
+    channel.send_alert = AsyncMock(side_effect=send_alert)
+    return channel
+
+
+@pytest.mark.asyncio
+async def test_deliver_sends_to_channels_in_parallel():
+    dispatcher = NotificationDispatcher()
+    violation = MagicMock(spec=Violation)
+    channels = [("a", make_channel(0.1)), ("b", make_channel(0.1))]
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    results = await dispatcher.deliver(violation, channels)
+
+    assert results == {"a": True, "b": True}
+    assert loop.time() - start < 0.19
+
+
+@pytest.mark.asyncio
+async def test_deliver_applies_per_channel_timeout():
+    dispatcher = NotificationDispatcher(send_timeout=5, channel_timeouts={"slow": 0.05})
+    violation = MagicMock(spec=Violation)
+
+    results = await dispatcher.deliver(
+        violation, [("slow", make_channel(1.0)), ("fast", make_channel())]
+    )
+
+    assert results == {"slow": False, "fast": True}
+    stats = dispatcher.get_stats()["channels"]
+    assert stats["slow"]["timed_out"] == 1
+    assert stats["fast"]["sent"] == 1
+
+
+@pytest.mark.asyncio
+async def test_submit_is_delivered_by_workers_and_counts_drops():
+    dispatcher = NotificationDispatcher(workers=1, max_queue_size=1)
+    await dispatcher.start()
+    channel = make_channel(0.05)
+    violation = MagicMock(spec=Violation)
+    violation.alert_name = "alert"
+
+    assert dispatcher.submit(violation, [("chan", channel)]) is True
+    await asyncio.sleep(0)  # let the worker pick up the first job
+    assert dispatcher.submit(violation, [("chan", channel)]) is True
+    assert dispatcher.submit(violation, [("chan", channel)]) is False
+
+    await dispatcher.stop()
+    stats = dispatcher.get_stats()
+    assert channel.send_alert.await_count == 2
+    assert stats["dropped"] == 1
+    assert stats["submitted"] == 2
+    assert stats["queue_depth"] == 0
+    assert dispatcher.running is False
+
+
+@pytest.mark.asyncio
+async def test_outbox_records_delivery_state_and_skips_in_flight():
+    outbox = MagicMock()
+    dispatcher = NotificationDispatcher(workers=1, outbox=outbox)
+    violation = MagicMock(spec=Violation)
+    violation.violation_id = "v1"
+    channels = [("ok", make_channel(0.05)), ("bad", make_channel(result=False))]
+
+    await dispatcher.start()
+    dispatcher.submit(violation, channels)
+    # A replay of the same notification while it is queued is ignored
+    dispatcher.submit(violation, channels)
+    await dispatcher.stop()
+
+    assert dispatcher.submitted == 1
+    outbox.mark_delivered.assert_called_once_with("v1", "ok")
+    outbox.mark_failed.assert_called_once_with("v1", "bad", "channel reported failure")
+
+
+class BatchChannel(AlertChannel):
+    def __init__(self, result=True):
+        super().__init__("batch", {})
+        self.result = result
+
+    async def send_alert(self, violation):
+        return self.result
+
+    async def send_batch(self, violations):
+        return self.result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("result", [True, False])
+async def test_outbox_waits_for_digest_batch(result):
+    outbox = MagicMock()
+    dispatcher = NotificationDispatcher(workers=1, outbox=outbox)
+    digest = DigestChannel(BatchChannel(result), window_seconds=60)
+    violation = MagicMock(spec=Violation)
+    violation.violation_id = "v1"
+
+    await dispatcher.start()
+    dispatcher.submit(violation, [("digest", digest)])
+    await dispatcher.stop()
+
+    # Buffered only: not acknowledged, and a replay is still ignored
+    outbox.mark_delivered.assert_not_called()
+    outbox.mark_failed.assert_not_called()
+    await dispatcher.start()
+    dispatcher.submit(violation, [("digest", digest)])
+    await dispatcher.stop()
+    assert dispatcher.submitted == 1
+
+    await digest.flush()
+    if result:
+        outbox.mark_delivered.assert_called_once_with("v1", "digest")
+        outbox.mark_failed.assert_not_called()
+    else:
+        outbox.mark_failed.assert_called_once_with(
+            "v1", "digest", "digest batch failed"
+        )
+        outbox.mark_delivered.assert_not_called()
+    assert dispatcher._in_flight == set()
+
+
+class PartialChannel(BatchChannel):
+    async def send_each(self, violations):
+        return [violation.violation_id != "v2" for violation in violations]
+
+
+@pytest.mark.asyncio
+async def test_digest_settles_each_outbox_row_separately():
+    outbox = MagicMock()
+    dispatcher = NotificationDispatcher(workers=1, outbox=outbox)
+    digest = DigestChannel(PartialChannel(), window_seconds=60)
+    violations = []
+    for violation_id in ("v1", "v2"):
+        violation = MagicMock(spec=Violation)
+        violation.violation_id = violation_id
+        violations.append(violation)
+
+    await dispatcher.start()
+    for violation in violations:
+        dispatcher.submit(violation, [("digest", digest)])
+    await dispatcher.stop()
+    assert await digest.flush() is False
+
+    outbox.mark_delivered.assert_called_once_with("v1", "digest")
+    outbox.mark_failed.assert_called_once_with("v2", "digest", "digest batch failed")
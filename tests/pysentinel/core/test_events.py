@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pysentinel.core.events import Backpressure, EventBus
+from pysentinel.core.scanner import Scanner
+from pysentinel.core.threshold import AlertDefinition
+from pysentinel.utils.constants import Severity
+
+
+async def drain(subscription):
+    return [event async for event in subscription]
+
+
+@pytest.mark.asyncio
+async def test_every_subscriber_receives_events():
+    bus = EventBus()
+    first = bus.subscribe("alerts")
+    second = bus.subscribe("alerts")
+
+    await bus.publish("alerts", 1)
+    await bus.publish("metrics", 2)
+    bus.close()
+
+    assert await drain(first) == [1]
+    assert await drain(second) == [1]
+    assert not bus.has_subscribers("alerts")
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_latest_events():
+    bus = EventBus()
+    subscription = bus.subscribe("alerts", max_size=2)
+
+    for i in range(5):
+        await bus.publish("alerts", i)
+    subscription.close()
+
+    assert await drain(subscription) == [3, 4]
+    assert subscription.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesce_keeps_latest_per_key():
+    bus = EventBus()
+    subscription = bus.subscribe(
+        "metrics", policy="coalesce", key=lambda event: event[0]
+    )
+
+    for event in [("db", 1), ("api", 1), ("db", 2), ("db", 3)]:
+        await bus.publish("metrics", event)
+    subscription.close()
+
+    assert await drain(subscription) == [("db", 3), ("api", 1)]
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_the_consumer():
+    bus = EventBus()
+    subscription = bus.subscribe("alerts", max_size=1, policy=Backpressure.BLOCK)
+    await bus.publish("alerts", 1)
+
+    producer = asyncio.ensure_future(bus.publish("alerts", 2))
+    await asyncio.sleep(0.01)
+    assert not producer.done()
+
+    assert await subscription.get() == 1
+    await asyncio.wait_for(producer, 1)
+    assert await subscription.get() == 2
+    assert subscription.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_alerts_pushes_new_violations():
+    scanner = Scanner()
+    scanner._running = True
+    scanner.alert_channels = {"chan": MagicMock(send_alert=AsyncMock())}
+    alert = AlertDefinition(
+        name="cpu",
+        metrics="m",
+        query="q",
+        datasource="db",
+        threshold={"max": 5},
+        severity=Severity.WARNING,
+        interval=60,
+        alert_channels=[],
+        description="",
+    )
+    scanner.alert_definitions = [alert]
+    stream = scanner.stream_alerts_async()
+    first = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+
+    violation = alert.create_violation(10, "db")
+    await scanner._handle_violation(violation)
+
+    assert await asyncio.wait_for(first, 1) is violation
+    scanner.events.close()
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_stream_alerts_can_coalesce_per_alert():
+    scanner = Scanner()
+    scanner._running = True
+    alert = AlertDefinition(
+        name="cpu",
+        metrics="m",
+        query="q",
+        datasource="db",
+        threshold={"max": 5},
+        severity=Severity.WARNING,
+        interval=60,
+        alert_channels=[],
+        description="",
+    )
+    stream = scanner.stream_alerts_async(policy="coalesce")
+    first = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+    # The first violation is taken straight away; the next two share a key
+    scanner.events.publish_nowait("alerts", alert.create_violation(10, "db"))
+    await asyncio.wait_for(first, 1)
+    scanner.events.publish_nowait("alerts", alert.create_violation(11, "db"))
+    latest = alert.create_violation(12, "db")
+    scanner.events.publish_nowait("alerts", latest)
+    scanner.events.close()
+
+    assert [violation async for violation in stream] == [latest]
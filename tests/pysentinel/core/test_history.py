@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from pysentinel.core.history import ActiveViolations, ViolationHistory
+from pysentinel.core.scanner import Scanner
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+
+
+def make_violation(alert="cpu", datasource="db", severity=Severity.WARNING, second=0):
+    return Violation(
+        alert_name=alert,
+        metric_name="metric",
+        current_value=1,
+        threshold_value=0,
+        operator="<=",
+        severity=severity,
+        message="msg",
+        timestamp=datetime(2024, 1, 1) + timedelta(seconds=second),
+        datasource_name=datasource,
+    )
+
+
+class TestViolationHistory:
+    def test_evicts_oldest_and_updates_indexes(self):
+        history = ViolationHistory(max_size=3)
+        violations = [
+            make_violation(alert="a" if i % 2 else "b", second=i) for i in range(5)
+        ]
+        for v in violations:
+            history.append(v)
+
+        assert len(history) == 3
+        assert history.total == 5
+        assert history.latest() == violations[2:]
+        assert history.get(violations[0].violation_id) is None
+        assert history.get(violations[4].violation_id) is violations[4]
+        assert history.by_alert("a") == [violations[3]]
+        assert history.by_alert("b") == [violations[2], violations[4]]
+
+    def test_latest_and_index_queries_respect_limit(self):
+        history = ViolationHistory(max_size=10)
+        for i in range(6):
+            history.append(
+                make_violation(
+                    datasource="ds1" if i < 3 else "ds2",
+                    severity=Severity.CRITICAL if i == 5 else Severity.WARNING,
+                    second=i,
+                )
+            )
+
+        assert [v.timestamp.second for v in history.latest(2)] == [4, 5]
+        assert [v.timestamp.second for v in history.by_datasource("ds1", 2)] == [1, 2]
+        assert len(history.by_severity(Severity.CRITICAL)) == 1
+        assert history.by_alert("missing") == []
+
+    def test_query_applies_all_filters(self):
+        history = ViolationHistory(max_size=10)
+        for i in range(8):
+            history.append(
+                make_violation(
+                    alert="cpu" if i % 2 else "mem",
+                    datasource="ds1" if i < 4 else "ds2",
+                    severity=Severity.CRITICAL if i >= 5 else Severity.WARNING,
+                    second=i,
+                )
+            )
+
+        def seconds(violations):
+            return [v.timestamp.second for v in violations]
+
+        assert seconds(history.query(alert_name="cpu", datasource_name="ds2")) == [
+            5,
+            7,
+        ]
+        assert seconds(
+            history.query(alert_name="cpu", severity=Severity.WARNING, limit=1)
+        ) == [3]
+        assert seconds(
+            history.query(datasource_name="ds2", severity=Severity.CRITICAL, limit=2)
+        ) == [6, 7]
+        assert seconds(history.query(limit=3)) == [5, 6, 7]
+        assert history.query(alert_name="cpu", datasource_name="missing") == []
+
+    def test_rejects_non_positive_size(self):
+        with pytest.raises(ValueError):
+            ViolationHistory(max_size=0)
+
+
+class TestActiveViolations:
+    def test_find_tracks_replacement_and_removal(self):
+        active = ActiveViolations()
+        first = make_violation(second=1)
+        second = make_violation(second=2)
+
+        active[("db", "cpu")] = first
+        assert active.find(first.violation_id) is first
+
+        active[("db", "cpu")] = second
+        assert active.find(first.violation_id) is None
+        assert active.find(second.violation_id) is second
+
+        assert active.pop(("db", "cpu")) is second
+        assert active.find(second.violation_id) is None
+        assert active.pop(("db", "cpu"), None) is None
+
+    def test_every_mutation_notifies_listeners(self):
+        active = ActiveViolations()
+        events = []
+        active.listeners.append(
+            lambda previous, current: events.append((previous, current))
+        )
+        first, second, third = (make_violation(second=i) for i in range(3))
+
+        active.update({("db", "cpu"): first})
+        active |= {("db", "mem"): second}
+        assert active.setdefault(("db", "cpu"), third) is first
+        assert active.setdefault(("db", "disk"), third) is third
+        assert active.popitem() == (("db", "disk"), third)
+
+        assert events == [(None, first), (None, second), (None, third), (third, None)]
+        assert active.find(third.violation_id) is None
+        active.clear()
+        assert events[-2:] == [(first, None), (second, None)]
+        with pytest.raises(KeyError):
+            active.popitem()
+
+
+@pytest.mark.asyncio
+async def test_scanner_history_combines_filters():
+    scanner = Scanner()
+    for i in range(4):
+        scanner._violation_history.append(
+            make_violation(alert="cpu", datasource="ds1" if i % 2 else "ds2", second=i)
+        )
+
+    history = await scanner.get_alert_history_async(
+        alert_name="cpu", datasource_name="ds1", severity="warning"
+    )
+
+    assert [item["datasource_name"] for item in history] == ["ds1", "ds1"]
+    assert (
+        await scanner.get_alert_history_async(alert_name="cpu", severity="critical")
+        == []
+    )
@@ -0,0 +1,152 @@
+import copy
+import logging
+
+import pytest
+
+from pysentinel.core.scanner import Scanner
+from pysentinel.utils.exception import DataSourceException, ScannerException
+
+BASE_CONFIG = {
+    "global": {"alert_cooldown_minutes": 5},
+    "datasources": {
+        "api": {"type": "http", "enabled": True, "base_url": "http://api"},
+        "metrics": {"type": "http", "enabled": True, "base_url": "http://metrics"},
+    },
+    "alert_channels": {
+        "hook": {"type": "webhook", "url": "http://hook"},
+    },
+    "alert_groups": {
+        "system": {
+            "alerts": [
+                {
+                    "name": "cpu",
+                    "metrics": "cpu",
+                    "query": "/cpu",
+                    "datasource": "api",
+                    "threshold": {"max": 90},
+                    "severity": "warning",
+                    "interval": 60,
+                    "alert_channels": ["hook"],
+                    "description": "",
+                }
+            ]
+        },
+        "app": {
+            "alerts": [
+                {
+                    "name": "errors",
+                    "metrics": "errors",
+                    "query": "/errors",
+                    "datasource": "metrics",
+                    "threshold": {"max": 10},
+                    "severity": "critical",
+                    "interval": 60,
+                    "alert_channels": ["hook"],
+                    "description": "",
+                }
+            ]
+        },
+    },
+}
+
+
+@pytest.mark.asyncio
+async def test_reload_rebuilds_only_changed_entries():
+    scanner = Scanner(copy.deepcopy(BASE_CONFIG))
+    api, metrics = scanner.datasources["api"], scanner.datasources["metrics"]
+    hook = scanner.alert_channels["hook"]
+    cpu = scanner.alert_definitions[0]
+
+    new_config = copy.deepcopy(BASE_CONFIG)
+    new_config["datasources"]["metrics"]["base_url"] = "http://metrics-v2"
+    new_config["alert_groups"]["app"]["alerts"][0]["threshold"] = {"max": 20}
+    changes = await scanner.reload_config_async(new_config)
+
+    assert changes["datasources"]["changed"] == ["metrics"]
+    assert changes["alert_channels"] == {"added": [], "removed": [], "changed": []}
+    assert scanner.datasources["api"] is api
+    assert scanner.datasources["metrics"] is not metrics
+    assert scanner.alert_channels["hook"] is hook
+    definitions = {d.name: d for d in scanner.alert_definitions}
+    assert definitions["cpu"] is cpu
+    assert definitions["errors"].threshold == {"max": 20}
+
+
+@pytest.mark.asyncio
+async def test_reload_keeps_cooldowns_and_applies_global_changes():
+    scanner = Scanner(copy.deepcopy(BASE_CONFIG))
+    scanner._cooldowns.acquire(("api", "cpu"))
+
+    new_config = copy.deepcopy(BASE_CONFIG)
+    new_config["global"]["alert_cooldown_minutes"] = 1
+    await scanner.reload_config_async(new_config)
+
+    assert ("api", "cpu") in scanner._cooldowns
+    assert scanner._cooldowns.default_seconds == 60
+
+
+@pytest.mark.asyncio
+async def test_reload_warns_about_restart_only_settings(caplog):
+    scanner = Scanner(copy.deepcopy(BASE_CONFIG))
+
+    new_config = copy.deepcopy(BASE_CONFIG)
+    new_config["global"]["api"] = {"enabled": True, "port": 9000}
+    new_config["global"]["violation_history_size"] = 10
+    with caplog.at_level(logging.WARNING, logger="pysentinel.core.scanner"):
+        await scanner.reload_config_async(new_config)
+
+    assert "global.api takes effect after a restart" in caplog.text
+    assert "global.violation_history_size takes effect after a restart" in caplog.text
+    assert "global.tracing" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_reload_from_config_file(tmp_path):
+    import yaml
+
+    path = tmp_path / "config.yml"
+    path.write_text(yaml.safe_dump(BASE_CONFIG))
+    scanner = Scanner(str(path))
+
+    new_config = copy.deepcopy(BASE_CONFIG)
+    del new_config["alert_channels"]["hook"]
+    path.write_text(yaml.safe_dump(new_config))
+    changes = await scanner.reload_config_async()
+
+    assert changes["alert_channels"]["removed"] == ["hook"]
+    assert "hook" not in scanner.alert_channels
+
+
+@pytest.mark.asyncio
+async def test_invalid_dict_reload_is_rejected_before_applying():
+    scanner = Scanner(copy.deepcopy(BASE_CONFIG))
+    api = scanner.datasources["api"]
+
+    new_config = copy.deepcopy(BASE_CONFIG)
+    del new_config["datasources"]["api"]["type"]
+    new_config["alert_channels"] = {}
+    with pytest.raises(ScannerException, match="datasources.api is missing 'type'"):
+        await scanner.reload_config_async(new_config)
+
+    assert scanner.datasources["api"] is api
+    assert "hook" in scanner.alert_channels
+
+
+@pytest.mark.asyncio
+async def test_add_and_remove_datasource():
+    scanner = Scanner(copy.deepcopy(BASE_CONFIG))
+    api = scanner.datasources["api"]
+
+    await scanner.add_datasource_async(
+        {"name": "extra", "type": "http", "enabled": True, "base_url": "http://x"}
+    )
+    assert "extra" in scanner.datasources
+    assert scanner.datasources["api"] is api
+
+    with pytest.raises(DataSourceException):
+        await scanner.add_datasource_async({"name": "extra", "type": "http"})
+
+    await scanner.remove_datasource_async("extra")
+    assert "extra" not in scanner.datasources
+    with pytest.raises(DataSourceException):
+        await scanner.remove_datasource_async("extra")
@@ -8,6 +8,7 @@ import yaml
 from pysentinel.core.scanner import Scanner
 from pysentinel.core.threshold import AlertDefinition, Violation, MetricData
 from pysentinel.utils.constants import ScannerStatus, Severity
+from pysentinel.utils.exception import ScannerException
 
 
 @pytest.fixture
@@ -117,16 +118,13 @@ def test_get_uptime_seconds(monkeypatch):
 
 def test_get_datasources():
     scanner = Scanner()
-    scanner.datasources = [
-        MagicMock(name="ds1"),
-        MagicMock(name="ds2", type="postgresql"),
-        MagicMock(name="ds3", type="mysql"),
-    ]
+    scanner.datasources = {
+        "ds1": MagicMock(),
+        "ds2": MagicMock(type="postgresql"),
+        "ds3": MagicMock(type="mysql"),
+    }
     datasources = scanner.get_datasources()
-    assert len(datasources) == 3
-    assert all(isinstance(ds, MagicMock) for ds in datasources)
-    assert all(ds.name.startswith("ds") for ds in datasources)
-    assert datasources is not None
+    assert datasources == ["ds1", "ds2", "ds3"]
 
 
 def test_get_metric_count_async():
@@ -287,7 +285,7 @@ async def test_scanner_acknowledge_alert_async_acknowledges_violation():
     violation = MagicMock(spec=Violation)
     violation.violation_id = "id1"
     violation.acknowledged = False
-    scanner._active_violations = {"key": violation}
+    scanner._active_violations["key"] = violation
     result = await scanner.acknowledge_alert_async("id1")
     assert result is True
     assert violation.acknowledged is True
@@ -309,3 +307,55 @@ def test_scanner_get_metric_count_async_returns_correct_count():
     metric_data2.metrics = {"c": 3}
     scanner._latest_metrics = {"ds1": metric_data1, "ds2": metric_data2}
     assert scanner.get_metric_count_async() == 3
+
+
+def test_metric_history_without_numpy_raises_clear_error():
+    with patch.dict("sys.modules", {"pysentinel.utils.metric_store": None}):
+        with pytest.raises(ScannerException, match=r"pysentinel\[metric-store\]"):
+            Scanner({"global": {"metric_history": {"enabled": True}}})
+
+
+@pytest.mark.asyncio
+async def test_metric_history_records_only_alert_metrics():
+    scanner = Scanner()
+    scanner._metric_store = MagicMock()
+    datasource = MagicMock(enabled=True, error_count=0, max_errors=3)
+    datasource.fetch_data = AsyncMock(
+        return_value={"cpu": 10, "mem": 20, "disk": 30, "host": "a"}
+    )
+    scanner.datasources = {"db": datasource}
+    alert = AlertDefinition(
+        name="cpu",
+        metrics="cpu",
+        query="q",
+        datasource="db",
+        threshold={"max": 90},
+        severity=Severity.WARNING,
+        interval=60,
+        alert_channels=[],
+        description="",
+    )
+
+    await scanner._check_alerts_for_datasource("db", [alert])
+
+    scanner._metric_store.append.assert_called_once()
+    assert scanner._metric_store.append.call_args.args[:3] == ("db", "cpu", 10)
+
+
+def test_global_logging_is_applied_with_overrides_winning():
+    scanner = Scanner({"global": {"logging": {"level": "DEBUG", "format": "json"}}})
+    scanner.logging_overrides = {"format": "text"}
+
+    with patch("pysentinel.core.scanner.setup_logging_from_config") as mock_setup:
+        scanner._setup_logging()
+
+    mock_setup.assert_called_once_with({"level": "DEBUG", "format": "text"})
+
+
+def test_no_logging_section_leaves_logging_alone():
+    scanner = Scanner()
+
+    with patch("pysentinel.core.scanner.setup_logging_from_config") as mock_setup:
+        scanner._setup_logging()
+
+    mock_setup.assert_not_called()
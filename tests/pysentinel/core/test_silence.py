@@ -0,0 +1,150 @@
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pysentinel.core.history import ActiveViolations
+from pysentinel.core.scanner import Scanner
+from pysentinel.core.silence import Inhibitor, Matcher, SilenceStore
+from pysentinel.core.threshold import AlertDefinition, Violation
+from pysentinel.utils.constants import Severity
+from pysentinel.utils.exception import ScannerException
+
+
+def make_violation(alert="cpu", datasource="prod-db", severity=Severity.WARNING):
+    return Violation(
+        alert_name=alert,
+        metric_name="m",
+        current_value=10,
+        threshold_value=5,
+        operator="<=",
+        severity=severity,
+        message="fired",
+        timestamp=datetime.now(),
+        datasource_name=datasource,
+        alert_group="system",
+    )
+
+
+def test_matcher_operators():
+    violation = make_violation()
+
+    assert Matcher.parse("alert_name=cpu").matches(violation)
+    assert Matcher.parse("severity=warning").matches(violation)
+    assert Matcher.parse("datasource_name=~prod-.*").matches(violation)
+    assert not Matcher.parse("datasource_name=~prod").matches(violation)
+    assert Matcher.parse("alert_name!=disk").matches(violation)
+    assert not Matcher.parse("datasource_name!~prod-.*").matches(violation)
+
+
+def test_invalid_matchers_are_rejected():
+    with pytest.raises(ScannerException):
+        Matcher.parse("nope=1")
+    with pytest.raises(ScannerException):
+        Matcher.parse("alert_name=~(")
+
+
+def test_silence_matches_only_within_window():
+    store = SilenceStore()
+    now = time.time()
+    store.add(["alert_name=cpu"], starts_at=now + 60, ends_at=now + 120)
+
+    assert store.match(make_violation(), now=now) is None
+    assert store.match(make_violation(), now=now + 90) is not None
+    assert store.match(make_violation(), now=now + 120) is None
+    assert len(store) == 0
+
+
+def test_silence_lookup_uses_index():
+    store = SilenceStore()
+    for i in range(10_000):
+        store.add([f"alert_name=alert_{i}", "severity=warning"], duration_minutes=60)
+    store.add({"datasource_name": "prod-db"}, duration_minutes=60)
+
+    violation = make_violation(alert="alert_42")
+    silence = store.match(violation)
+
+    assert silence is not None
+    assert store.match(make_violation(alert="other", datasource="dev")) is None
+    # Only the silences anchored on this alert name were candidates
+    assert len(store._index["alert_name"]["alert_42"]) == 1
+
+
+def test_removed_silence_no_longer_matches():
+    store = SilenceStore()
+    silence = store.add(["datasource_name=~prod-.*"], duration_minutes=5)
+
+    assert store.match(make_violation()) is silence
+    assert store.remove(silence.id) is True
+    assert store.match(make_violation()) is None
+
+
+def test_critical_inhibits_warning_in_same_group():
+    inhibitor = Inhibitor.from_config(
+        [
+            {
+                "source": ["severity=critical"],
+                "target": ["severity=warning"],
+                "equal": ["alert_group"],
+            }
+        ]
+    )
+    active = ActiveViolations()
+    active.listeners.append(inhibitor.violation_changed)
+    warning = make_violation("disk")
+
+    assert not inhibitor.is_inhibited(warning)
+
+    active[("prod-db", "cpu")] = make_violation(severity=Severity.CRITICAL)
+    assert inhibitor.is_inhibited(warning)
+
+    active.pop(("prod-db", "cpu"))
+    assert not inhibitor.is_inhibited(warning)
+
+
+def make_scanner():
+    scanner = Scanner()
+    channel = MagicMock()
+    channel.send_alert = AsyncMock(return_value=True)
+    scanner.alert_channels = {"chan": channel}
+    scanner.alert_definitions = [
+        AlertDefinition(
+            name="cpu",
+            metrics="m",
+            query="q",
+            datasource="prod-db",
+            threshold={"max": 5},
+            severity=Severity.WARNING,
+            interval=60,
+            alert_channels=["chan"],
+            description="",
+        )
+    ]
+    return scanner, channel
+
+
+@pytest.mark.asyncio
+async def test_silenced_violation_skips_dispatch():
+    scanner, channel = make_scanner()
+    await scanner.add_silence_async(["alert_name=cpu"], duration_minutes=10)
+
+    await scanner._handle_violation(make_violation())
+
+    channel.send_alert.assert_not_awaited()
+    assert scanner.get_notification_stats()["suppressed"]["silenced"] == 1
+    assert len(await scanner.get_active_alerts_async()) == 1
+
+
+@pytest.mark.asyncio
+async def test_acknowledged_violation_is_not_renotified():
+    scanner, channel = make_scanner()
+    first = make_violation()
+    await scanner._handle_violation(first)
+    await scanner.acknowledge_alert_async(first.violation_id)
+    scanner._cooldowns.clear()
+
+    await scanner._handle_violation(make_violation())
+
+    channel.send_alert.assert_awaited_once()
+    assert scanner.get_notification_stats()["suppressed"]["acknowledged"] == 1
@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+
+from pysentinel.core.scanner import Scanner
+from pysentinel.core.snapshot import SnapshotPublisher
+from pysentinel.core.threshold import AlertDefinition, MetricData
+from pysentinel.utils.constants import ScannerStatus, Severity
+
+ALERT = AlertDefinition(
+    name="cpu",
+    metrics="cpu",
+    query="q",
+    datasource="db",
+    threshold={"max": 5},
+    severity=Severity.WARNING,
+    interval=0,
+    alert_channels=[],
+    description="High CPU",
+)
+
+
+def metric_data(name, value):
+    return MetricData(name, {"cpu": value}, datetime(2024, 1, 1), 1.0)
+
+
+def test_publish_copies_only_changed_entries():
+    publisher = SnapshotPublisher()
+    latest = {"a": metric_data("a", 1), "b": metric_data("b", 2)}
+    publisher.metrics_changed("a")
+    publisher.metrics_changed("b")
+    first = publisher.publish(ScannerStatus.RUNNING, None, None, latest, {})
+
+    latest["b"] = metric_data("b", 3)
+    publisher.metrics_changed("b")
+    second = publisher.publish(ScannerStatus.RUNNING, None, None, latest, {})
+    third = publisher.publish(ScannerStatus.RUNNING, None, None, latest, {})
+
+    assert first.latest_metrics["b"]["metrics"] == {"cpu": 2}
+    assert second.latest_metrics["b"]["metrics"] == {"cpu": 3}
+    assert second.latest_metrics is not first.latest_metrics
+    assert second.latest_metrics["a"] is first.latest_metrics["a"]
+    assert third.latest_metrics is second.latest_metrics
+    assert third.version == 3
+
+
+@pytest.mark.asyncio
+async def test_scan_tick_publishes_alerts_and_acknowledgement():
+    scanner = Scanner()
+    scanner.alert_definitions = [ALERT]
+    violation = ALERT.create_violation(10, "db")
+    await scanner._handle_violation(violation)
+
+    assert scanner.get_active_alerts() == ()
+    await scanner.scan_once_async()
+    (published,) = scanner.get_active_alerts()
+    assert published["violation_id"] == violation.violation_id
+    assert not published["acknowledged"]
+
+    await scanner.acknowledge_alert_async(violation.violation_id)
+    assert scanner.get_active_alerts()[0]["acknowledged"]
+    assert published["acknowledged"] is False
+
+    scanner._active_violations.pop(("db", "cpu"))
+    await scanner.scan_once_async()
+    assert scanner.get_snapshot().active_alerts == ()
@@ -1,3 +1,4 @@
+import sys
 import pytest
 from datetime import datetime, timedelta
 from pysentinel.core.threshold import Violation, MetricData, AlertDefinition
@@ -101,3 +102,88 @@ class TestThreshold:
         )
         assert ad.check_threshold("not_a_number") is False
         assert ad.check_threshold(None) is False
+
+    def test_violation_to_dict_is_cached_and_reflects_acknowledgement(self):
+        v = Violation(
+            alert_name="CPU High",
+            metric_name="cpu_usage",
+            current_value=95,
+            threshold_value=90,
+            operator=">",
+            severity=Severity.CRITICAL,
+            message="CPU usage is too high",
+            timestamp=datetime.now(),
+            datasource_name="server1",
+        )
+        first = v.to_dict()
+        first["alert_name"] = "mutated"
+        assert v.to_dict()["alert_name"] == "CPU High"
+        assert v.to_dict()["acknowledged"] is False
+        v.acknowledged = True
+        assert v.to_dict()["acknowledged"] is True
+
+    def test_violation_interns_names_and_has_no_instance_dict(self):
+        name = "".join(["server", "1"])
+        v = Violation(
+            alert_name="CPU High",
+            metric_name="cpu_usage",
+            current_value=95,
+            threshold_value=90,
+            operator=">",
+            severity=Severity.CRITICAL,
+            message="CPU usage is too high",
+            timestamp=datetime.now(),
+            datasource_name=name,
+        )
+        assert v.datasource_name is sys.intern("server1")
+        assert not hasattr(v, "__dict__")
+
+    def test_violation_does_not_intern_message(self):
+        message = "".join(["CPU usage ", "is 95"])
+        v = Violation(
+            alert_name="CPU High",
+            metric_name="cpu_usage",
+            current_value=95,
+            threshold_value=90,
+            operator=">",
+            severity=Severity.CRITICAL,
+            message=message,
+            timestamp=datetime.now(),
+            datasource_name="server1",
+        )
+        assert v.message is message
+
+    def test_mutating_fields_refreshes_to_dict(self):
+        v = Violation(
+            alert_name="CPU High",
+            metric_name="cpu_usage",
+            current_value=1,
+            threshold_value=90,
+            operator=">",
+            severity=Severity.WARNING,
+            message="CPU usage is too high",
+            timestamp=datetime.now(),
+            datasource_name="server1",
+        )
+        assert v.to_dict()["current_value"] == 1
+        v.current_value = 99
+        v.message = "changed"
+        v.severity = Severity.CRITICAL
+        v.threshold_value = 80
+        d = v.to_dict()
+        assert d["current_value"] == 99
+        assert d["message"] == "changed"
+        assert d["severity"] == "critical"
+        assert d["threshold_value"] == 80
+
+        m = MetricData(
+            datasource_name="db",
+            metrics={"cpu": 1},
+            timestamp=datetime.now(),
+            collection_time_ms=5,
+        )
+        assert m.to_dict()["collection_time_ms"] == 5
+        m.collection_time_ms = 7
+        m.metrics = {"cpu": 2}
+        assert m.to_dict()["collection_time_ms"] == 7
+        assert m.to_dict()["metrics"] == {"cpu": 2}
@@ -0,0 +1,161 @@
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pysentinel.core.scanner import Scanner
+from pysentinel.datasources.api import HTTPDataSource
+from pysentinel.datasources.elasticsearch import (
+    ElasticsearchDataSource,
+    extract_aggregations,
+)
+from pysentinel.datasources.offload import OffloadPolicy
+from pysentinel.utils.exception import DataSourceException, ScannerException
+
+SEARCH_RESPONSE = json.dumps(
+    {
+        "hits": {"hits": [{"_source": {"message": "x" * 100}}] * 50},
+        "aggregations": {"errors": {"doc_count": 7}, "latency": {"value": 1.5}},
+    }
+).encode()
+
+
+def parsing_thread(body):
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_only_large_bodies_are_offloaded():
+    with ThreadPoolExecutor(thread_name_prefix="offload") as executor:
+        policy = OffloadPolicy(executor, min_bytes=100)
+
+        small = await policy.run(parsing_thread, b"{}")
+        large = await policy.run(parsing_thread, b" " * 100)
+
+    assert small == threading.current_thread().name
+    assert large.startswith("offload")
+    assert policy.offloaded == 1
+
+
+@pytest.mark.asyncio
+async def test_process_pool_returns_only_extracted_aggregations():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        policy = OffloadPolicy(executor, min_bytes=1)
+        metrics = await policy.run(extract_aggregations, SEARCH_RESPONSE)
+
+    assert metrics == {"errors": 7, "latency": 1.5}
+
+
+@pytest.mark.asyncio
+async def test_http_datasource_parses_large_body_in_pool():
+    async def handler(request):
+        return web.json_response({"value": 42, "padding": "x" * 2048})
+
+    app = web.Application()
+    app.router.add_get("/metrics", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        datasource = HTTPDataSource(
+            "api", {"base_url": str(server.make_url("")).rstrip("/")}
+        )
+        with ThreadPoolExecutor() as executor:
+            datasource.offload = OffloadPolicy(executor, min_bytes=1024)
+            result = await datasource.fetch_data("/metrics")
+    finally:
+        await server.close()
+
+    assert result["value"] == 42
+    assert datasource.offload.offloaded == 1
+
+
+@pytest.mark.asyncio
+async def test_http_datasource_keeps_json_response_semantics():
+    async def empty(request):
+        return web.Response(body=b"", content_type="application/json")
+
+    async def html(request):
+        return web.Response(text="<html></html>", content_type="text/html")
+
+    async def vendor_json(request):
+        return web.Response(
+            text='{"value": 1}', content_type="application/vnd.api+json"
+        )
+
+    app = web.Application()
+    app.router.add_get("/empty", empty)
+    app.router.add_get("/html", html)
+    app.router.add_get("/vendor", vendor_json)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        datasource = HTTPDataSource(
+            "api", {"base_url": str(server.make_url("")).rstrip("/")}
+        )
+        assert await datasource.fetch_data("/empty") is None
+        assert await datasource.fetch_data("/vendor") == {"value": 1}
+        with pytest.raises(DataSourceException, match="unexpected mimetype"):
+            await datasource.fetch_data("/html")
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_elasticsearch_errors_report_decoded_reason():
+    async def handler(request):
+        error = {"type": "parsing_exception", "reason": "unknown query [mtch]"}
+        return web.json_response({"error": error, "status": 400}, status=400)
+
+    app = web.Application()
+    app.router.add_route("*", "/logs-*/_search", handler)
+    server = TestServer(app)
+    await server.start_server()
+    datasource = ElasticsearchDataSource(
+        "logs",
+        {"hosts": [str(server.make_url("/"))], "index_pattern": "logs-*"},
+    )
+    try:
+        with pytest.raises(DataSourceException) as exc_info:
+            await datasource.fetch_data('{"query": {"mtch": {}}}')
+    finally:
+        await datasource.close()
+        await server.close()
+
+    assert str(exc_info.value) == (
+        "Elasticsearch query failed: 400 parsing_exception: unknown query [mtch]"
+    )
+
+
+def test_default_executor_must_be_a_thread_pool():
+    with pytest.raises(ScannerException, match="must be a thread pool"):
+        Scanner({"global": {"executors": {"default": {"type": "process"}}}})
+
+
+def test_scanner_assigns_configured_executor():
+    scanner = Scanner(
+        {
+            "global": {"executors": {"parse": {"type": "thread", "max_workers": 2}}},
+            "datasources": {
+                "api": {
+                    "type": "http",
+                    "enabled": True,
+                    "base_url": "http://localhost",
+                    "offload": {"executor": "parse", "min_bytes": 4096},
+                },
+                "inline": {
+                    "type": "http",
+                    "enabled": True,
+                    "base_url": "http://localhost",
+                },
+            },
+        }
+    )
+
+    offload = scanner.datasources["api"].offload
+    assert offload.executor is scanner._executors["parse"]
+    assert offload.min_bytes == 4096
+    assert scanner.datasources["inline"].offload.executor is None
+    assert scanner._executor is scanner._executors["default"]
@@ -0,0 +1,55 @@
+import pytest
+
+from pysentinel.channels.synthetic import SyntheticChannel
+from pysentinel.cli.bench import bench_scanner
+from pysentinel.config.validator import validate_config
+from pysentinel.core.scanner import Scanner
+from pysentinel.datasources.synthetic import SyntheticDataSource
+from pysentinel.utils.exception import DataSourceException, ScannerException
+
+
+@pytest.mark.asyncio
+async def test_values_stay_in_configured_range():
+    datasource = SyntheticDataSource(
+        "synthetic", {"metrics": {"cpu": {"min": 10, "max": 20}}, "seed": 1}
+    )
+
+    for _ in range(100):
+        result = await datasource.fetch_data("q")
+        assert 10 <= result["cpu"] <= 20
+    assert datasource.fetch_count == 100
+
+
+@pytest.mark.asyncio
+async def test_error_rate_raises_datasource_exception():
+    datasource = SyntheticDataSource("synthetic", {"error_rate": 1.0})
+
+    with pytest.raises(DataSourceException):
+        await datasource.fetch_data("q")
+
+
+@pytest.mark.asyncio
+async def test_channel_counts_deliveries():
+    channel = SyntheticChannel("sink", {"error_rate": 0.5, "seed": 3})
+
+    results = [await channel.send_alert(None) for _ in range(200)]
+
+    assert channel.sent == results.count(True)
+    assert channel.failed == results.count(False)
+    assert 0 < channel.failed < 200
+
+
+def test_only_bench_scanners_create_synthetic_components():
+    config = {
+        "datasources": {"fake": {"type": "synthetic", "enabled": True}},
+        "alert_channels": {"sink": {"type": "synthetic"}},
+    }
+
+    scanner = Scanner(config)
+    assert scanner.datasources == {} and scanner.alert_channels == {}
+    with pytest.raises(ScannerException, match="only available to pysentinel bench"):
+        validate_config(config)
+
+    scanner = bench_scanner(config)
+    assert isinstance(scanner.datasources["fake"], SyntheticDataSource)
+    assert isinstance(scanner.alert_channels["sink"], SyntheticChannel)
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+from pysentinel.utils.history_db import HistoryDB
+
+
+def make_violation(second, alert="cpu", severity=Severity.WARNING, datasource="db"):
+    return Violation(
+        alert_name=alert,
+        metric_name="cpu_usage",
+        current_value=90 + second,
+        threshold_value=85,
+        operator="<=",
+        severity=severity,
+        message="CPU high",
+        timestamp=datetime(2024, 1, 1) + timedelta(seconds=second),
+        datasource_name=datasource,
+    )
+
+
+@pytest.fixture
+def history_db(tmp_path):
+    db = HistoryDB(db_path=str(tmp_path / "history.db"), poll_interval=0.05)
+    yield db
+    db.close()
+
+
+def test_wal_mode_enabled(history_db):
+    mode = history_db._read_conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_record_and_keyset_pagination(history_db):
+    for second in range(25):
+        history_db.record(make_violation(second))
+    history_db.flush()
+
+    seen = []
+    cursor = None
+    while True:
+        items, cursor = history_db.query(limit=10, cursor=cursor)
+        seen.extend(item["current_value"] for item in items)
+        if cursor is None:
+            break
+
+    assert seen == [90 + s for s in reversed(range(25))]
+    assert history_db.count() == 25
+
+
+def test_query_filters_by_time_range_alert_and_severity(history_db):
+    for second in range(10):
+        history_db.record(
+            make_violation(
+                second,
+                alert="cpu" if second % 2 else "mem",
+                severity=Severity.CRITICAL if second >= 8 else Severity.WARNING,
+            )
+        )
+    history_db.flush()
+
+    start = datetime(2024, 1, 1) + timedelta(seconds=2)
+    end = datetime(2024, 1, 1) + timedelta(seconds=6)
+    items, cursor = history_db.query(start=start, end=end, alert_name="cpu")
+    assert [item["timestamp"] for item in items] == [
+        (datetime(2024, 1, 1) + timedelta(seconds=s)).isoformat() for s in (5, 3)
+    ]
+    assert cursor is None
+
+    items, _ = history_db.query(severity="critical")
+    assert {item["alert_name"] for item in items} == {"cpu", "mem"}
+    assert len(items) == 2
+
+
+def test_query_filters_by_datasource_using_index(history_db):
+    for second in range(6):
+        history_db.record(make_violation(second, datasource=f"db{second % 3}"))
+    history_db.flush()
+
+    items, _ = history_db.query(datasource_name="db1")
+    plan = history_db._read_conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM violation_history "
+        "WHERE datasource_name = ? ORDER BY timestamp DESC, id DESC",
+        ("db1",),
+    ).fetchall()
+
+    assert [item["current_value"] for item in items] == [94, 91]
+    assert "idx_violation_history_datasource" in str(plan)
+
+
+def test_history_survives_reopen(tmp_path):
+    path = str(tmp_path / "history.db")
+    db = HistoryDB(db_path=path)
+    db.record(make_violation(1))
+    db.close()
+
+    reopened = HistoryDB(db_path=path)
+    try:
+        items, _ = reopened.query()
+        assert items[0]["violation_id"] == make_violation(1).violation_id
+    finally:
+        reopened.close()
@@ -0,0 +1,123 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+
+from pysentinel.utils.http_client import (
+    HTTPClient,
+    TokenBucket,
+    get_http_client,
+    close_http_client,
+    parse_retry_after,
+)
+
+
+@asynccontextmanager
+async def running_app(handler):
+    app = web.Application()
+    app.router.add_route("*", "/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}/"
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honored():
+    calls = []
+
+    async def handler(request):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return web.Response(status=429, headers={"Retry-After": "0.2"})
+        return web.Response(text="ok")
+
+    client = HTTPClient(backoff_base=0)
+    async with running_app(handler) as url:
+        response = await client.request("POST", url, json={"a": 1})
+        await client.close()
+
+    assert response.status == 200
+    assert response.body == b"ok"
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_attempts_and_returns_last_response():
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        return web.Response(status=503)
+
+    client = HTTPClient(backoff_base=0.001)
+    async with running_app(handler) as url:
+        response = await client.request("GET", url, attempts=3)
+        await client.close()
+
+    assert response.status == 503
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        return web.Response(status=400)
+
+    client = HTTPClient()
+    async with running_app(handler) as url:
+        response = await client.request("GET", url, attempts=3)
+        await client.close()
+
+    assert response.status == 400
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_client_reuses_connections():
+    peers = set()
+
+    async def handler(request):
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.Response(text="ok")
+
+    async with running_app(handler) as url:
+        client = get_http_client()
+        assert get_http_client() is client
+        for _ in range(5):
+            await client.request("GET", url)
+        await close_http_client()
+
+    assert len(peers) == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=20, burst=2)
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    # 2 immediate, then 4 more at 20/s
+    assert time.monotonic() - start >= 0.18
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert TokenBucket.from_config(None) is None
+    assert TokenBucket.from_config({"rate": 1}).capacity == 1
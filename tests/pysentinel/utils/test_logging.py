@@ -0,0 +1,77 @@
+import io
+import json
+import logging
+import sys
+
+from pysentinel.utils.logging import (
+    JSONFormatter,
+    RateLimitFilter,
+    setup_logging,
+    stop_logging,
+)
+
+
+def make_record(message, level=logging.ERROR, **extra):
+    record = logging.LogRecord(
+        "pysentinel.test", level, __file__, 1, message, None, None
+    )
+    for name, value in extra.items():
+        setattr(record, name, value)
+    return record
+
+
+def test_rate_limit_per_datasource_reports_suppressed_count():
+    now = [0.0]
+    limiter = RateLimitFilter(interval=10, burst=2, clock=lambda: now[0])
+
+    passed = [
+        limiter.filter(make_record(f"fetch failed {i}", datasource="prom"))
+        for i in range(5)
+    ]
+    other = limiter.filter(make_record("fetch failed", datasource="redis"))
+    info = limiter.filter(make_record("tick", level=logging.INFO, datasource="prom"))
+
+    now[0] = 10
+    resumed = make_record("fetch failed again", datasource="prom")
+
+    assert passed == [True, True, False, False, False]
+    assert other and info
+    assert limiter.filter(resumed)
+    assert resumed.suppressed == 3
+    assert limiter.suppressed_total == 3
+
+
+def test_json_formatter_includes_extras_and_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord(
+            "pysentinel.test", logging.ERROR, __file__, 1, "failed %s", ("x",), None
+        )
+        record.exc_info = sys.exc_info()
+    record.datasource = "prom"
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["message"] == "failed x"
+    assert entry["level"] == "ERROR"
+    assert entry["datasource"] == "prom"
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_pipeline_writes_json_from_listener_thread():
+    stream = io.StringIO()
+    logger = logging.getLogger("pysentinel.test")
+    pipeline = setup_logging(stream=stream, rate_limit_burst=1)
+    try:
+        for _ in range(3):
+            logger.error("datasource down", extra={"datasource": "prom"})
+        logger.debug("hidden")
+        stats = pipeline.get_stats()
+    finally:
+        stop_logging()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["datasource down"]
+    assert stats["suppressed"] == 2
+    assert logging.getLogger("pysentinel").propagate
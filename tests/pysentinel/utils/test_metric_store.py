@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pysentinel.utils.metric_store import MetricStore
+
+
+def test_append_and_read_range_is_zero_copy(tmp_path):
+    store = MetricStore(path=str(tmp_path), segment_size=100, retention_hours=None)
+    for i in range(10):
+        store.append("db", "cpu", float(i), timestamp=1000.0 + i)
+
+    timestamps, values = store.read("db", "cpu", since=1003.0, until=1006.0)
+
+    assert timestamps.tolist() == [1003.0, 1004.0, 1005.0, 1006.0]
+    assert values.tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert not values.flags.owndata
+    assert not values.flags.writeable
+
+
+def test_segments_rotate_and_are_bounded(tmp_path):
+    store = MetricStore(
+        path=str(tmp_path), segment_size=4, retention_hours=None, max_segments=2
+    )
+    for i in range(11):
+        store.append("db", "cpu", float(i), timestamp=1000.0 + i)
+
+    timestamps, values = store.read("db", "cpu")
+    assert values.tolist() == [4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+    series_dir = os.path.join(str(tmp_path), "db", "cpu")
+    assert len([f for f in os.listdir(series_dir) if f.endswith(".ts")]) == 2
+
+
+def test_history_is_recovered_after_reopen(tmp_path):
+    store = MetricStore(path=str(tmp_path), segment_size=8, retention_hours=None)
+    for i in range(5):
+        store.append("db", "cpu", float(i), timestamp=1000.0 + i)
+    store.close()
+
+    reopened = MetricStore(path=str(tmp_path), segment_size=8, retention_hours=None)
+    reopened.append("db", "cpu", 5.0, timestamp=1005.0)
+    _, values = reopened.read("db", "cpu")
+    assert values.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_read_unknown_metric_returns_empty_arrays(tmp_path):
+    store = MetricStore(path=str(tmp_path))
+    timestamps, values = store.read("db", "missing")
+    assert len(timestamps) == 0 and len(values) == 0
+    assert not store.has_series("db", "missing")
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc")
+def test_open_files_are_bounded_by_open_series(tmp_path):
+    store = MetricStore(
+        path=str(tmp_path), segment_size=4, retention_hours=None, max_open_series=3
+    )
+    before = len(os.listdir("/proc/self/fd"))
+    for i in range(10):
+        for metric in range(50):
+            store.append("db", f"m{metric}", float(i), timestamp=1000.0 + i)
+
+    # Two maps for the newest segment of each of the three open series
+    assert len(os.listdir("/proc/self/fd")) - before <= 6
+    assert len(store.metrics()) == 3
+    _, values = store.read("db", "m0")
+    assert values.tolist() == [float(i) for i in range(10)]
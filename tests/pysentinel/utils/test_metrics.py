@@ -0,0 +1,126 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from pysentinel.core.scanner import Scanner
+from pysentinel.core.threshold import AlertDefinition
+from pysentinel.utils.constants import Severity
+from pysentinel.utils.metrics import (
+    CONTENT_TYPE,
+    MetricsRegistry,
+    MetricsServer,
+    _Metric,
+)
+
+
+def test_counter_and_gauge_render():
+    registry = MetricsRegistry()
+    sends = registry.counter("sends", "Sends", ["channel"])
+    sends.labels("slack").inc()
+    sends.labels("slack").inc(2)
+    sends.labels('we"ird').inc()
+    registry.gauge("depth", "Queue depth").set_function(lambda: 7)
+
+    text = registry.render()
+
+    assert "# TYPE sends counter" in text
+    assert 'sends_total{channel="slack"} 3' in text
+    assert 'sends_total{channel="we\\"ird"} 1' in text
+    assert "depth 7" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_metric_family_must_implement_children_and_samples():
+    class Partial(_Metric):
+        def _new_child(self):
+            return object()
+
+    with pytest.raises(TypeError):
+        Partial("partial", "Missing _samples")
+
+
+def test_non_finite_gauge_values_use_openmetrics_spelling():
+    registry = MetricsRegistry()
+    values = registry.gauge("value", "Value", ["kind"])
+    values.labels("nan").set(float("nan"))
+    values.labels("inf").set(float("inf"))
+    values.labels("-inf").set(float("-inf"))
+
+    text = registry.render()
+
+    assert 'value{kind="nan"} NaN' in text
+    assert 'value{kind="inf"} +Inf' in text
+    assert 'value{kind="-inf"} -Inf' in text
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    text = registry.render()
+
+    assert 'latency_seconds_bucket{le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "latency_seconds_count 4" in text
+    assert "latency_seconds_sum 3.65" in text
+
+
+def test_registry_returns_existing_metric():
+    registry = MetricsRegistry()
+    first = registry.counter("errors", "Errors")
+
+    assert registry.counter("errors", "Errors") is first
+    with pytest.raises(ValueError):
+        registry.gauge("errors", "Errors")
+    with pytest.raises(ValueError):
+        registry.counter("by_source", "x", ["datasource"]).labels("a", "b")
+
+
+@pytest.mark.asyncio
+async def test_metrics_server_serves_openmetrics():
+    registry = MetricsRegistry()
+    registry.counter("ticks", "Ticks").inc()
+    server = MetricsServer(registry, port=0)
+    await server.start()
+    try:
+        async with aiohttp.ClientSession() as session:
+            url = f"http://127.0.0.1:{server.port}/metrics"
+            async with session.get(url) as response:
+                body = await response.text()
+                content_type = response.headers["Content-Type"]
+    finally:
+        await server.stop()
+
+    assert content_type == CONTENT_TYPE
+    assert "ticks_total 1" in body
+
+
+@pytest.mark.asyncio
+async def test_scanner_records_fetch_latency_and_errors():
+    scanner = Scanner()
+    datasource = MagicMock(enabled=True, error_count=0, max_errors=1)
+    datasource.fetch_data = AsyncMock(side_effect=[{"cpu": 10}, Exception("down")])
+    scanner.datasources = {"db": datasource}
+    alert = AlertDefinition(
+        name="cpu",
+        metrics="cpu",
+        query="q",
+        datasource="db",
+        threshold={"max": 90},
+        severity=Severity.WARNING,
+        interval=60,
+        alert_channels=[],
+        description="",
+    )
+
+    await scanner._check_alerts_for_datasource("db", [alert, alert])
+
+    text = scanner.metrics.render()
+    assert 'pysentinel_datasource_fetch_seconds_count{datasource="db"} 1' in text
+    assert 'pysentinel_datasource_errors_total{datasource="db"} 1' in text
+    assert 'pysentinel_datasource_circuit_open_total{datasource="db"} 1' in text
+    assert scanner._latest_metrics["db"].collection_time_ms >= 0
@@ -0,0 +1,165 @@
+import sqlite3
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from pysentinel.core.scanner import Scanner
+from pysentinel.core.threshold import Violation
+from pysentinel.utils.constants import Severity
+from pysentinel.utils.history_db import HistoryDB
+from pysentinel.utils.outbox import NotificationOutbox
+
+
+def make_violation(alert="cpu"):
+    return Violation(
+        alert_name=alert,
+        metric_name="cpu_usage",
+        current_value=95,
+        threshold_value=85,
+        operator="<=",
+        severity=Severity.CRITICAL,
+        message="CPU high",
+        timestamp=datetime(2024, 1, 1, 12, 0, 0),
+        datasource_name="db",
+        alert_group="system",
+    )
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    box = NotificationOutbox(db_path=str(tmp_path / "outbox.db"), max_attempts=2)
+    yield box
+    box.close()
+
+
+def test_enqueue_is_idempotent(outbox):
+    violation = make_violation()
+    outbox.enqueue(violation, ["slack", "email"])
+    outbox.enqueue(violation, ["slack"])
+
+    pending = outbox.pending()
+
+    assert sorted(channel for _, channel in pending) == ["email", "slack"]
+    assert outbox.counts()["pending"] == 2
+
+
+def test_pending_payload_round_trips_violation(outbox):
+    violation = make_violation()
+    outbox.enqueue(violation, ["slack"])
+
+    payload, channel = outbox.pending()[0]
+
+    assert channel == "slack"
+    assert Violation.from_dict(payload) == violation
+
+
+def test_delivered_and_failed_transitions(outbox):
+    violation = make_violation()
+    outbox.enqueue(violation, ["slack", "email"])
+    outbox.mark_delivered(violation.violation_id, "slack")
+    outbox.mark_failed(violation.violation_id, "email", "boom")
+    outbox.flush()
+
+    assert outbox.counts() == {"pending": 1, "delivered": 1, "failed": 0}
+
+    outbox.mark_failed(violation.violation_id, "email", "boom")
+    outbox.flush()
+
+    assert outbox.counts() == {"pending": 0, "delivered": 1, "failed": 1}
+    assert outbox.pending() == []
+
+
+def test_pending_survives_reopen(tmp_path):
+    path = str(tmp_path / "outbox.db")
+    box = NotificationOutbox(db_path=path)
+    box.enqueue(make_violation(), ["webhook"])
+    box.close()
+
+    reopened = NotificationOutbox(db_path=path)
+    try:
+        pending = reopened.pending()
+    finally:
+        reopened.close()
+
+    assert [channel for _, channel in pending] == ["webhook"]
+    assert pending[0][0]["alert_name"] == "cpu"
+
+
+def test_rows_commit_in_the_same_transaction_as_history(tmp_path):
+    path = str(tmp_path / "history.db")
+    history = HistoryDB(db_path=path, poll_interval=0.01)
+    box = NotificationOutbox(db_path=path, writer=history.writer)
+    try:
+        violation = make_violation()
+        assert box.enqueue(
+            violation, ["slack"], [HistoryDB.insert_statement(violation)]
+        )
+        box.flush()
+        assert history.count() == 1
+        assert box.counts()["pending"] == 1
+
+        # A failing outbox insert rolls back the history row queued with it
+        conn = sqlite3.connect(path)
+        conn.execute("DROP TABLE notification_outbox")
+        conn.commit()
+        conn.close()
+        other = make_violation("mem")
+        box.enqueue(other, ["slack"], [HistoryDB.insert_statement(other)])
+        box.flush()
+        assert history.count() == 1
+    finally:
+        box.close()
+        history.close()
+
+
+def _alert_config(tmp_path):
+    return {
+        "global": {
+            "history_db": {"enabled": True, "path": str(tmp_path / "history.db")},
+            "outbox": {"enabled": True},
+        },
+        "alert_channels": {"hook": {"type": "webhook", "url": "http://hook"}},
+        "alert_groups": {
+            "g": {
+                "alerts": [
+                    {
+                        "name": "cpu",
+                        "metrics": "cpu",
+                        "query": "q",
+                        "datasource": "db",
+                        "threshold": {"max": 90},
+                        "severity": "critical",
+                        "interval": 60,
+                        "alert_channels": ["hook"],
+                        "description": "CPU high",
+                    }
+                ]
+            }
+        },
+    }
+
+
+def test_scanner_keeps_outbox_in_the_history_database(tmp_path):
+    scanner = Scanner(_alert_config(tmp_path))
+    try:
+        assert scanner._outbox.db_path == scanner._history_db.db_path
+        scanner._persist_violation(make_violation(), ["hook"])
+        scanner._outbox.flush()
+        assert scanner._history_db.count() == 1
+        assert scanner._outbox.counts()["pending"] == 1
+    finally:
+        scanner._outbox.close()
+        scanner._history_db.close()
+
+
+def test_scanner_counts_violations_the_outbox_could_not_queue(tmp_path, caplog):
+    scanner = Scanner(_alert_config(tmp_path))
+    try:
+        with patch.object(scanner._outbox, "enqueue", return_value=False):
+            scanner._persist_violation(make_violation(), ["hook"])
+        assert "pysentinel_outbox_dropped_total 1" in scanner.metrics.render()
+        assert "is not durable" in caplog.text
+    finally:
+        scanner._outbox.close()
+        scanner._history_db.close()
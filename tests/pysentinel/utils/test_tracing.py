@@ -0,0 +1,112 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pysentinel.core.scanner import Scanner
+from pysentinel.core.threshold import AlertDefinition
+from pysentinel.utils import tracing
+from pysentinel.utils.constants import Severity
+
+
+class ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+    def close(self):
+        pass
+
+
+def test_unsampled_trace_is_noop():
+    exporter = ListExporter()
+    tracer = tracing.Tracer(sample_rate=0.5, exporter=exporter, sampler=lambda: 0.9)
+
+    with tracer.start_trace("tick") as root:
+        with tracing.span("fetch") as child:
+            child.set_attribute("rows", 3)
+
+    assert root is tracing.NOOP_SPAN and child is tracing.NOOP_SPAN
+    assert exporter.spans == []
+    assert tracing.Tracer(sample_rate=1.0).start_trace("tick") is tracing.NOOP_SPAN
+
+
+def test_chrome_trace_file(tmp_path):
+    path = str(tmp_path / "trace.json")
+    tracer = tracing.Tracer(1.0, tracing.ChromeTraceExporter(path))
+
+    with tracer.start_trace("tick"):
+        with tracing.span("fetch", datasource="db"):
+            pass
+        with pytest.raises(ValueError):
+            with tracing.span("evaluate"):
+                raise ValueError("bad value")
+    tracer.close()
+
+    with open(path) as f:
+        events = {event["name"]: event for event in json.load(f)}
+    assert set(events) == {"tick", "fetch", "evaluate"}
+    assert all(event["ph"] == "X" for event in events.values())
+    assert events["fetch"]["args"]["datasource"] == "db"
+    assert events["evaluate"]["args"]["error"] == "bad value"
+
+
+def test_otlp_json_links_parents(tmp_path):
+    path = str(tmp_path / "trace.otlp.json")
+    tracer = tracing.Tracer.from_config(
+        {"enabled": True, "sample_rate": 1.0, "format": "otlp", "path": path}
+    )
+
+    with tracer.start_trace("tick") as root:
+        with tracing.span("fetch", rows=3):
+            pass
+    tracer.close()
+
+    with open(path) as f:
+        document = json.loads(f.readline())
+    spans = document["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    fetch = next(item for item in spans if item["name"] == "fetch")
+    assert fetch["traceId"] == root.trace_id
+    assert fetch["parentSpanId"] == root.span_id
+    assert fetch["attributes"] == [{"key": "rows", "value": {"intValue": "3"}}]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_phases_share_one_trace():
+    scanner = Scanner()
+    exporter = ListExporter()
+    scanner._tracer = tracing.Tracer(sample_rate=1.0, exporter=exporter)
+    datasource = MagicMock(enabled=True, error_count=0, max_errors=5)
+    datasource.fetch_data = AsyncMock(return_value={"cpu": 95})
+    channel = MagicMock()
+    channel.send_alert = AsyncMock(return_value=True)
+    scanner.datasources = {"db": datasource}
+    scanner.alert_channels = {"ops": channel}
+    scanner.alert_definitions = [
+        AlertDefinition(
+            name="cpu",
+            metrics="cpu",
+            query="q",
+            datasource="db",
+            threshold={"max": 90},
+            severity=Severity.WARNING,
+            interval=0,
+            alert_channels=["ops"],
+            description="",
+        )
+    ]
+    await scanner._dispatcher.start()
+    try:
+        await scanner.scan_once_async()
+        await asyncio.wait_for(scanner._dispatcher._queue.join(), 1)
+    finally:
+        await scanner._dispatcher.stop()
+    scanner._tracer.flush()
+
+    names = {item.name for item in exporter.spans}
+    assert {"scan_tick", "schedule", "fetch", "extract", "evaluate"} <= names
+    assert {"notify", "send"} <= names
+    assert len({item.trace_id for item in exporter.spans}) == 1